@@ -0,0 +1,59 @@
+"""Compares fetching a large result set as models with fetching it as a columnar ModelBatch.
+
+Run with `python benchmarks/batches.py`. Rows are loaded into an in-memory SQLite database, then fetched both ways.
+The live bytes held by each result and the time taken to fetch it are reported per row.
+"""
+
+import asyncio
+import gc
+import tracemalloc
+from time import perf_counter
+
+from wordlette.dbom.driver_sqlite import SQLiteDriver, SQLiteConfig
+from wordlette.dbom.models import DatabaseModel
+from wordlette.dbom.properties import Property
+
+ROWS = 100_000
+
+
+class Report(DatabaseModel):
+    id: int @ Property()
+    author: str @ Property()
+    views: int @ Property()
+    score: float @ Property()
+
+
+async def create_driver() -> SQLiteDriver:
+    driver = SQLiteDriver()
+    await driver.connect(SQLiteConfig(filename=":memory:"))
+    await driver.sync_schema({Report})
+    await driver.add(
+        *(Report(i, f"author-{i % 50}", i * 3, i / 7) for i in range(ROWS))
+    )
+    return driver
+
+
+async def measure(fetch) -> tuple[int, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = perf_counter()
+    result = (await fetch(Report)).value
+    seconds = perf_counter() - start
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size for stat in snapshot.statistics("filename"))
+    del result
+    return size, seconds
+
+
+async def main():
+    driver = await create_driver()
+    for name, fetch in (("models", driver.fetch), ("batch", driver.fetch_batch)):
+        await measure(fetch)  # Warm any caches
+        size, seconds = await measure(fetch)
+        print(f"Live bytes per row ({name}): {size / ROWS:.0f}")
+        print(f"Fetch time per row ({name}): {seconds / ROWS * 1_000_000:.2f}µs")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
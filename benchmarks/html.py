@@ -0,0 +1,66 @@
+"""Measures the time taken to render html element trees.
+
+Run with `python benchmarks/html.py`. A page of form inputs is rendered the first time, rendered again unchanged, and
+rendered after changing a single input. The time per element is reported so rendering can be compared before and
+after a change.
+"""
+
+from timeit import repeat
+
+from wordlette.core.html.elements import Div, Input, Label
+
+ELEMENTS = 500
+
+
+def build_page() -> Div:
+    return Div(
+        *(
+            Div(
+                Label(f"Field {i}", for_=f"field-{i}"),
+                Input(
+                    type="text",
+                    id=f"field-{i}",
+                    name=f"field-{i}",
+                    placeholder="Enter a value",
+                    required=i % 2 == 0,
+                    class_="input wide",
+                ),
+                class_="row",
+            )
+            for i in range(ELEMENTS)
+        ),
+        class_="page",
+    )
+
+
+def time_per_element(func, setup=lambda: None) -> float:
+    timings = []
+    for _ in range(5):
+        setup()
+        timings.append(min(repeat(func, number=1, repeat=1)))
+
+    return min(timings) / ELEMENTS * 1_000_000
+
+
+def main():
+    page = build_page()
+    page.render()  # Warm any caches
+
+    def build():
+        nonlocal page
+        page = build_page()
+
+    def change():
+        page.body[0].body[1].attrs = {"name": "changed"}
+
+    print(
+        f"First render per element:  {time_per_element(lambda: page.render(), build):.3f}µs"
+    )
+    print(f"Cached render per element: {time_per_element(lambda: page.render()):.3f}µs")
+    print(
+        f"Render after a change:     {time_per_element(lambda: page.render(), change):.3f}µs"
+    )
+
+
+if __name__ == "__main__":
+    main()
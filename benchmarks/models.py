@@ -0,0 +1,101 @@
+"""Measures the memory held by model instances built from a large fetch.
+
+Run with `python benchmarks/models.py`. Rows are turned into models the same way the SQLite driver builds them, and
+the live bytes per instance are reported so the storage layout can be compared before and after a change.
+"""
+
+import gc
+import json
+import tracemalloc
+from datetime import datetime
+from timeit import repeat
+
+from wordlette.dbom.models import DatabaseModel
+from wordlette.dbom.properties import Property
+
+ROWS = 100_000
+
+
+class Post(DatabaseModel):
+    id: int @ Property()
+    author: str @ Property()
+    views: int @ Property()
+    title: str @ Property()
+    published: datetime @ Property()
+
+
+def build_rows() -> list[tuple]:
+    published = datetime(2023, 8, 1)
+    return [(i, "zech", i * 3, "hello", published) for i in range(ROWS)]
+
+
+def build_models(rows: list[tuple]) -> list[Post]:
+    return [Post(*row) for row in rows]
+
+
+def measure_allocations(rows: list[tuple]) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    models = build_models(rows)
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = snapshot.statistics("filename")
+    blocks = sum(stat.count for stat in stats)
+    size = sum(stat.size for stat in stats)
+    del models
+    return blocks, size
+
+
+def time_per_model(func) -> float:
+    return min(repeat(func, number=1, repeat=5)) / ROWS * 1_000_000
+
+
+def dumps_stdlib_json(models: list[Post]) -> bytes:
+    return json.dumps([model.to_dict() for model in models], default=str).encode()
+
+
+def rebuild_models(models: list[Post]) -> list[Post]:
+    return [Post(**(model.to_dict() | {"views": 1})) for model in models]
+
+
+def main():
+    rows = build_rows()
+    build_models(rows[:10])  # Warm any caches
+    blocks, size = measure_allocations(rows)
+    seconds = time_per_model(lambda: build_models(rows))
+    models = build_models(rows)
+    json_data = Post.dumps_many_json(models)
+    binary_data = Post.dumps_many_binary(models)
+    print(f"Live blocks per model: {blocks / ROWS:.1f}")
+    print(f"Live bytes per model:  {size / ROWS:.0f}")
+    print(f"Time per model:        {seconds:.2f}µs")
+    print(
+        f"Time per to_dict:      {time_per_model(lambda: [m.to_dict() for m in models]):.2f}µs"
+    )
+    print(
+        f"Time per stdlib JSON:  {time_per_model(lambda: dumps_stdlib_json(models)):.2f}µs"
+    )
+    print(
+        f"Time per dumps_json:   {time_per_model(lambda: Post.dumps_many_json(models)):.2f}µs"
+    )
+    print(
+        f"Time per loads_json:   {time_per_model(lambda: Post.loads_many_json(json_data)):.2f}µs"
+    )
+    print(
+        f"Time per dumps_binary: {time_per_model(lambda: Post.dumps_many_binary(models)):.2f}µs"
+    )
+    print(
+        f"Time per loads_binary: {time_per_model(lambda: Post.loads_many_binary(binary_data)):.2f}µs"
+    )
+    print(
+        f"Time per rebuild:      {time_per_model(lambda: rebuild_models(models)):.2f}µs"
+    )
+    print(
+        f"Time per evolve:       {time_per_model(lambda: [m.evolve(views=1) for m in models]):.2f}µs"
+    )
+    print(f"JSON bytes per model:   {len(json_data) / ROWS:.0f}")
+    print(f"Binary bytes per model: {len(binary_data) / ROWS:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Measures the cost of building query ASTs from model attributes.
+
+Run with `python benchmarks/query_ast.py`. It reports the memory blocks that are still allocated after building the
+queries and the time taken per query.
+"""
+
+import gc
+import tracemalloc
+from timeit import timeit
+
+from wordlette.dbom.models import DatabaseModel
+from wordlette.dbom.properties import Property
+from wordlette.dbom.query_ast import when
+
+QUERIES = 10_000
+
+
+class Post(DatabaseModel):
+    id: int @ Property()
+    author: str @ Property()
+    views: int @ Property()
+    title: str @ Property()
+
+
+def build_query():
+    return (
+        when(Post.author == "zech", 10 < Post.views < 1000)
+        .Or(Post.title == "hello")
+        .sort(Post.views.desc, Post.id)
+    )
+
+
+def measure_allocations() -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    queries = [build_query() for _ in range(QUERIES)]
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = snapshot.statistics("filename")
+    blocks = sum(stat.count for stat in stats)
+    size = sum(stat.size for stat in stats)
+    del queries
+    return blocks, size
+
+
+def main():
+    build_query()  # Warm any caches
+    blocks, size = measure_allocations()
+    seconds = timeit(build_query, number=QUERIES)
+    print(f"Live blocks per query: {blocks / QUERIES:.1f}")
+    print(f"Live bytes per query:  {size / QUERIES:.0f}")
+    print(f"Time per query:        {seconds / QUERIES * 1_000_000:.2f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,41 @@
+import asyncio
+import sqlite3
+from array import array
 from datetime import datetime
+from time import monotonic
 from typing import Type
 
 import pytest
 import pytest_asyncio
 from bevy import get_repository, Repository
-from wordlette.core.databases.driver_sqlite import SQLiteDriver, SQLiteConfig
-from wordlette.core.databases.models import DatabaseModel
-from wordlette.core.databases.properties import Property
-from wordlette.core.databases.query_ast import (
+from starlette.datastructures import FormData
+from wordlette.dbom.backups import backup_database
+from wordlette.dbom.batches import ModelBatch
+from wordlette.dbom.driver_sqlite import SQLiteDriver, SQLiteConfig, SQLiteSettingsForm
+from wordlette.dbom.models import DatabaseModel
+from wordlette.dbom.properties import Property
+from wordlette.dbom.query_ast import (
     ASTComparisonNode,
     ASTGroupNode,
     ASTLiteralNode,
     ASTReferenceNode,
     ASTLogicalOperatorNode,
     ASTOperatorNode,
+    ResultOrdering,
     when,
 )
-from wordlette.core.databases.statuses import DatabaseSuccessStatus, DatabaseStatus
+from wordlette.dbom.statuses import DatabaseSuccessStatus, DatabaseStatus
+from wordlette.dbom.events import (
+    DatabaseEvents,
+    RowChangeEvent,
+    RowDeletedEvent,
+    RowInsertedEvent,
+    RowUpdatedEvent,
+)
+from wordlette.dbom.json_values import LazyJSON
+from wordlette.dbom.maintenance import MaintenanceScheduler
+from wordlette.dbom.metrics import DatabaseMetrics
+from wordlette.dbom.query_logs import QueryLog
 
 from wordlette.core.configs import ConfigManager
 from wordlette.dbom.drivers import DatabaseDriver
@@ -73,15 +92,22 @@ class DummyConfigManager(ConfigManager):
 
 @pytest.fixture(scope="function", autouse=True)
 def reset_bevy_repository():
+    previous = get_repository()
     repo = Repository.factory()
     repo.add_providers(AtProvider())
     repo.set(ConfigManager, DummyConfigManager())
     Repository.set_repository(repo)
+    yield
+    Repository.set_repository(previous)
 
 
 @pytest.fixture(scope="function", autouse=True)
 def reset_database_models():
+    models = set(DatabaseModel.__models__)
+    DatabaseModel.__models__.clear()
+    yield
     DatabaseModel.__models__.clear()
+    DatabaseModel.__models__.update(models)
 
 
 class TestModel(DatabaseModel):
@@ -101,7 +127,7 @@ async def sqlite_driver():
 
 @pytest.mark.asyncio
 async def test_connect():
-    from wordlette.core.databases.controllers import DatabaseController
+    from wordlette.dbom.controllers import DatabaseController
 
     controller = DatabaseController()
     assert not controller.connected
@@ -284,6 +310,29 @@ async def test_sqlite_driver_auto_fields():
     assert result.value[0].id == a.id
 
 
+@pytest.mark.asyncio
+async def test_sqlite_driver_provides_auto_value_factories():
+    class TestModel(DatabaseModel):
+        id: int | Auto @ Property
+        value: str @ Property
+
+    driver = SQLiteDriver()
+    assert await driver.connect(SQLiteConfig(filename=":memory:"))
+    model = TestModel(value="test")
+    assert isinstance(model.id, Auto)
+    assert not model.__validation_errors__
+
+    assert await driver.sync_schema({TestModel})
+
+    class ChildModel(TestModel):
+        name: str | None @ Property
+
+    assert isinstance(ChildModel(value="test").id, Auto)
+
+    assert await driver.disconnect()
+    assert isinstance(TestModel(value="test").id, int)
+
+
 @pytest.mark.asyncio
 async def test_sqlite_select_all(sqlite_driver: SQLiteDriver):
     await sqlite_driver.add(
@@ -383,3 +432,655 @@ async def test_model_query_methods(sqlite_driver: SQLiteDriver):
 
     result = await TestModel.fetch(TestModel.id > 2, string="foobar")
     assert len(result.value) == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_query_log(sqlite_driver: SQLiteDriver):
+    await sqlite_driver.add(TestModel(id=1, string="logged"))
+    await sqlite_driver.fetch(when(TestModel.string == "logged"))
+
+    entries = sqlite_driver.query_log.slowest()
+    assert sqlite_driver.query_log.statements >= 3
+    assert entries == sorted(entries, key=lambda entry: entry.duration, reverse=True)
+
+    select = next(entry for entry in entries if entry.sql.startswith("SELECT *"))
+    assert select.parameter_types == ("str",)
+    assert "logged" not in repr(select)
+
+
+def test_query_log_keeps_slowest():
+    query_log = QueryLog(max_entries=2)
+    for duration in (0.3, 0.1, 0.5, 0.2):
+        query_log.record(f"SELECT {duration};", (), duration)
+
+    assert [entry.duration for entry in query_log.slowest()] == [0.5, 0.3]
+    assert query_log.statements == 4
+
+
+@pytest.mark.asyncio
+async def test_sqlite_explain_flags_scans():
+    driver = SQLiteDriver()
+    assert await driver.connect(SQLiteConfig(filename=":memory:", explain_threshold=0))
+    assert await driver.sync_schema({TestModel})
+    await driver.fetch(when(TestModel.string == "scan"))
+    await driver.fetch(when(TestModel.id == 1))
+
+    scans = driver.query_log.full_scans()
+    assert len(scans) == 1
+    assert "string" in scans[0].sql
+
+
+@pytest.mark.asyncio
+async def test_sqlite_operation_metrics(sqlite_driver: SQLiteDriver):
+    sqlite_driver.metrics = DatabaseMetrics()
+    await sqlite_driver.add(TestModel(id=1, string="metrics"))
+    await sqlite_driver.fetch(when(TestModel.string == "metrics"))
+    await sqlite_driver.fetch(TestModel)
+    await sqlite_driver.count(when(TestModel.id > 0))
+    await sqlite_driver.add(TestModel(id=1, string="duplicate"))
+
+    assert sqlite_driver.metrics.get("add", "TestModel").count == 1
+    assert sqlite_driver.metrics.get("fetch", "TestModel").count == 2
+    assert sqlite_driver.metrics.get("count", "TestModel").count == 1
+    assert sqlite_driver.metrics.get("add", "TestModel", "exception").count == 1
+
+    exported = sqlite_driver.metrics.to_prometheus()
+    assert (
+        'operation="fetch",model="TestModel",outcome="success",le="+Inf"} 2' in exported
+    )
+
+
+@pytest.mark.asyncio
+async def test_sqlite_metrics_record_outermost_operation(sqlite_driver: SQLiteDriver):
+    assert sqlite_driver.metrics is not SQLiteDriver().metrics
+
+    sqlite_driver.metrics = DatabaseMetrics()
+    await sqlite_driver.add(TestModel(id=1, string="metrics"))
+    # The base class fallbacks are built on fetch, which shouldn't be recorded again
+    await DatabaseDriver.get_many(sqlite_driver, TestModel, [1, 2])
+    await DatabaseDriver.fetch_batch(sqlite_driver, TestModel)
+    query = TestModel.prepare(lambda p: TestModel.id == p.id)
+    await DatabaseDriver.fetch_prepared(sqlite_driver, query, {"id": 1})
+
+    assert sqlite_driver.metrics.get("get_many", "TestModel").count == 1
+    assert sqlite_driver.metrics.get("fetch_batch", "TestModel").count == 1
+    assert sqlite_driver.metrics.get("fetch_prepared", "TestModel").count == 1
+    assert sqlite_driver.metrics.get("fetch", "TestModel") is None
+
+
+def test_drivers_are_instrumented():
+    for driver in DatabaseDriver.__drivers__.values():
+        for operation in driver.instrumented_operations:
+            assert getattr(driver, operation).__instrumented__
+
+
+def test_reference_comparisons_are_independent():
+    class TestModel(DatabaseModel):
+        field: int @ Property()
+
+    first = when(5 < TestModel.field < 10)
+    second = when(TestModel.field == 1)
+    assert len(first.items) == 3
+    assert second == ASTGroupNode(
+        [
+            ASTComparisonNode(
+                ASTReferenceNode(TestModel.__fields__["field"], TestModel),
+                ASTLiteralNode(1),
+                ASTOperatorNode.EQUALS,
+            )
+        ]
+    )
+
+
+def test_truth_testing_comparisons_does_not_change_queries():
+    class TestModel(DatabaseModel):
+        field: int @ Property()
+
+    def comparison(value, operator=ASTOperatorNode.EQUALS):
+        return ASTGroupNode(
+            [
+                ASTComparisonNode(
+                    ASTReferenceNode(TestModel.__fields__["field"], TestModel),
+                    ASTLiteralNode(value),
+                    operator,
+                )
+            ]
+        )
+
+    first = TestModel.field == 5
+    assert first
+    second = TestModel.field == 6
+    third = (TestModel.field == 7) or None
+    fourth = TestModel.field != 8
+
+    assert when(first) == comparison(5)
+    assert when(second) == comparison(6)
+    assert when(third) == comparison(7)
+    assert when(fourth) == comparison(8, ASTOperatorNode.NOT_EQUALS)
+
+    chained = when(5 < TestModel.field < 10)
+    assert when(first) == comparison(5)
+    assert chained == ASTGroupNode(
+        [
+            comparison(5, ASTOperatorNode.GREATER_THAN).items[0],
+            ASTLogicalOperatorNode.AND,
+            comparison(10, ASTOperatorNode.LESS_THAN).items[0],
+        ]
+    )
+
+
+def test_query_ast_sort_deduplicates_fields():
+    class TestModel(DatabaseModel):
+        a: int @ Property()
+        b: int @ Property()
+
+    ast = when(TestModel).sort(TestModel.a.desc, TestModel.b, TestModel.a)
+    assert len(ast.sorting) == 2
+    assert [(node.field.name, node.ordering) for node in ast.sorting] == [
+        ("a", ResultOrdering.DESCENDING),
+        ("b", ResultOrdering.ASCENDING),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_prepared_query(sqlite_driver: SQLiteDriver):
+    await sqlite_driver.add(
+        TestModel(id=1, string="foo"),
+        TestModel(id=2, string="bar"),
+        TestModel(id=3, string="bar"),
+    )
+    query = TestModel.prepare(
+        lambda p: (TestModel.string == p.string) & (TestModel.id > p.id)
+    )
+    assert query.placeholders == {"string", "id"}
+
+    result = await query.fetch(string="bar", id=2)
+    assert [model.id for model in result.value] == [3]
+
+    result = await query.fetch(string="bar", id=0)
+    assert [model.id for model in result.value] == [2, 3]
+
+    result = await query.count(string="foo", id=0)
+    assert result.value == 1
+    assert query.compile(sqlite_driver) is query.compile(sqlite_driver)
+
+
+@pytest.mark.asyncio
+async def test_prepared_query_params_are_checked(sqlite_driver: SQLiteDriver):
+    query = TestModel.prepare(lambda p: TestModel.id == p.id)
+    with pytest.raises(TypeError):
+        await query.fetch()
+
+    with pytest.raises(TypeError):
+        await query.fetch(id=1, string="extra")
+
+
+def test_prepared_query_binds_ast():
+    query = TestModel.prepare(lambda p: TestModel.id == p.id)
+    assert query.bind({"id": 1}) == when(TestModel, TestModel.id == 1)
+
+
+@pytest.mark.asyncio
+async def test_model_get_by_key(sqlite_driver: SQLiteDriver):
+    await sqlite_driver.add(
+        TestModel(id=1, string="foo"), TestModel(id=2, string="bar")
+    )
+
+    result = await TestModel.get_by_key(2)
+    assert result.value == TestModel(id=2, string="bar")
+    assert result.value.get("string") == "bar"
+
+    result = await TestModel.get_by_key(3)
+    assert result.value is None
+    assert TestModel.__get_query__.ast.max_results == 1
+
+
+@pytest.mark.asyncio
+async def test_model_get_many(sqlite_driver: SQLiteDriver):
+    sqlite_driver.get_many_chunk_size = 2
+    await sqlite_driver.add(
+        *(TestModel(id=i, string=f"model {i}") for i in range(1, 6))
+    )
+
+    result = await TestModel.get_many([5, 1, 3, 7])
+    assert list(result.value) == [5, 1, 3, 7]
+    assert result.value[1] == TestModel(id=1, string="model 1")
+    assert result.value[5].string == "model 5"
+    assert result.value[7] is None
+
+
+@pytest.mark.asyncio
+async def test_default_get_many_uses_fetch():
+    class FetchDriver(DummyDriver, driver_name="fetch-dummy"):
+        async def fetch(self, *predicates):
+            self.predicates = when(*predicates)
+            return DatabaseSuccessStatus([TestModel(id=2, string="found")])
+
+    driver = FetchDriver()
+    DatabaseDriver.disable_driver(FetchDriver.driver_name)
+    result = await driver.get_many(TestModel, [1, 2])
+    assert result.value == {1: None, 2: TestModel(id=2, string="found")}
+    assert len(driver.predicates.items) == 2
+
+
+@pytest.mark.asyncio
+async def test_sqlite_fetch_batch(sqlite_driver: SQLiteDriver):
+    await sqlite_driver.add(
+        TestModel(id=1, string="foo"),
+        TestModel(id=2, string="bar"),
+        TestModel(id=3, string="foo"),
+    )
+
+    result = await TestModel.fetch_batch()
+    batch = result.value
+    assert len(batch) == 3
+    assert isinstance(batch.column("id"), array)
+    assert batch[-1] == TestModel(id=3, string="foo")
+    assert batch.to_models() == (await TestModel.fetch()).value
+
+    result = await TestModel.fetch_batch(TestModel.id > 1)
+    assert [item.id for item in result.value] == [2, 3]
+
+    assert [item.id for item in batch.filter(TestModel.id > 1, string="foo")] == [3]
+    assert [item.id for item in batch.filter("c" > TestModel.string)] == [2]
+    assert list(batch.sort_by(TestModel.id.desc).column("id")) == [3, 2, 1]
+    assert len(batch[1:]) == 2
+    assert {
+        key: list(group.column("id")) for key, group in batch.group_by("string").items()
+    } == {"foo": [1, 3], "bar": [2]}
+
+
+def test_batch_from_models():
+    batch = ModelBatch.from_models(
+        TestModel, [TestModel(id=2, string="b"), TestModel(id=1, string="a")]
+    )
+    assert batch.sort_by("id").to_models() == [
+        TestModel(id=1, string="a"),
+        TestModel(id=2, string="b"),
+    ]
+    assert len(ModelBatch.from_rows(TestModel, [])) == 0
+
+    batch = ModelBatch.from_rows(TestModel, [(1, None), (2, "a")])
+    assert [item.id for item in batch.filter(TestModel.string < "z")] == [2]
+
+    with pytest.raises(KeyError):
+        batch.sort_by("missing")
+
+
+def test_batch_sort_by_nullable_column():
+    batch = ModelBatch.from_rows(TestModel, [(1, "b"), (2, None), (3, "a"), (4, None)])
+    assert list(batch.sort_by("string").column("id")) == [3, 1, 2, 4]
+    assert list(batch.sort_by(TestModel.string.desc).column("id")) == [2, 4, 1, 3]
+    assert list(batch.sort_by("string", TestModel.id.desc).column("id")) == [3, 1, 4, 2]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_publishes_row_changes(sqlite_driver: SQLiteDriver):
+    async with DatabaseEvents.stream() as changes:
+        item = TestModel(id=1, string="foo")
+        await sqlite_driver.add(item)
+        item.string = "bar"
+        await sqlite_driver.update(item)
+        await sqlite_driver.delete(item)
+        await sqlite_driver.add(TestModel(id=1, string="duplicate"), TestModel(id=1))
+        changes.close()
+
+        events = [event async for event in changes]
+
+    assert [type(event) for event in events] == [
+        RowInsertedEvent,
+        RowUpdatedEvent,
+        RowDeletedEvent,
+    ]
+    assert all(event.model is TestModel and event.key == 1 for event in events)
+    assert events[0].fields == {"id": 1, "string": "foo"}
+    assert events[1].fields == {"string": "bar"}
+    assert events[2].fields == {}
+    assert not DatabaseEvents.has_listeners()
+
+
+@pytest.mark.asyncio
+async def test_row_changes_are_published_after_commit(sqlite_driver: SQLiteDriver):
+    in_transaction = []
+
+    async def on_change(event: RowChangeEvent):
+        in_transaction.append(sqlite_driver._db.in_transaction)
+
+    listener = DatabaseEvents.listen(RowChangeEvent, on_change)
+    item = TestModel(id=1, string="foo")
+    await sqlite_driver.add(item)
+    await sqlite_driver.update(item)
+    await sqlite_driver.delete(item)
+    listener.stop()
+
+    assert in_transaction == [False, False, False]
+
+
+@pytest.mark.asyncio
+async def test_bounded_change_stream_drops_oldest(sqlite_driver: SQLiteDriver):
+    async with DatabaseEvents.stream(max_size=2) as changes:
+        await sqlite_driver.add(*(TestModel(id=i, string="foo") for i in range(1, 5)))
+        changes.close()
+
+        keys = [event.key async for event in changes]
+
+    assert keys == [3, 4]
+    assert changes.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_row_change_listeners_filter_by_type(sqlite_driver: SQLiteDriver):
+    deleted = []
+
+    async def on_delete(event: RowDeletedEvent):
+        deleted.append(event.key)
+
+    listener = DatabaseEvents.listen(RowDeletedEvent, on_delete)
+    await sqlite_driver.add(TestModel(id=1, string="foo"), TestModel(id=2))
+    await TestModel.delete(*(await TestModel.fetch()).value)
+    listener.stop()
+
+    assert sorted(deleted) == [1, 2]
+
+
+class Article(DatabaseModel):
+    id: int @ Property()
+    title: str @ Property(searchable=True)
+    body: str @ Property(searchable=True)
+    slug: str @ Property()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_full_text_search(sqlite_driver: SQLiteDriver):
+    await sqlite_driver.sync_schema({Article})
+    await sqlite_driver.add(
+        Article(id=1, title="Brewing coffee", body="Grind beans", slug="coffee"),
+        Article(id=2, title="Tea", body="Steep leaves, coffee optional", slug="tea"),
+        Article(id=3, title="Bread", body="Knead dough", slug="bread"),
+    )
+
+    result = await Article.search("coffee")
+    assert [match.item.id for match in result.value] == [1, 2]
+    assert result.value[0].score <= result.value[1].score
+
+    bread = (await Article.get_by_key(3)).value
+    bread.body = "Knead dough, serve with coffee"
+    await bread.sync()
+    await Article.delete((await Article.get_by_key(1)).value)
+
+    result = await Article.search("coffee", limit=5)
+    assert {match.item.slug for match in result.value} == {"tea", "bread"}
+    assert not await Article.search("slug:tea")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_search_index_covers_existing_rows(sqlite_driver: SQLiteDriver):
+    class Note(DatabaseModel):
+        id: int @ Property()
+        text: str @ Property()
+
+    await sqlite_driver.sync_schema({Note})
+    await sqlite_driver.add(Note(id=1, text="existing row"))
+
+    class Note(DatabaseModel):
+        id: int @ Property()
+        text: str @ Property(searchable=True)
+
+    assert await sqlite_driver.sync_schema({Note})
+    assert not sqlite_driver._db.in_transaction
+    result = await Note.search("existing")
+    assert [match.item.id for match in result.value] == [1]
+
+
+class Document(DatabaseModel):
+    id: int @ Property()
+    data: dict @ Property(indexed_paths=[("author", "name")])
+    tags: set[str] | None @ Property()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_json_columns(sqlite_driver: SQLiteDriver):
+    await sqlite_driver.sync_schema({Document})
+    await sqlite_driver.add(
+        Document(id=1, data={"author": {"name": "Zech"}, "n": [1, 2]}, tags={"a"}),
+        Document(id=2, data={"author": {"name": "Ada"}, "n": [3]}),
+    )
+
+    (first,) = (await Document.fetch(id=1)).value
+    assert isinstance(first.__field_values__["data"], LazyJSON)
+    assert first.data == {"author": {"name": "Zech"}, "n": [1, 2]}
+    assert first.__field_values__["data"] == first.data
+    assert first.tags == {"a"}
+
+    second = (await Document.get_by_key(2)).value
+    assert second.tags is None
+    second.data["author"]["name"] = "Grace"
+    await second.sync()
+
+    result = await Document.fetch(Document.data["author"]["name"] == "Grace")
+    assert [item.id for item in result.value] == [2]
+
+    result = await Document.fetch(Document.data["n"][0] < 2)
+    assert [item.id for item in result.value] == [1]
+
+
+@pytest.mark.asyncio
+async def test_serialize_fetched_json_columns(sqlite_driver: SQLiteDriver):
+    await sqlite_driver.sync_schema({Document})
+    await sqlite_driver.add(Document(id=1, data={"n": [1, 2]}, tags={"a"}))
+
+    documents = (await Document.fetch()).value
+    assert Document.dumps_many_json(documents) == (
+        b'[{"id":1,"data":{"n":[1,2]},"tags":["a"]}]'
+    )
+    assert Document.loads_many_binary(Document.dumps_many_binary(documents)) == (
+        documents
+    )
+
+
+@pytest.mark.asyncio
+async def test_sqlite_json_path_index():
+    driver = SQLiteDriver()
+    await driver.connect(SQLiteConfig(filename=":memory:", explain_threshold=0))
+    await driver.sync_schema({Document})
+    await driver.fetch(when(Document.data["author"]["name"] == "Zech"))
+
+    (select,) = [
+        entry
+        for entry in driver.query_log.slowest()
+        if entry.sql.startswith("SELECT *")
+    ]
+    assert not select.full_scan
+    assert any("USING INDEX" in detail for detail in select.plan)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_maintenance_jobs():
+    driver = SQLiteDriver()
+    await driver.connect(SQLiteConfig(filename=":memory:", vacuum_interval=0))
+    await driver.sync_schema({TestModel})
+
+    assert "vacuum" in driver.maintenance_jobs()
+    for job in ("optimize", "analyze", "checkpoint", "vacuum"):
+        assert await driver.run_maintenance(job)
+
+    assert not await driver.run_maintenance("defragment")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_maintenance_frees_pages(tmp_path):
+    driver = SQLiteDriver()
+    await driver.connect(SQLiteConfig(filename=str(tmp_path / "maintained.db")))
+    await driver.sync_schema({TestModel})
+    pragma = lambda name: driver._db.execute(f"PRAGMA {name};").fetchone()[0]
+    assert pragma("auto_vacuum") == 2
+    assert pragma("journal_mode") == "wal"
+
+    items = [TestModel(id=i, string="x" * 2000) for i in range(200)]
+    await driver.add(*items)
+    await driver.delete(*items)
+    assert await driver.run_maintenance("checkpoint")
+    pages = pragma("page_count")
+    assert pragma("freelist_count")
+
+    assert await driver.run_maintenance("vacuum")
+    assert pragma("freelist_count") == 0
+    assert pragma("page_count") < pages
+    assert await driver.run_maintenance("checkpoint")
+    assert (tmp_path / "maintained.db-wal").stat().st_size == 0
+    await driver.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_maintenance_scheduler_runs_due_jobs(sqlite_driver: SQLiteDriver):
+    scheduler = MaintenanceScheduler(lambda: sqlite_driver, idle_delay=10)
+    assert await scheduler.run_due(monotonic() - 3601) == []
+
+    # Optimize is barely due so it waits for traffic to stop, checkpoint is too overdue to wait
+    scheduler.notify_activity()
+    reports = await scheduler.run_due()
+    assert [report.job for report in reports] == ["checkpoint"]
+    assert reports[0].succeeded and reports[0].duration >= 0
+
+    scheduler.idle_delay = 0
+    reports = await scheduler.run_due()
+    assert [report.job for report in reports] == ["optimize"]
+    assert [report.job for report in scheduler.reports] == ["checkpoint", "optimize"]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backup(tmp_path):
+    driver = SQLiteDriver()
+    await driver.connect(SQLiteConfig(filename=str(tmp_path / "live.db")))
+    await driver.sync_schema({TestModel})
+    await driver.add(*(TestModel(id=i, string="x" * 2000) for i in range(1, 51)))
+
+    steps = []
+    result = await driver.backup(tmp_path / "backup.db", pages=4, progress=steps.append)
+    assert result.value.done and result.value.total > 4
+    assert len(steps) > 1 and steps[-1] == result.value
+
+    backup = sqlite3.connect(tmp_path / "backup.db")
+    assert backup.execute("SELECT Count(*) FROM TestModel;").fetchone() == (50,)
+    backup.close()
+    await driver.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backup_includes_writes_made_during_backup(tmp_path):
+    driver = SQLiteDriver()
+    await driver.connect(SQLiteConfig(filename=str(tmp_path / "live.db")))
+    await driver.sync_schema({TestModel})
+    await driver.add(*(TestModel(id=i, string="x" * 2000) for i in range(1, 51)))
+
+    async def write():
+        for i in range(51, 61):
+            await driver.add(TestModel(id=i, string="y" * 2000))
+
+    steps = []
+    result, _ = await asyncio.gather(
+        driver.backup(tmp_path / "backup.db", pages=1, sleep=0, progress=steps.append),
+        write(),
+    )
+    assert result.value.done
+    assert steps[0].total < steps[-1].total
+
+    backup = sqlite3.connect(tmp_path / "backup.db")
+    assert backup.execute("SELECT Count(*) FROM TestModel;").fetchone() == (60,)
+    backup.close()
+    await driver.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backup_in_memory(sqlite_driver: SQLiteDriver, tmp_path):
+    await sqlite_driver.add(TestModel(id=1, string="memory"))
+    assert await sqlite_driver.backup(tmp_path / "memory.db")
+
+    progress = backup_database(tmp_path / "memory.db", tmp_path / "copy.db")
+    assert progress.done and progress.percent == 100
+    with pytest.raises(FileNotFoundError):
+        backup_database(tmp_path / "missing.db", tmp_path / "copy.db")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backup_refuses_open_transaction(
+    sqlite_driver: SQLiteDriver, tmp_path
+):
+    sqlite_driver._db.execute("INSERT INTO TestModel (id, string) VALUES (1, 'open');")
+    result = await sqlite_driver.backup(tmp_path / "open.db")
+
+    assert not result
+    assert isinstance(result.exception, RuntimeError)
+    assert sqlite_driver._db.in_transaction
+
+
+@pytest.mark.parametrize("option", [["--pages"], ["--pages", "many"], ["--sleep"]])
+def test_backup_cli_reports_bad_options(monkeypatch, option):
+    from wordlette.cms.cli import run
+
+    monkeypatch.setattr("sys.argv", ["wordlette", "backup", "backup.db", *option])
+    with pytest.raises(SystemExit) as exit_info:
+        run()
+
+    assert "usage: wordlette backup" in str(exit_info.value)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_connection_tuning(tmp_path):
+    driver = SQLiteDriver()
+    config = SQLiteConfig(
+        filename=str(tmp_path / "tuned.db"),
+        cache_size=-4096,
+        mmap_size=1 << 20,
+        temp_store="Memory",
+        page_size=8192,
+    )
+    assert await driver.connect(config)
+    pragma = lambda name: driver._db.execute(f"PRAGMA {name};").fetchone()[0]
+    assert pragma("cache_size") == -4096
+    assert pragma("mmap_size") == 1 << 20
+    assert pragma("temp_store") == 2
+    assert pragma("page_size") == 8192
+    await driver.sync_schema({TestModel})
+    await driver.disconnect()
+
+    # An existing database keeps its page size, so it isn't changed on connect
+    config = SQLiteConfig(filename=str(tmp_path / "tuned.db"), page_size=4096)
+    assert await driver.connect(config)
+    assert pragma("page_size") == 8192
+    await driver.disconnect()
+
+    config = SQLiteConfig(filename=":memory:", temp_store="disk")
+    assert not await SQLiteDriver().connect(config)
+
+
+def test_sqlite_settings_form_advanced_options():
+    form = SQLiteSettingsForm.create_from_form_data(
+        FormData(
+            [
+                ("filename", "site.db"),
+                ("cache-size", "-2000"),
+                ("mmap-size", ""),
+                ("temp-store", "memory"),
+                ("page-size", ""),
+                ("cached-statements", ""),
+            ]
+        )
+    )
+    settings = form.convert_to_dict()
+    assert settings == {
+        "filename": "site.db",
+        "cache_size": -2000,
+        "temp_store": "memory",
+    }
+    assert SQLiteSettingsForm.view().sections == {
+        None: ["filename"],
+        "Advanced": [
+            "cache-size",
+            "mmap-size",
+            "temp-store",
+            "page-size",
+            "cached-statements",
+        ],
+    }
+    assert SQLiteConfig(**settings).cache_size == -2000
@@ -1,4 +1,7 @@
+import asyncio
+
 import pytest
+from starlette.datastructures import FormData
 
 from wordlette.core.forms import Form, Field
 from wordlette.core.forms import FormValidationError
@@ -195,3 +198,193 @@ def test_optional_annotations():
     assert TestForm.__form_fields__["field_a"].required is False
     assert TestForm.__form_fields__["field_b"].required is True
     assert TestForm.__form_fields__["field_c"].required is False
+
+
+def test_create_from_form_data():
+    class TestForm(Form):
+        field_a: int @ NumberField()
+        field_b: list[str] @ TextField()
+        field_c: str | None @ TextField()
+
+    form = TestForm.create_from_form_data(
+        FormData(
+            [
+                ("field-a", "10"),
+                ("field-b", "one"),
+                ("unknown", "ignored"),
+                ("field-b", "two"),
+            ]
+        )
+    )
+    assert form.field_a == 10
+    assert form.field_b == ["one", "two"]
+    assert form.field_c is None
+    assert TestForm.__form_field_parsers__["field-b"].multiple
+
+    with pytest.raises(TypeError):
+        TestForm.create_from_form_data(FormData([("field-b", "one")]))
+
+
+def test_create_from_form_data_with_custom_init():
+    class TestForm(Form):
+        value: int @ NumberField()
+
+        def __init__(self, **kwargs):
+            self.raw = kwargs["value"]
+            super().__init__(**kwargs)
+
+    form = TestForm.create_from_form_data(FormData([("value", "5")]))
+    assert form.raw == "5"
+    assert form.value == 5
+
+
+def test_form_validators_are_per_form():
+    calls = []
+
+    class TestForm(Form):
+        value: str @ TextField()
+
+        def validate_value(self, value):
+            calls.append(value)
+            if value == "invalid":
+                raise ValueError("Invalid value")
+
+    class OtherForm(Form):
+        value: str
+
+    OtherForm("invalid")
+    assert calls == []
+
+    form = TestForm("valid")
+    form.view()
+    assert calls == ["valid"]
+
+    with pytest.raises(FormValidationError) as error:
+        TestForm("invalid")
+
+    assert error.value.form.view().errors is error.value.errors
+    assert calls == ["valid", "invalid"]
+
+
+def test_type_validators_added_after_form_creation():
+    class TestForm(Form):
+        value: str
+
+    class TestChildForm(TestForm):
+        name: str
+
+    TestForm("valid")
+
+    @TestForm.add_type_validator(str)
+    def validate_type_str(value: str):
+        if value == "invalid":
+            raise ValueError("Invalid value")
+
+    with pytest.raises(FormValidationError):
+        TestForm("invalid")
+
+    with pytest.raises(FormValidationError):
+        TestChildForm("invalid")
+
+
+@pytest.mark.asyncio
+async def test_async_form_validators():
+    running, peak = 0, 0
+
+    class TestForm(Form, validator_concurrency=2):
+        field_a: str @ TextField()
+        field_b: str @ TextField()
+        field_c: str @ TextField()
+        field_d: int @ NumberField()
+
+        async def validate_field_a(self, value):
+            await self.check(value)
+
+        async def validate_field_b(self, value):
+            await self.check(value)
+
+        async def validate_field_c(self, value):
+            await self.check(value)
+
+        def validate_field_d(self, value):
+            if value < 0:
+                raise ValueError("Must not be negative")
+
+        async def check(self, value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if value == "taken":
+                raise ValueError("Already taken")
+
+    data = [("field-a", "a"), ("field-b", "b"), ("field-c", "c"), ("field-d", "1")]
+    form = await TestForm.create_from_form_data_async(FormData(data))
+    assert form.field_a == "a"
+    assert peak == 2
+
+    data = [("field-a", "taken"), ("field-b", "b"), ("field-c", "c"), ("field-d", "-1")]
+    with pytest.raises(FormValidationError) as error:
+        await TestForm.create_from_form_data_async(FormData(data))
+
+    assert set(error.value.errors) == {"field-a", "field-d"}
+
+
+@pytest.mark.asyncio
+async def test_async_form_validator_timeout():
+    class TestForm(Form, validator_timeout=0.01):
+        field: str @ TextField()
+
+    @TestForm.add_type_validator(str)
+    async def validate_type_str_slowly(value: str):
+        await asyncio.sleep(1)
+
+    form = TestForm("value")
+    errors = await form.validate_async()
+    assert isinstance(errors["field"], TimeoutError)
+
+
+def test_form_view_reuses_blank_elements():
+    class TestForm(Form):
+        text_field: str @ TextField(name="text-field")
+        other_field: str @ TextField(name="other-field") = ""
+
+    blank = TestForm.view()
+    assert TestForm.view() is blank
+
+    view = TestForm("Test").view()
+    assert view.fields["text-field"] == Input(
+        type="text", name="text-field", value="Test", required=True
+    )
+    assert view.fields["other-field"] is blank.fields["other-field"]
+    assert view.buttons is blank.buttons
+    assert view.labels is blank.labels
+
+
+def test_blank_form_render_is_cached():
+    from wordlette.cms.forms import Form as CMSForm
+
+    class ThemeManager:
+        version = 0
+        renders = 0
+
+        def render_template(self, template, form, **context):
+            self.renders += 1
+            return f"{template} {form.values} {self.version}"
+
+    class TestForm(CMSForm):
+        text_field: str @ TextField(name="text-field")
+
+    tm = ThemeManager()
+    view = TestForm.view()
+    assert view.render(None, tm) == "form.html {} 0"
+    assert view.render(None, tm) == "form.html {} 0"
+    assert tm.renders == 1
+
+    tm.version += 1
+    assert view.render(None, tm) == "form.html {} 1"
+    assert (
+        TestForm("Test").view().render(None, tm) == "form.html {'text-field': 'Test'} 1"
+    )
+    assert tm.renders == 3
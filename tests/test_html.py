@@ -0,0 +1,91 @@
+from wordlette.core.html.elements import Div, Input, Label
+
+
+def test_element_render():
+    element = Input(type="text", name="field", value='"quoted"', required=True)
+
+    assert element.render() == (
+        '<input type="text" name="field" value="&#34;quoted&#34;" required />'
+    )
+
+
+def test_element_flag_attrs():
+    assert Input(checked=False, disabled=None).render() == "<input disabled />"
+
+
+def test_element_render_after_mutation():
+    element = Input(name="field", class_="a")
+    assert element.render() == '<input name="field" class="a" />'
+
+    cloned = element.add_attr(value=1)
+    assert element.render() == '<input name="field" class="a" />'
+    assert cloned.render() == '<input name="field" value="1" class="a" />'
+
+    cloned.remove("value")
+    assert cloned.render() == '<input name="field" class="a" />'
+
+    cloned.attrs = {"name": "other"}
+    assert cloned.render() == '<input name="other" />'
+
+
+def test_container_render():
+    element = Div(Label("Name", for_="name"), Input(id="name"), class_="row")
+
+    assert element.render() == (
+        '<div class="row"><label for="name">Name</label><input id="name" /></div>'
+    )
+
+
+def test_render_is_cached():
+    page = Div(Div(Input(name="field"), "text"), class_="page")
+    rendered = page.render()
+
+    assert page.render() is rendered
+    assert page.body[0].render() is page.body[0].render()
+
+
+def test_render_cache_invalidated_by_children():
+    row = Div(Input(name="field"), class_="row")
+    page = Div(row, class_="page")
+    assert page.render() == (
+        '<div class="page"><div class="row"><input name="field" /></div></div>'
+    )
+
+    row.append(Label("Name", class_="label"))
+    assert page.render() == (
+        '<div class="page"><div class="row"><input name="field" />'
+        '<label class="label">Name</label></div></div>'
+    )
+
+    row.body[0].attrs = {"name": "other"}
+    assert page.render() == (
+        '<div class="page"><div class="row"><input name="other" />'
+        '<label class="label">Name</label></div></div>'
+    )
+
+
+def test_render_cache_shared_children():
+    field = Div(Input(name="field"), __clone__=True)
+    first, second = Div(field, id="first"), Div(field, id="second")
+    first.render(), second.render()
+
+    field.add_class("error")
+    assert first.render() == (
+        '<div id="first"><div class="error"><input name="field" /></div></div>'
+    )
+    assert second.render() == (
+        '<div id="second"><div class="error"><input name="field" /></div></div>'
+    )
+
+
+def test_render_not_cached_with_untracked_renderables():
+    class Counter:
+        count = 0
+
+        def render(self):
+            self.count += 1
+            return str(self.count)
+
+    page = Div(Div(Counter(), id="counter"), id="page")
+    assert page.render() == '<div id="page"><div id="counter">1</div></div>'
+    assert page.render() == '<div id="page"><div id="counter">2</div></div>'
@@ -1,6 +1,6 @@
 from datetime import datetime, date, time
 from itertools import count
-from typing import Annotated
+from typing import Annotated, Any
 
 import pytest
 
@@ -148,6 +148,189 @@ def test_joined_models():
 
     model = JoinedModel(**data)
     assert model.to_dict() == data
+    assert issubclass(JoinedModel, TestModelA)
+    assert issubclass(JoinedModel, TestModelB)
+    assert isinstance(model, TestModelB)
+    assert not isinstance(TestModelA(**data), TestModelB)
+
+
+def test_model_slots():
+    class TestModel(Model):
+        id: int @ FieldSchema
+        name: str | None @ FieldSchema
+
+    class ChildModel(TestModel):
+        age: int @ FieldSchema
+
+    model = ChildModel(id=1, age=30)
+    assert not hasattr(model, "__dict__")
+    assert model.__field_values__ == {"id": 1, "age": 30}
+    assert model.to_dict() == {"id": 1, "name": None, "age": 30}
+
+    with pytest.raises(AttributeError):
+        model.not_a_field = True
+
+
+def test_model_field_values_write_through():
+    class TestModel(Model):
+        id: int @ FieldSchema
+        name: str | None @ FieldSchema
+
+    model = TestModel(id=1)
+    model.__field_values__["name"] = "test"
+    assert model.name == "test"
+
+    del model.__field_values__["id"]
+    assert model.__field_values__ == {"name": "test"}
+    with pytest.raises(KeyError):
+        del model.__field_values__["id"]
+
+
+def test_generated_model_methods():
+    class TestModel(Model):
+        id: int @ FieldSchema
+        name: str | None @ FieldSchema
+        created: datetime | Auto @ FieldSchema
+
+    model = TestModel(1, name="test", unknown="ignored")
+    assert "__init__" in vars(TestModel)
+    assert model.to_dict() == {"id": 1, "name": "test", "created": model.created}
+    assert isinstance(model.created, datetime)
+    assert model == TestModel(id="1", name="test", created=model.created)
+    assert model != TestModel(id=2, name="test", created=model.created)
+
+    with pytest.raises(TypeError):
+        TestModel(name="test")
+
+
+def test_custom_model_init_is_kept():
+    class TestModel(Model):
+        id: int @ FieldSchema
+
+        def __init__(self, value: str):
+            super().__init__(id=int(value) * 2)
+
+    class ChildModel(TestModel):
+        name: str | None @ FieldSchema
+
+    assert TestModel("2").id == 4
+    assert ChildModel("3").to_dict() == {"id": 6, "name": None}
+
+
+def test_generated_init_matches_generic_init():
+    class TestModel(Model):
+        id: int @ FieldSchema
+        name: str | None @ FieldSchema
+
+    class SetModel(TestModel):
+        def set(self, name: str, value: Any):
+            super().set(name, value.upper() if isinstance(value, str) else value)
+
+    assert TestModel(1, "test", "extra").to_dict() == {"id": 1, "name": "test"}
+    assert SetModel(id=1, name="test").name == "TEST"
+
+    TestModel.name.add_validator(str.title)
+    assert TestModel(id=1, name="test").name == "Test"
+
+
+def test_model_json_serialization():
+    class ChildModel(Model):
+        name: str @ FieldSchema
+
+    class TestModel(Model):
+        id: int @ FieldSchema
+        created: datetime @ FieldSchema
+        tags: set[str] @ FieldSchema
+        child: ChildModel | None @ FieldSchema
+
+    model = TestModel(1, datetime(2023, 8, 1), {"a"}, ChildModel(name='"test"'))
+    assert model.dumps_json() == (
+        b'{"id":1,"created":"2023-08-01T00:00:00","tags":["a"],'
+        b'"child":{"name":"\\"test\\""}}'
+    )
+    assert TestModel.loads_json(model.dumps_json()) == model
+    assert TestModel.loads_many_json(TestModel.dumps_many_json([model, model])) == [
+        model,
+        model,
+    ]
+    assert b"".join(TestModel.stream_json([])) == b"[]"
+
+
+def test_model_json_serialization_with_validation_errors():
+    class TestModel(Model):
+        id: int @ FieldSchema
+        name: str @ FieldSchema
+
+    model = TestModel(id="not a number", name="test")
+    with pytest.raises(ValidationError) as error:
+        model.dumps_json()
+
+    assert error.value.model is model
+    assert "- id:" in error.value.__notes__[0]
+
+
+def test_model_binary_serialization():
+    class TestModel(Model):
+        id: int | Auto @ FieldSchema
+        created: datetime @ FieldSchema
+        name: str | None @ FieldSchema
+
+    class OtherModel(Model):
+        id: int @ FieldSchema
+
+    model = TestModel(created=datetime(2023, 8, 1), name="test")
+    restored = TestModel.loads_binary(model.dumps_binary())
+    assert restored == model
+    assert TestModel.loads_many_binary(TestModel.dumps_many_binary([model])) == [model]
+
+    unset = TestModel.loads_binary(
+        TestModel(id=Auto(), created=datetime.now()).dumps_binary()
+    )
+    assert isinstance(unset.id, Auto)
+    assert "name" not in unset.__field_values__
+
+    with pytest.raises(ValueError):
+        OtherModel.loads_binary(model.dumps_binary())
+
+
+def test_model_evolve():
+    class TestModel(Model):
+        id: int @ FieldSchema
+        name: str | None @ FieldSchema
+        tags: list[str] @ FieldSchema
+
+    model = TestModel(id="test", tags=["a"])
+    evolved = model.evolve(id="2", name="changed")
+    assert evolved.to_dict() == {"id": 2, "name": "changed", "tags": ["a"]}
+    assert evolved.tags is model.tags
+    assert evolved.__validation_errors__ == {}
+    assert set(model.__validation_errors__) == {"id"}
+    assert set(model.evolve(name="x").__validation_errors__) == {"id"}
+    assert "name" not in model.evolve(id=1).__field_values__
+
+    with pytest.raises(TypeError):
+        model.evolve(missing=True)
+
+
+def test_model_snapshot():
+    class TestModel(Model):
+        id: int @ FieldSchema
+        name: str | None @ FieldSchema
+
+    model = TestModel(id=1, name="before")
+    snapshot = model.snapshot()
+    model.set("name", "after")
+    assert snapshot == TestModel(id=1, name="before")
+    assert model.name == "after"
+
+
+def test_model_validation_errors_allocated_on_error():
+    class TestModel(Model):
+        id: int @ FieldSchema
+
+    assert not hasattr(TestModel(id=1), "__model_errors__")
+    assert TestModel(id=1).__validation_errors__ == {}
+    assert set(TestModel(id="test").__validation_errors__) == {"id"}
 
 
 def test_auto_fields():
@@ -161,6 +344,19 @@ def test_auto_fields():
     assert tuple(model.id for model in models) == (0, 1, 2)
 
 
+def test_auto_factories_resolved_per_class():
+    class TestModel(Model):
+        id: int | Auto @ FieldSchema
+        flag: bool | Auto @ FieldSchema
+
+    class ChildModel(TestModel):
+        __auto_field_factories__ = {int: lambda *_: 42}
+
+    assert set(TestModel.__field_auto_factories__) == {"id", "flag"}
+    assert isinstance(TestModel().id, int)
+    assert ChildModel().to_dict() == {"id": 42, "flag": 42}
+
+
 def test_auto_fields_types():
     class TestModel(Model):
         datetime_field: datetime | Auto @ FieldSchema
@@ -1,6 +1,7 @@
 from starlette.responses import PlainTextResponse
 from starlette.testclient import TestClient
 
+from wordlette.core.forms import FormTooLargeError, MalformedFormError
 from wordlette.core.requests import Request
 from wordlette.core.routers import Router
 
@@ -52,3 +53,19 @@ def test_router_routing_incorrect_method():
 
     client = TestClient(router)
     assert client.post("/").status_code == 405
+
+
+def test_router_form_error_status_codes():
+    async def too_large(request):
+        raise FormTooLargeError("Too large")
+
+    async def malformed(request):
+        raise MalformedFormError("Malformed")
+
+    router = Router()
+    router.add_route("/too-large", route=too_large, methods=Request.Post)
+    router.add_route("/malformed", route=malformed, methods=Request.Post)
+
+    client = TestClient(router)
+    assert client.post("/too-large").status_code == 413
+    assert client.post("/malformed").status_code == 400
@@ -1,3 +1,4 @@
+import pytest
 from pytest import raises
 from starlette.responses import PlainTextResponse
 from starlette.testclient import TestClient
@@ -5,21 +6,26 @@ from wordlette.core.requests import Request
 from wordlette.core.routes.exceptions import NoCompatibleFormError
 
 from wordlette.core.exceptions import MissingRoutePath, NoRouteHandlersFound
-from wordlette.core.forms import Form
+from wordlette.core.forms import (
+    Form,
+    FormLimits,
+    FormTooLargeError,
+    MalformedFormError,
+)
+from wordlette.core.forms.field_types import TextField
+from wordlette.core.forms.parsers import parse_form
 from wordlette.core.routes import Route
 
 
 class DefaultPathRoute(Route):
     path = "/"
 
-    async def get(self, _: Request.Get):
-        ...
+    async def get(self, _: Request.Get): ...
 
 
 def test_route_exception_handler_detection():
     class TestRoute(DefaultPathRoute):
-        async def get(self, _: Request.Get):
-            ...
+        async def get(self, _: Request.Get): ...
 
         async def handle_exception(self, error: Exception):
             pass
@@ -136,8 +142,7 @@ def test_route_exception_handling_sub_types():
 def test_missing_route_path():
     with raises(MissingRoutePath):
 
-        class TestRoute(Route):
-            ...
+        class TestRoute(Route): ...
 
 
 def test_no_route_handlers():
@@ -158,8 +163,7 @@ def test_route_registry():
     class TestRoute(TestRouteAbstract):
         path = "/"
 
-        async def get(self, _: Request.Get):
-            ...
+        async def get(self, _: Request.Get): ...
 
     assert TestRoute in route_registry
 
@@ -230,3 +234,142 @@ def test_multiple_forms():
     response = client.post("/", data={"field_a": "a", "field_b": "b"})
     assert response.status_code == 200
     assert response.text == "B"
+
+
+def test_form_handler_index():
+    class TestFormA(Form):
+        field_a: str @ TextField()
+
+    class TestFormB(Form):
+        field_a: str @ TextField()
+        field_b: str @ TextField()
+
+    class TestFormC(Form, method=Request.Put):
+        field_a: str @ TextField()
+        field_b: str @ TextField()
+        field_c: str @ TextField()
+
+    class TestRoute(DefaultPathRoute):
+        async def handle_form_a(self, form: TestFormA):
+            return PlainTextResponse("A")
+
+        async def handle_form_b(self, form: TestFormB):
+            return PlainTextResponse("B")
+
+        async def handle_form_c(self, form: TestFormC):
+            return PlainTextResponse("C")
+
+    index = TestRoute.__metadata__.form_handler_index
+    post, put = Request.Post, Request.Put
+    assert index.find(["field-a"], post).value[0] is TestFormA
+    assert index.find(["field-a", "field-b"], post).value[0] is TestFormB
+    assert index.find(["field-b", "field-a", "field-c"], post).value[0] is TestFormB
+    assert index.find(["field-a", "field-b", "field-c"], put).value[0] is TestFormC
+    assert not index.find(["field-a"], put)
+    assert not index.find(["field-b"], post)
+
+    client = TestClient(TestRoute())
+    response = client.post("/", data={"field-a": "a", "field-b": "b", "extra": "x"})
+    assert response.text == "B"
+
+
+def test_form_size_limits():
+    class TestForm(Form, limits=FormLimits(max_body_size=4096, max_field_size=16)):
+        field: str @ TextField()
+
+    class TestRoute(DefaultPathRoute):
+        async def handle_form(self, form: TestForm):
+            return PlainTextResponse(form.field)
+
+    client = TestClient(TestRoute())
+    assert client.post("/", data={"field": "value"}).text == "value"
+    assert client.post("/", files={"field": (None, "value")}).text == "value"
+
+    with raises(FormTooLargeError):
+        client.post("/", data={"field": "x" * 17})
+
+    with raises(FormTooLargeError):
+        client.post("/", files={"field": (None, "x" * 17)})
+
+    with raises(FormTooLargeError):
+        client.post("/", data={f"extra-{i}": "x" * 10 for i in range(400)})
+
+
+def test_form_field_size_overrides():
+    limits = FormLimits(max_field_size=16, field_sizes={"body": 1024})
+
+    class TestForm(Form, limits=limits):
+        title: str @ TextField()
+        body: str @ TextField()
+
+    class TestRoute(DefaultPathRoute):
+        async def handle_form(self, form: TestForm):
+            return PlainTextResponse(form.body)
+
+    client = TestClient(TestRoute())
+    data = {"title": "title", "body": "x" * 1000}
+    assert client.post("/", data=data).text == "x" * 1000
+    assert (
+        client.post("/", files={k: (None, v) for k, v in data.items()}).status_code
+        == 200
+    )
+
+    with raises(FormTooLargeError):
+        client.post("/", data={"title": "x" * 17, "body": "body"})
+
+    combined = limits.combine(FormLimits(max_field_size=32))
+    assert combined.field_size("title") == 32
+    assert combined.field_size("body") == 1024
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scope", [{}, {"app": object()}])
+@pytest.mark.parametrize("limits", [FormLimits(), FormLimits(max_field_size=None)])
+async def test_parse_form_malformed_multipart(scope, limits):
+    async def receive():
+        return {"type": "http.request", "body": b"--boundary", "more_body": False}
+
+    request = Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "headers": [(b"content-type", b"multipart/form-data")],
+        }
+        | scope,
+        receive,
+    )
+    with raises(MalformedFormError):
+        await parse_form(request, limits)
+
+
+@pytest.mark.asyncio
+async def test_parse_form_spools_files():
+    body = (
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="upload"; filename="test.txt"\r\n\r\n'
+        + b"x" * 100
+        + b"\r\n--boundary--\r\n"
+    )
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    def create_request():
+        return Request(
+            {
+                "type": "http",
+                "method": "POST",
+                "headers": [
+                    (b"content-type", b"multipart/form-data; boundary=boundary")
+                ],
+            },
+            receive,
+        )
+
+    form_data = await parse_form(create_request(), FormLimits(spool_size=10))
+    upload = form_data["upload"]
+    assert upload.file._rolled
+    assert await upload.read() == b"x" * 100
+
+    with raises(FormTooLargeError):
+        await parse_form(create_request(), FormLimits(max_file_size=50))
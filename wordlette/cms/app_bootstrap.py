@@ -5,6 +5,7 @@ from typing import Annotated
 from bevy import get_repository
 
 from wordlette.cms.auth_providers.cms_auth_providers import BaseCMSAuthProvider
+from wordlette.cms.extensions.database_maintenance import DatabaseMaintenance
 from wordlette.cms.extensions.error_pages import ErrorPages
 from wordlette.cms.states.serving import Serving
 from wordlette.cms.states.setup import Setup
@@ -69,7 +70,7 @@ def create_app(**settings):
         )
 
     app = WordletteApp(
-        extensions=[ErrorPages],
+        extensions=[DatabaseMaintenance, ErrorPages],
         middleware=[RouterMiddleware],
         state_machine=StateMachine(Setup.goes_to(Serving)),
         settings=settings,
@@ -22,12 +22,59 @@ def run():
 
             _start_server(**settings)
 
+        case (_, "backup", _, *args):
+            # Use the original arguments so the target path keeps its case
+            target = sys.argv[2]
+            pages = _get_option(args, "--pages", int, 1024, _backup_usage)
+            sleep = _get_option(args, "--sleep", float, 0.05, _backup_usage)
+            _backup_database(target, pages, sleep)
+
         case _:
             raise RuntimeError("Invalid command")
 
 
+_backup_usage = "usage: wordlette backup <target> [--pages <count>] [--sleep <seconds>]"
+
+
+def _get_option(args: list[str], name: str, type_: type, default, usage: str):
+    """Gets the value that follows an option, exiting with the usage message when it's missing or invalid."""
+    import sys
+
+    if name not in args:
+        return default
+
+    try:
+        return type_(args[args.index(name) + 1])
+    except (IndexError, ValueError):
+        sys.exit(f"{usage}\n{name} expects a {type_.__name__} value")
+
+
 def _start_server(**settings):
     from wordlette.cms.app_bootstrap import create_app
     import uvicorn
 
     uvicorn.run(create_app(**settings), port=8000, log_level="info")
+
+
+def _backup_database(target: str, pages: int, sleep: float):
+    from pathlib import Path
+    from wordlette.cms.app_bootstrap import _get_config_handlers
+    from wordlette.core.configs import ConfigManager
+    from wordlette.dbom.backups import backup_database
+
+    config = ConfigManager(_get_config_handlers())
+    config.load_config_file("settings.wordlette", Path.cwd())
+    settings = config.get("database", default={})
+    if settings.get("driver") != "sqlite":
+        raise RuntimeError("Backups are only supported for SQLite databases")
+
+    result = backup_database(
+        settings["filename"],
+        target,
+        pages=pages,
+        sleep=sleep,
+        progress=lambda p: print(
+            f"\rCopied {p.copied}/{p.total} pages ({p.percent:.0f}%)", end=""
+        ),
+    )
+    print(f"\nBacked up {result.total} pages to {target}")
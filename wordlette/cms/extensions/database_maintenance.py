@@ -0,0 +1,31 @@
+import logging
+
+from bevy import get_repository
+
+from wordlette.core.events import LifespanStartupEvent, LifespanShutdownEvent
+from wordlette.core.extensions import Extension
+from wordlette.core.routes.route_events import RequestEvent
+from wordlette.dbom.drivers import DatabaseDriver
+from wordlette.dbom.maintenance import MaintenanceScheduler
+from wordlette.events import Observer
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseMaintenance(Extension, Observer):
+    def __init__(self):
+        self.scheduler = MaintenanceScheduler(self._get_driver)
+
+    async def on_startup(self, _: LifespanStartupEvent):
+        logger.debug("Starting database maintenance")
+        self.scheduler.start()
+
+    async def on_shutdown(self, _: LifespanShutdownEvent):
+        logger.debug("Stopping database maintenance")
+        await self.scheduler.stop()
+
+    async def on_request(self, _: RequestEvent):
+        self.scheduler.notify_activity()
+
+    def _get_driver(self) -> DatabaseDriver | None:
+        return get_repository().find(DatabaseDriver).value_or(None)
@@ -1,3 +1,5 @@
+from typing import Any
+
 from bevy import dependency, inject
 from markupsafe import Markup
 
@@ -8,9 +10,10 @@ from wordlette.utils.contextual_methods import contextual_method
 
 
 class FormView(_FormView):
-    def __init__(self, template: str, *args):
-        super().__init__(*args)
+    def __init__(self, template: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         self.template = template
+        self._rendered: dict[tuple[str, ThemeManager, int], Markup] = {}
 
     @inject
     def render(
@@ -21,7 +24,15 @@ class FormView(_FormView):
         **context,
     ) -> str:
         template = __template or self.template
-        return Markup(__tm.render_template(template, form=self, **context))
+        if context or self.values or self.errors:
+            return Markup(__tm.render_template(template, form=self, **context))
+
+        # Blank views always render the same HTML until the theme changes
+        key = template, __tm, __tm.version
+        if key not in self._rendered:
+            self._rendered[key] = Markup(__tm.render_template(template, form=self))
+
+        return self._rendered[key]
 
 
 class Form(_Form):
@@ -32,24 +43,19 @@ class Form(_Form):
     def render(self):
         return self.view().render()
 
-    @contextual_method
-    def view(self) -> FormView:
-        return self.__form_view_type__(
-            self.__form_template__,
-            self.__form_fields__,
-            self.buttons,
-            self.__field_values__,
-            self._validate_fields(),
-            self.__request_method__,
-        )
-
-    @view.classmethod
-    def view(cls) -> FormView:
+    @classmethod
+    def _create_view(
+        cls,
+        values: dict[str, Any],
+        errors: dict[str, Exception],
+        blank: FormView | None = None,
+    ) -> FormView:
         return cls.__form_view_type__(
             cls.__form_template__,
             cls.__form_fields__,
             cls.buttons,
-            {},
-            {},
+            values,
+            errors,
             cls.__request_method__,
+            blank=blank,
         )
@@ -1,7 +1,12 @@
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse, PlainTextResponse
+
 from wordlette.cms.themes import ThemeManager, Template
+from wordlette.core.app import AppSetting
 from wordlette.core.middlewares.router_middleware import RouteManager
 from wordlette.core.requests import Request
 from wordlette.core.routes import Route
+from wordlette.dbom.drivers import DatabaseDriver
 from wordlette.state_machines import State
 from wordlette.utils.dependency_injection import AutoInject, inject
 
@@ -13,6 +18,36 @@ class Index(Route):
         return Template("index.html", title="Wordlette", subtitle="Hello World!")
 
 
+class QueryLogDebug(Route):
+    path = "/debug/queries"
+
+    async def query_log(
+        self,
+        _: Request.Get,
+        debug: bool @ AppSetting("debug", False),
+        driver: DatabaseDriver @ inject,
+    ):
+        if not debug or driver.query_log is None:
+            raise HTTPException(status_code=404)
+
+        return JSONResponse(driver.query_log.to_dict())
+
+
+class DatabaseMetricsDebug(Route):
+    path = "/debug/database-metrics"
+
+    async def database_metrics(
+        self,
+        _: Request.Get,
+        debug: bool @ AppSetting("debug", False),
+        driver: DatabaseDriver @ inject,
+    ):
+        if not debug:
+            raise HTTPException(status_code=404)
+
+        return PlainTextResponse(driver.metrics.to_prometheus())
+
+
 class Serving(State, AutoInject):
     async def enter_state(
         self,
@@ -14,6 +14,7 @@ from wordlette.core.forms.field_types import (
     SubmitButton,
     SelectField,
 )
+from wordlette.core.forms.parsers import parse_form
 from wordlette.core.requests import Request
 from wordlette.core.routes.query_vars import QueryArg
 from wordlette.dbom.controllers import DatabaseController
@@ -91,9 +92,9 @@ class ConfigureDatabase(SetupRoute, setup_category=SetupCategory.Database):
         if not (driver := DatabaseDriver.__drivers__.get(database_type)):
             return RedirectResponse(self.url())
 
-        form_data = await request.form()
+        form_data = await parse_form(request, driver.__settings_form__.__form_limits__)
         try:
-            form = driver.__settings_form__.create_from_form_data(form_data)
+            form = await driver.__settings_form__.create_from_form_data_async(form_data)
         except FormValidationError as exc:
             return self._create_template(form=exc.form)
 
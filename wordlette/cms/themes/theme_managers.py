@@ -18,6 +18,7 @@ class ThemeManager:
     def __init__(self):
         self._theme = None
         self._secondary_themes = []
+        self._version = 0
         self._jinja = jinja2.Environment(
             loader=JinjaTemplateLoader(self), autoescape=True
         )
@@ -26,6 +27,11 @@ class ThemeManager:
     def default_theme(self) -> Path:
         return self.wordlette_res / "themes" / "default"
 
+    @property
+    def version(self) -> int:
+        """Changes whenever the active themes change, so anything rendered with an older version is stale."""
+        return self._version
+
     def find_template(self, template_name: str) -> Option[Path]:
         for theme in self._iterate_themes():
             template_location = theme / template_name
@@ -45,6 +51,7 @@ class ThemeManager:
             )
 
         self._theme = theme_location
+        self._version += 1
         self._jinja.cache.clear()
         if self._jinja.bytecode_cache:
             self._jinja.bytecode_cache.clear()
@@ -58,6 +65,7 @@ class ThemeManager:
             )
 
         self._secondary_themes.append(theme_location)
+        self._version += 1
 
     def render_template(self, template_name: str, **context: Any) -> str:
         return self._jinja.get_template(template_name).render(**context)
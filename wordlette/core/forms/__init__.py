@@ -1,5 +1,10 @@
-from wordlette.core.forms.exceptions import FormValidationError
+from wordlette.core.forms.exceptions import (
+    FormValidationError,
+    FormTooLargeError,
+    MalformedFormError,
+)
 from wordlette.core.forms.fields import Field
 from wordlette.core.forms.forms import Form
+from wordlette.core.forms.parsers import FormLimits
 from wordlette.core.forms.validators import Validator
 from wordlette.core.forms.views import FormView
@@ -18,3 +18,15 @@ class FormValidationError(BaseWordletteException):
     @property
     def name(self):
         return f"Form Validation Error{'s' if len(self.errors) > 1 else ''}"
+
+
+class FormTooLargeError(BaseWordletteException):
+    """Raised when a submission is larger than the limits set for its form."""
+
+    status_code = 413
+
+
+class MalformedFormError(BaseWordletteException):
+    """Raised when a submission can't be parsed."""
+
+    status_code = 400
@@ -297,6 +297,13 @@ class NumberField(InputField):
         self._validate(min_value, max_value, step, value)
         super().__init__(max=max_value, min=min_value, step=step, value=value, **kwargs)
 
+    def convert(self, value: Any) -> Any:
+        # Browsers submit an empty string when an optional number input is left blank
+        if value == "" and self.optional:
+            return None
+
+        return super().convert(value)
+
     def _validate(self, min_value, max_value, step, value):
         if step is not not_set and step <= 0:
             raise ValueError("step must be greater than 0")
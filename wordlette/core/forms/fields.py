@@ -9,6 +9,7 @@ from typing import (
     ParamSpec,
     Iterator,
     Self,
+    get_origin,
 )
 
 from wordlette.core.html.base_elements import Element
@@ -16,6 +17,7 @@ from wordlette.utils.annotated_aggregator import AnnotatedAggregator
 from wordlette.utils.sentinel import sentinel
 
 NotSet, not_set = sentinel("NotSet")
+_multiple_value_types = {list, set, frozenset, tuple}
 P = ParamSpec("P")
 T = TypeVar("T")
 
@@ -66,12 +68,14 @@ class Field(metaclass=FieldMCS):
         type_hint: Type[T] | None = None,
         default: T | NotSet = not_set,
         label: str | Element | NotSet = not_set,
+        section: str | None = None,
         **attrs,
     ):
         self.attrs = attrs
         self.default = default
         self.label = label
         self.optional = False
+        self.section = section
         self.type_hint = type_hint
 
     def __rmatmul__(self, other: T) -> T:
@@ -91,6 +95,11 @@ class Field(metaclass=FieldMCS):
     def required(self) -> bool:
         return not self.optional and self.default is not_set
 
+    @property
+    def multiple(self) -> bool:
+        """Whether the field collects every value submitted for its name rather than a single value."""
+        return (get_origin(self.type_hint) or self.type_hint) in _multiple_value_types
+
     def compose(self, value: Any | NotSet = not_set) -> Element:
         from wordlette.core.html.elements import Input
 
@@ -123,6 +132,15 @@ class Field(metaclass=FieldMCS):
         converter = getattr(self, converter_name) if converter_name else self.type_hint
         return converter(value)
 
+    def get_converter(self) -> Callable[[Any], T]:
+        """Finds the function that converts values for the field so it can be looked up once rather than on every
+        conversion. Fields that override convert are converted by it."""
+        if type(self).convert is not Field.convert:
+            return self.convert
+
+        converter_name = self.__converters__.get(self.type_hint)
+        return getattr(self, converter_name) if converter_name else self.type_hint
+
     def set_missing(self, **kwargs) -> Self:
         self.default = kwargs.pop("default", self.default)
         self.optional = kwargs.pop("optional", self.optional)
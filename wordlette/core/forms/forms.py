@@ -1,12 +1,14 @@
+import asyncio
 from collections import defaultdict
-from inspect import get_annotations
+from contextlib import nullcontext
+from inspect import get_annotations, iscoroutinefunction
 from itertools import chain
 from types import UnionType, MethodType
 from typing import (
     Annotated,
     Any,
+    Awaitable,
     Callable,
-    Hashable,
     Sequence,
     Type,
     TypeAlias,
@@ -14,6 +16,8 @@ from typing import (
     get_args,
     get_origin,
     Iterable,
+    Iterator,
+    NamedTuple,
     ParamSpec,
 )
 
@@ -23,6 +27,7 @@ import wordlette.core.forms
 from wordlette.core.forms.exceptions import FormValidationError
 from wordlette.core.forms.field_types import SubmitButton, Button
 from wordlette.core.forms.fields import Field, NotSet, not_set
+from wordlette.core.forms.parsers import FormLimits
 from wordlette.core.forms.views import FormView
 from wordlette.core.requests import Request
 from wordlette.utils.contextual_methods import contextual_method
@@ -32,6 +37,7 @@ P = ParamSpec("P")
 F = TypeVar("F", bound="Form")
 T = TypeVar("T")
 Validator: TypeAlias = Callable[[T], None]
+FormValidator: TypeAlias = Callable[["Form", Any], None | Awaitable[None]]
 
 
 class FieldScanner:
@@ -140,13 +146,30 @@ class ValidatorScanner:
         ]
 
 
+class FieldParser(NamedTuple):
+    name: str
+    convert: Callable[[Any], Any]
+    multiple: bool
+
+
 class Form:
     __form_fields__: dict[str, Field]
     __form_field_names__: dict[str, str]
+    __form_field_parsers__: dict[str, FieldParser]
+    __required_form_fields__: frozenset[str]
     __validators__: dict[str, list[Validator]] = {}
     __type_validators__: dict[Type, list[Validator]] = {}
+    __field_validator_plans__: dict[str, tuple[FormValidator, ...]] = {}
+    __async_field_validator_plans__: dict[str, tuple[FormValidator, ...]] = {}
+    __type_validator_plans__: dict[
+        Type, tuple[tuple[FormValidator, ...], tuple[FormValidator, ...]]
+    ] = {}
+    __validator_concurrency__: int | None = 10
+    __validator_timeout__: float | None = None
     __request_method__: Type[Request]
     __form_view_type__: Type[FormView]
+    __blank_form_view__: FormView
+    __form_limits__: FormLimits = FormLimits()
 
     buttons: Iterable[Button] = (SubmitButton("Submit"),)
 
@@ -156,12 +179,23 @@ class Form:
         field_scanner: Type[FieldScanner] | None = None,
         validator_scanner: Type[ValidatorScanner] | None = None,
         view: Type[FormView] | None = None,
+        limits: FormLimits | None = None,
+        validator_concurrency: int | None | NotSet = not_set,
+        validator_timeout: float | None | NotSet = not_set,
         **kwargs,
     ):
         super().__init_subclass__(**kwargs)
         cls.__request_method__ = method
         cls.__form_view_type__ = view or getattr(cls, "__form_view_type__", FormView)
+        cls.__form_limits__ = limits or cls.__form_limits__
+        if validator_concurrency is not not_set:
+            cls.__validator_concurrency__ = validator_concurrency
+
+        if validator_timeout is not not_set:
+            cls.__validator_timeout__ = validator_timeout
+
         cls._setup_form_fields(field_scanner or FieldScanner)
+        cls._setup_field_parsers()
         cls._setup_buttons()
         cls._setup_validators(validator_scanner or ValidatorScanner)
 
@@ -172,6 +206,22 @@ class Form:
         if errors := self._validate_fields():
             raise self._create_validation_exception(errors)
 
+    @classmethod
+    def _create_from_values(cls: Type[F], values: dict[str, Any]) -> F:
+        """Creates a form from values that have already been converted, skipping the argument handling of __init__."""
+        if missing := cls.__required_form_fields__ - values.keys():
+            name = next(name for name in cls.__form_fields__ if name in missing)
+            raise TypeError(
+                f"{cls.__qualname__} is missing a value for the required field {name!r}"
+            )
+
+        form = cls.__new__(cls)
+        form.__field_values__ = values
+        if errors := form._validate_fields():
+            raise form._create_validation_exception(errors)
+
+        return form
+
     def get_field_value(self, name: str) -> Any | NotSet:
         field_name = self.__form_field_names__[name]
         field = self.__form_fields__[field_name]
@@ -184,31 +234,45 @@ class Form:
 
     @contextual_method
     def view(self) -> FormView:
-        return self.__form_view_type__(
-            self.__form_fields__,
-            self.buttons,
-            self.__field_values__,
-            self._validate_fields(),
-            self.__request_method__,
+        return self._create_view(
+            self.__field_values__, self._validate_fields(), type(self).view()
         )
 
     @view.classmethod
     def view(cls) -> FormView:
+        """The view of the blank form is the same every time, so it's created once and shared. Views of populated
+        forms reuse its elements for every field that doesn't have a value."""
+        try:
+            return cls.__dict__["__blank_form_view__"]
+        except KeyError:
+            cls.__blank_form_view__ = cls._create_view({}, {})
+            return cls.__blank_form_view__
+
+    @classmethod
+    def _create_view(
+        cls,
+        values: dict[str, Any],
+        errors: dict[str, Exception],
+        blank: FormView | None = None,
+    ) -> FormView:
         return cls.__form_view_type__(
-            cls.__form_fields__, cls.buttons, {}, {}, cls.__request_method__
+            cls.__form_fields__,
+            cls.buttons,
+            values,
+            errors,
+            cls.__request_method__,
+            blank=blank,
         )
 
     def _load_fields(self, *args, **kwargs):
-        required_fields = [
-            field for field in self.__form_fields__.values() if field.required
-        ]
+        required_fields = self.__required_form_fields__
         positional_args = list(reversed(args))
         for name, field in self.__form_fields__.items():
             if name in kwargs:
                 value = kwargs[name]
             elif positional_args:
                 value = positional_args.pop()
-            elif field in required_fields:
+            elif name in required_fields:
                 raise TypeError(
                     f"{type(self).__qualname__} is missing a value for the required field {name!r}"
                 )
@@ -218,6 +282,11 @@ class Form:
             self.__field_values__[name] = field.convert(value)
 
     def _validate_fields(self) -> dict[str, Exception]:
+        """Validates the form's values the first time it's called, the form's values don't change so later calls
+        return the same errors."""
+        if (validation_errors := vars(self).get("__form_errors__")) is not None:
+            return validation_errors
+
         validation_errors = {}
         for name, value in self.__field_values__.items():
             try:
@@ -225,23 +294,87 @@ class Form:
             except Exception as e:
                 validation_errors[self.__form_fields__[name].name] = e
 
+        self.__form_errors__ = validation_errors
         return validation_errors
 
     def _validate_field(self, name: str, value: Any):
-        field = self.__form_fields__[name]
-        for validator in chain([field.validate], self.__validators__.get(name, ())):
-            if not isinstance(validator, MethodType):
-                validator = MethodType(validator, self)
+        self.__form_fields__[name].validate(value)
+        for validator in self.__field_validator_plans__[name]:
+            validator(self, value)
+
+        for validator in self._find_type_validators(type(value))[0]:
+            validator(self, value)
+
+    async def validate_async(self) -> dict[str, Exception]:
+        """Runs the async validators after the sync validators, fields that have already failed are skipped. The async
+        validators run concurrently, limited by the form's validator concurrency, and each can be given a timeout. Their
+        errors are added to the form's errors, which are returned."""
+        validation_errors = self._validate_fields()
+        if vars(self).get("__async_validated__"):
+            return validation_errors
+
+        self.__async_validated__ = True
+        checks = [
+            (self.__form_fields__[name].name, validator, value)
+            for name, value in self.__field_values__.items()
+            if self.__form_fields__[name].name not in validation_errors
+            for validator in chain(
+                self.__async_field_validator_plans__[name],
+                self._find_type_validators(type(value))[1],
+            )
+        ]
+        if not checks:
+            return validation_errors
+
+        limit = self.__validator_concurrency__
+        semaphore = asyncio.Semaphore(limit) if limit else nullcontext()
+        results = await asyncio.gather(
+            *(
+                self._run_async_validator(validator, value, semaphore)
+                for _, validator, value in checks
+            ),
+            return_exceptions=True,
+        )
+        for (html_name, *_), result in zip(checks, results):
+            if isinstance(result, Exception):
+                # The first validator to fail is reported, the same as with sync validators
+                validation_errors.setdefault(html_name, result)
 
-            validator(value)
+        return validation_errors
 
-        for type_, validators in self.__type_validators__.items():
-            if isinstance(value, type_):
-                for validator in validators:
-                    if not isinstance(validator, MethodType):
-                        validator = MethodType(validator, self)
+    async def _run_async_validator(
+        self, validator: FormValidator, value: Any, semaphore: Any
+    ):
+        async with semaphore:
+            try:
+                await asyncio.wait_for(
+                    validator(self, value), self.__validator_timeout__
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"Validation took longer than {self.__validator_timeout__} seconds"
+                ) from None
 
-                    validator(value)
+    @classmethod
+    def _find_type_validators(
+        cls, type_: Type
+    ) -> tuple[tuple[FormValidator, ...], tuple[FormValidator, ...]]:
+        try:
+            return cls.__type_validator_plans__[type_]
+        except KeyError:
+            pass
+
+        validators = _split_validators(
+            validator
+            for base in reversed(cls.__mro__)
+            for validated_type, type_validators in vars(base)
+            .get("__type_validators__", {})
+            .items()
+            if issubclass(type_, validated_type)
+            for validator in type_validators
+        )
+        cls.__type_validator_plans__[type_] = validators
+        return validators
 
     @classmethod
     def _setup_buttons(cls):
@@ -259,13 +392,38 @@ class Form:
             setattr(cls, name, field)
             cls.__form_field_names__[field.name] = name
 
+    @classmethod
+    def _setup_field_parsers(cls):
+        """Compiles how each submitted HTML name is parsed, so submissions can be decoded in a single pass."""
+        cls.__form_field_parsers__ = {
+            field.name: FieldParser(name, field.get_converter(), field.multiple)
+            for name, field in cls.__form_fields__.items()
+        }
+        cls.__required_form_fields__ = frozenset(
+            name for name, field in cls.__form_fields__.items() if field.required
+        )
+
     @classmethod
     def _setup_validators(cls, scanner_type: Type[ValidatorScanner]):
         scanner = scanner_type(cls, cls.__form_fields__)
         scanner.scan()
 
-        _merge_dicts_of_lists(cls.__validators__, scanner.validators)
-        _merge_dicts_of_lists(cls.__type_validators__, scanner.type_validators)
+        # Each form keeps its own validators, the plans collect them from the form and its bases
+        cls.__validators__ = dict(scanner.validators)
+        cls.__type_validators__ = dict(scanner.type_validators)
+        cls.__field_validator_plans__ = {}
+        cls.__async_field_validator_plans__ = {}
+        for name in cls.__form_fields__:
+            (
+                cls.__field_validator_plans__[name],
+                cls.__async_field_validator_plans__[name],
+            ) = _split_validators(
+                validator
+                for base in reversed(cls.__mro__)
+                for validator in vars(base).get("__validators__", {}).get(name, ())
+            )
+
+        cls.__type_validator_plans__ = {}
 
     @classmethod
     def add_type_validator(
@@ -279,7 +437,9 @@ class Form:
 
             return decorator
 
-        cls.__type_validators__.setdefault(type_, []).append(lambda _, v: validator(v))
+        cls.__type_validators__.setdefault(type_, []).append(_ignore_form(validator))
+        for form in _iter_subclasses(cls):
+            form.__type_validator_plans__ = {}
 
     @classmethod
     def can_handle_method(cls, method: Type[Request]) -> bool:
@@ -287,17 +447,54 @@ class Form:
 
     @classmethod
     def create_from_form_data(cls: Type[F], form_data: FormData) -> F:
-        multi_items = {}
-        for field, value in form_data.multi_items():
-            multi_items.setdefault(field, []).append(value)
-
-        return cls(
-            **{
-                cls.__form_field_names__[name]: value if len(value) > 1 else value[0]
-                for name, value in multi_items.items()
-                if name in cls.__form_field_names__
-            }
-        )
+        if cls.__init__ is not Form.__init__:
+            # Forms with their own __init__ are given the submitted values to convert themselves
+            return cls(**cls._parse_form_data(form_data, convert=False))
+
+        return cls._create_from_values(cls._parse_form_data(form_data))
+
+    @classmethod
+    async def create_from_form_data_async(cls: Type[F], form_data: FormData) -> F:
+        """Creates a form from submitted data and runs its async validators. Errors from the sync and async validators
+        are raised together in one FormValidationError."""
+        try:
+            form = cls.create_from_form_data(form_data)
+        except FormValidationError as error:
+            form = error.form
+
+        if errors := await form.validate_async():
+            raise form._create_validation_exception(errors)
+
+        return form
+
+    @classmethod
+    def _parse_form_data(
+        cls, form_data: FormData, convert: bool = True
+    ) -> dict[str, Any]:
+        parsers = cls.__form_field_parsers__
+        values = {}
+        multiple_values = []
+        for html_name, value in form_data.multi_items():
+            if (parser := parsers.get(html_name)) is None:
+                continue
+
+            name, converter, multiple = parser
+            if not multiple:
+                # Like FormData's own lookups, the last value submitted for a single value field wins
+                values[name] = converter(value) if convert else value
+
+            elif name in values:
+                values[name].append(value)
+
+            else:
+                values[name] = [value]
+                multiple_values.append(parser)
+
+        if convert:
+            for name, converter, _ in multiple_values:
+                values[name] = converter(values[name])
+
+        return values
 
     @classmethod
     def count_matching_fields(cls, data: FormData) -> int:
@@ -318,11 +515,47 @@ class Form:
         )
 
 
-def _merge_dicts_of_lists(
-    base_dict: dict[Hashable, list[Any]], update_dict: dict[Hashable, list[Any]]
-):
-    for key, value in update_dict.items():
-        base_dict.setdefault(key, []).extend(value)
+def _as_form_validator(validator: Callable) -> FormValidator:
+    # Validators are called with the form and the value, bound methods such as classmethods already have their first
+    # argument
+    if isinstance(validator, MethodType):
+        return _ignore_form(validator)
+
+    return validator
+
+
+def _ignore_form(validator: Validator) -> FormValidator:
+    if iscoroutinefunction(validator):
+
+        async def validate(_, value):
+            await validator(value)
+
+    else:
+
+        def validate(_, value):
+            validator(value)
+
+    return validate
+
+
+def _split_validators(
+    validators: Iterable[Callable],
+) -> tuple[tuple[FormValidator, ...], tuple[FormValidator, ...]]:
+    sync_validators, async_validators = [], []
+    for validator in validators:
+        validator = _as_form_validator(validator)
+        if iscoroutinefunction(validator):
+            async_validators.append(validator)
+        else:
+            sync_validators.append(validator)
+
+    return tuple(sync_validators), tuple(async_validators)
+
+
+def _iter_subclasses(cls: Type[Form]) -> Iterator[Type[Form]]:
+    yield cls
+    for subclass in cls.__subclasses__():
+        yield from _iter_subclasses(subclass)
 
 
 @Form.add_type_validator(int)
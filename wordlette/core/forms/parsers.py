@@ -0,0 +1,215 @@
+from dataclasses import dataclass, field, fields
+from typing import AsyncIterator, Mapping
+from urllib.parse import unquote_plus
+
+from starlette.datastructures import FormData, Headers
+from starlette.exceptions import HTTPException
+from starlette.formparsers import (
+    FormParser,
+    MultiPartException,
+    MultiPartParser,
+    parse_options_header,
+)
+from starlette.requests import Request
+
+from wordlette.core.forms.exceptions import FormTooLargeError, MalformedFormError
+
+
+@dataclass(frozen=True)
+class FormLimits:
+    """Limits enforced while a submission streams in. Sizes are in bytes and None means there is no limit. Uploaded
+    files are kept in memory until they're larger than spool_size, then they're written to a temporary
+    file. Fields named in field_sizes use that size limit instead of max_field_size."""
+
+    max_body_size: int | None = None
+    max_field_size: int | None = 64 * 1024
+    max_file_size: int | None = None
+    spool_size: int = 1024 * 1024
+    max_fields: int = 1000
+    max_files: int = 1000
+    field_sizes: Mapping[str, int | None] = field(default_factory=dict)
+
+    def combine(self, *others: "FormLimits") -> "FormLimits":
+        """Finds the most permissive of several limits, for parsing a submission that any of several forms could
+        handle."""
+        all_limits = (self, *others)
+        return FormLimits(
+            **{
+                limit.name: _most_permissive(
+                    getattr(limits, limit.name) for limits in all_limits
+                )
+                for limit in fields(self)
+                if limit.name != "field_sizes"
+            },
+            field_sizes={
+                name: _most_permissive(limits.field_size(name) for limits in all_limits)
+                for limits in all_limits
+                for name in limits.field_sizes
+            },
+        )
+
+    def field_size(self, name: str) -> int | None:
+        return self.field_sizes.get(name, self.max_field_size)
+
+    @property
+    def uses_streaming_limits(self) -> bool:
+        """Starlette can only limit how many fields and files a multipart submission has, any other limits need the
+        streaming parsers."""
+        return (
+            self.max_body_size is not None
+            or self.max_field_size is not None
+            or self.max_file_size is not None
+            or self.spool_size != MultiPartParser.max_file_size
+            or any(size is not None for size in self.field_sizes.values())
+        )
+
+
+class StreamingMultiPartParser(MultiPartParser):
+    """Parses multipart submissions while enforcing FormLimits. Text fields and files are checked as each chunk
+    arrives, so oversized input fails before the rest of the body is read. Starlette has no public hooks for this, so
+    the parser relies on its current part and the files it closes on error."""
+
+    def __init__(
+        self, headers: Headers, stream: AsyncIterator[bytes], limits: FormLimits
+    ):
+        super().__init__(
+            headers, stream, max_files=limits.max_files, max_fields=limits.max_fields
+        )
+        self.limits = limits
+        # Starlette calls the size that files are spooled to disk at max_file_size
+        self.max_file_size = limits.spool_size
+        self._current_part_size = 0
+
+    async def parse(self) -> FormData:
+        try:
+            return await super().parse()
+        except FormTooLargeError:
+            for file in self._files_to_close_on_error:
+                file.close()
+
+            raise
+
+    def on_part_begin(self):
+        super().on_part_begin()
+        self._current_part_size = 0
+
+    def on_part_data(self, data: bytes, start: int, end: int):
+        self._current_part_size += end - start
+        if self._current_part.file is None:
+            _check_size(
+                self._current_part_size,
+                self.limits.field_size(self._current_part.field_name),
+                f"The {self._current_part.field_name!r} field",
+            )
+        else:
+            _check_size(
+                self._current_part_size,
+                self.limits.max_file_size,
+                f"The {self._current_part.file.filename!r} file",
+            )
+
+        super().on_part_data(data, start, end)
+
+
+class StreamingFormParser(FormParser):
+    """Parses URL encoded submissions while enforcing the field count and field size limits of FormLimits."""
+
+    def __init__(
+        self, headers: Headers, stream: AsyncIterator[bytes], limits: FormLimits
+    ):
+        super().__init__(headers, stream)
+        self.limits = limits
+        self._current_field_name = b""
+        self._current_field_size = 0
+        self._field_count = 0
+
+    def on_field_start(self):
+        self._field_count += 1
+        if self._field_count > self.limits.max_fields:
+            raise FormTooLargeError(
+                f"Too many fields, the limit is {self.limits.max_fields}"
+            )
+
+        self._current_field_name = b""
+        self._current_field_size = 0
+        super().on_field_start()
+
+    def on_field_name(self, data: bytes, start: int, end: int):
+        self._current_field_name += data[start:end]
+        super().on_field_name(data, start, end)
+
+    def on_field_data(self, data: bytes, start: int, end: int):
+        name = unquote_plus(self._current_field_name.decode("latin-1"))
+        self._current_field_size += end - start
+        _check_size(
+            self._current_field_size,
+            self.limits.field_size(name),
+            f"The {name!r} field",
+        )
+        super().on_field_data(data, start, end)
+
+
+async def parse_form(request: Request, limits: FormLimits) -> FormData:
+    """Parses a submitted form, streaming it in when there are size limits to enforce. Oversized submissions raise
+    FormTooLargeError and malformed submissions raise MalformedFormError, the router uses their status codes for the
+    error response."""
+    content_type, _ = parse_options_header(request.headers.get("Content-Type"))
+    try:
+        if content_type == b"multipart/form-data" and not limits.uses_streaming_limits:
+            return await request.form(
+                max_files=limits.max_files, max_fields=limits.max_fields
+            )
+
+        # Store the form on the request so later calls to request.form() return it
+        if request._form is None:
+            request._form = await _parse(request, limits)
+
+        return request._form
+
+    except MultiPartException as error:
+        raise MalformedFormError(error.message) from error
+
+    except HTTPException as error:
+        # Starlette turns MultiPartException into an HTTPException when the request has an app in its scope
+        raise MalformedFormError(error.detail) from error
+
+
+async def _parse(request: Request, limits: FormLimits) -> FormData:
+    content_length = request.headers.get("Content-Length", "")
+    if content_length.isdigit():
+        # Fail before reading anything when the client says the body is too large
+        _check_size(int(content_length), limits.max_body_size, "The request body")
+
+    stream = _limit_stream(request.stream(), limits.max_body_size)
+    content_type, _ = parse_options_header(request.headers.get("Content-Type"))
+    match content_type:
+        case b"multipart/form-data":
+            parser = StreamingMultiPartParser(request.headers, stream, limits)
+
+        case b"application/x-www-form-urlencoded":
+            parser = StreamingFormParser(request.headers, stream, limits)
+
+        case _:
+            return FormData()
+
+    return await parser.parse()
+
+
+async def _limit_stream(
+    stream: AsyncIterator[bytes], limit: int | None
+) -> AsyncIterator[bytes]:
+    size = 0
+    async for chunk in stream:
+        size += len(chunk)
+        _check_size(size, limit, "The request body")
+        yield chunk
+
+
+def _check_size(size: int, limit: int | None, name: str):
+    if limit is not None and size > limit:
+        raise FormTooLargeError(f"{name} is larger than the limit of {limit:,} bytes")
+
+
+def _most_permissive(values) -> int | None:
+    values = list(values)
+    return None if None in values else max(values)
@@ -14,10 +14,13 @@ class FormView:
         values: dict[str, Any],
         errors: dict[str, Exception],
         method: Type[Request] = Request.Post,
+        blank: "FormView | None" = None,
     ):
+        self._blank = blank
         self._buttons = None
         self._fields = None
         self._labels = None
+        self._sections = None
         self._method = method
 
         self.errors = errors
@@ -49,20 +52,59 @@ class FormView:
 
         return self._labels
 
+    @property
+    def sections(self) -> dict[str | None, list[str]]:
+        """Maps section names to the HTML names of the fields in them, fields that aren't in a section are under
+        None."""
+        if self._sections is None:
+            self._sections = self._group_sections(self.raw_fields)
+
+        return self._sections
+
     @property
     def method(self) -> str:
         return self._method.name.lower()
 
     def _compose_buttons(self, buttons: Iterable[Button]) -> list[Element]:
+        if self._blank is not None:
+            return self._blank.buttons
+
         return [button.compose() for button in buttons]
 
     def _compose_fields(
         self, fields: dict[str, Field], values: dict[str, Any]
     ) -> dict[str, Element]:
+        if self._blank is not None:
+            # Only fields that have a value differ from the blank form, everything else is reused
+            blank_fields = self._blank.fields
+            composed = {}
+            for field in fields.values():
+                name = field.attrs["name"]
+                composed[name] = (
+                    field.compose(values[name])
+                    if name in values
+                    else blank_fields[name]
+                )
+
+            return composed
+
         return {
             field.attrs["name"]: field.compose(values.get(field.attrs["name"], not_set))
             for field in fields.values()
         }
 
+    def _group_sections(self, fields: dict[str, Field]) -> dict[str | None, list[str]]:
+        if self._blank is not None:
+            return self._blank.sections
+
+        sections = {None: []}
+        for field in fields.values():
+            sections.setdefault(field.section, []).append(field.attrs["name"])
+
+        return sections
+
     def _compose_labels(self, fields: dict[str, Field]) -> dict[str, Label]:
+        if self._blank is not None:
+            return self._blank.labels
+
         return {field.attrs["name"]: field.compose_label() for field in fields.values()}
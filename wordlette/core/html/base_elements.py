@@ -1,4 +1,5 @@
 from typing import Any, Sequence, Self, Generator, Iterable
+from weakref import WeakValueDictionary
 
 from markupsafe import Markup
 
@@ -12,7 +13,10 @@ class Element(Renderable):
     flag_attrs = frozenset(("required", "checked", "disabled", "selected"))
 
     def __init__(self, *, __clone__: bool = False, **attrs):
-        self.attrs = self._clean_attrs(attrs)
+        self._attrs = self._clean_attrs(attrs)
+        self._compiled_attrs: str | None = None
+        self._rendered: Markup | None = None
+        self._parents: "WeakValueDictionary[int, ContainerElement] | None" = None
         self.cloned = __clone__
 
     def __eq__(self, other):
@@ -24,6 +28,18 @@ class Element(Renderable):
     def __repr__(self):
         return f"<{type(self).__name__} {self.tag} {self.attrs}>"
 
+    @property
+    def attrs(self) -> dict[str, Any]:
+        """Change attributes with add_attr, add_class, remove, or by assigning a new dict. Changing the dict in
+        place doesn't update the compiled attribute string."""
+        return self._attrs
+
+    @attrs.setter
+    def attrs(self, attrs: dict[str, Any]):
+        self._attrs = attrs
+        self._compiled_attrs = None
+        self._invalidate()
+
     @property
     def classes(self) -> set[str]:
         return self.attrs.get("class", set())
@@ -47,23 +63,63 @@ class Element(Renderable):
         )
 
     def render(self) -> Markup:
+        """Rendered markup is cached until the element or one of its children changes. Subclasses should override
+        _render so they're cached too."""
+        if self._rendered is not None:
+            return self._rendered
+
+        rendered = self._render()
+        if self._can_cache():
+            self._rendered = rendered
+
+        return rendered
+
+    def _add_parent(self, parent: "ContainerElement"):
+        if self._parents is None:
+            self._parents = WeakValueDictionary()
+
+        self._parents[id(parent)] = parent
+
+    def _can_cache(self) -> bool:
+        return True
+
+    def _invalidate(self):
+        # A parent only caches its markup while its children have cached theirs, so there's nothing to do when this
+        # element has nothing cached
+        if self._rendered is None:
+            return
+
+        self._rendered = None
+        if self._parents:
+            for parent in list(self._parents.values()):
+                parent._invalidate()
+
+    def _render(self) -> Markup:
         return Markup(f"<{self.tag} {self._build_attrs()} />")
 
     def _build_attrs(self) -> str:
-        attrs_dict = self.attrs.copy()
-        classes = self._process_classes(attrs_dict.pop("class", set()))
-        classes |= self._process_classes(attrs_dict.pop("classes", set()))
+        if self._compiled_attrs is None:
+            self._compiled_attrs = self._compile_attrs()
+
+        return self._compiled_attrs
+
+    def _compile_attrs(self) -> str:
+        flag_attrs = self.flag_attrs
+        attrs = []
+        flags = []
+        classes = set()
+        for name, value in self._attrs.items():
+            if name == "class" or name == "classes":
+                classes |= self._process_classes(value)
+            elif name in flag_attrs:
+                if value is not False:
+                    flags.append(name)
+            else:
+                attrs.append(f'{name}="{Markup.escape(value)}"')
+
         if classes:
-            attrs_dict["class"] = " ".join(classes)
-
-        attrs = [
-            f'{k}="{Markup.escape(v)}"'
-            for k, v in attrs_dict.items()
-            if k not in self.flag_attrs
-        ]
-        flags = [
-            name for name in self.flag_attrs if attrs_dict.get(name, False) is not False
-        ]
+            attrs.append(f'class="{Markup.escape(" ".join(classes))}"')
+
         return " ".join(attrs + flags)
 
     def _clean_attrs(self, attrs: dict[str, Any]) -> dict[str, Any]:
@@ -93,15 +149,21 @@ class Element(Renderable):
 class ContainerElement(Element):
     def __init__(self, *body: str | Renderable, **attrs):
         super().__init__(**attrs)
-        self.body = tuple(self._process_nodes(body))
+        self._replace_body(tuple(self._process_nodes(body)))
+
+    @property
+    def body(self) -> tuple[Renderable, ...]:
+        return self._body
+
+    @body.setter
+    def body(self, body: Sequence[str | Renderable]):
+        self._replace_body(tuple(self._process_nodes(body)))
 
     def append(self, *elements: str | Renderable) -> Self:
-        self.body = (*self.body, *self._process_nodes(elements))
-        return self
+        return self._replace_body((*self._body, *self._process_nodes(elements)))
 
     def prepend(self, *elements: str | Renderable) -> Self:
-        self.body = (*self._process_nodes(elements), *self.body)
-        return self
+        return self._replace_body((*self._process_nodes(elements), *self._body))
 
     def insert_after(
         self, selector: "str | selectors.Selector", *elements: str | Renderable
@@ -128,12 +190,13 @@ class ContainerElement(Element):
         return self
 
     def _insert_at(self, index: int, *elements: str | Renderable) -> Self:
-        self.body = (
-            *self.body[:index],
-            *self._process_nodes(elements),
-            *self.body[index:],
+        return self._replace_body(
+            (
+                *self._body[:index],
+                *self._process_nodes(elements),
+                *self._body[index:],
+            )
         )
-        return self
 
     def select(self, selector: "str | selectors.Selector") -> Renderable | None:
         selector = selectors.Selector.factory(selector)
@@ -149,11 +212,21 @@ class ContainerElement(Element):
 
         return self.body == other.body
 
-    def render(self) -> Markup:
+    def _can_cache(self) -> bool:
+        # Elements and text nodes keep what they've cached in _rendered. Any other renderable can't tell this element
+        # when it changes, so its output can't be cached. Checked with getattr as isinstance is slow on protocols.
+        return all(getattr(node, "_rendered", None) is not None for node in self._body)
+
+    def _render(self) -> Markup:
         return Markup(
             f"<{self.tag} {self._build_attrs()}>{''.join(element.render() for element in self.body)}</{self.tag}>"
         )
 
+    def _replace_body(self, body: tuple[Renderable, ...]) -> Self:
+        self._body = body
+        self._invalidate()
+        return self
+
     def _create_clone(self, **attrs) -> "ContainerElement":
         return type(self)(*self.body, __clone__=True, **attrs)
 
@@ -165,6 +238,10 @@ class ContainerElement(Element):
                 case str():
                     yield text.Text(node)
 
+                case Element():
+                    node._add_parent(self)
+                    yield node
+
                 case Renderable():
                     yield node
 
@@ -39,7 +39,7 @@ class Checkbox(Input):
 
         super().__init__(**attrs)
 
-    def render(self) -> Markup:
+    def _render(self) -> Markup:
         return Markup(f"<input {self._build_attrs()} />")
 
 
@@ -85,7 +85,7 @@ class Select(ContainerElement):
 
         super().__init__(*body, **kwargs)
 
-    def render(self) -> Markup:
+    def _render(self) -> Markup:
         return Markup(
             f"<{self.tag} {self._build_attrs()}>"
             f"{''.join(map(Option.render, self.body))}"
@@ -105,7 +105,7 @@ class Fieldset(ContainerElement):
         if legend:
             self.prepend(Legend(legend))
 
-    def render(self):
+    def _render(self):
         return Markup(
             f"<{self.tag} {self._build_attrs()}>"
             f"{''.join(elem.render() for elem in self.body)}"
@@ -6,9 +6,14 @@ from wordlette.core.html.renderables import Renderable
 class Text(Renderable):
     def __init__(self, text: str):
         self.text = text
+        self._rendered: Markup | None = None
 
     def render(self) -> Markup:
-        return Markup.escape(self.text)
+        # Text nodes aren't changed after they're created, so the escaped text is reused
+        if self._rendered is None:
+            self._rendered = Markup.escape(self.text)
+
+        return self._rendered
 
     def __repr__(self):
         return f"<{type(self).__name__} {self.text!r}>"
@@ -44,8 +44,9 @@ class Router:
             if debug:
                 scope["exception"] = exc
 
-            page = self._get_error_page(getattr(exc, "status_code", 500), scope)
-            if not isinstance(exc, HTTPException):
+            status_code = getattr(exc, "status_code", 500)
+            page = self._get_error_page(status_code, scope)
+            if not isinstance(exc, HTTPException) and status_code >= 500:
                 logger.exception(
                     "The router encountered an error while running the route handler."
                 )
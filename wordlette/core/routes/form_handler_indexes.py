@@ -0,0 +1,57 @@
+from typing import Any, Callable, Iterable, Type, TypeAlias
+
+from wordlette.core.forms import Form
+from wordlette.core.requests import Request
+from wordlette.utils.options import Option
+
+FormHandler: TypeAlias = tuple[Type[Form], Callable[[Any, Form], Any]]
+MethodIndex: TypeAlias = tuple[
+    dict[frozenset[str], FormHandler], tuple[tuple[frozenset[str], FormHandler], ...]
+]
+
+
+class FormHandlerIndex:
+    """Finds the form handler that best matches a submission. The best match is the form with the most fields whose
+    names were all submitted, the first registered form wins ties. Forms are indexed by the set of names they expect,
+    so a submission that exactly matches a form is found with a single lookup. Other submissions are checked against
+    the forms from the most fields to the fewest."""
+
+    def __init__(self, form_handlers: dict[Type[Form], Callable[[Any, Form], Any]]):
+        self._form_handlers = form_handlers
+        self._methods: dict[Type[Request], MethodIndex] = {}
+        for method in {form.__request_method__ for form in form_handlers}:
+            self._get_method_index(method)
+
+    def find(
+        self, names: Iterable[str], method_type: Type[Request]
+    ) -> Option[FormHandler]:
+        exact_matches, ranked_forms = self._get_method_index(method_type)
+        names = frozenset(names)
+        if handler := exact_matches.get(names):
+            return Option.Value(handler)
+
+        for form_names, handler in ranked_forms:
+            if form_names <= names:
+                return Option.Value(handler)
+
+        return Option.Null()
+
+    def _get_method_index(self, method_type: Type[Request]) -> MethodIndex:
+        try:
+            return self._methods[method_type]
+        except KeyError:
+            pass
+
+        forms = [
+            (frozenset(form.__form_field_names__), (form, handler))
+            for form, handler in self._form_handlers.items()
+            if form.__form_field_names__ and form.can_handle_method(method_type)
+        ]
+        exact_matches = {}
+        for form_names, handler in forms:
+            exact_matches.setdefault(form_names, handler)
+
+        # Sorting is stable so forms with the same number of fields stay in the order they were registered
+        ranked_forms = tuple(sorted(forms, key=lambda item: len(item[0]), reverse=True))
+        self._methods[method_type] = exact_matches, ranked_forms
+        return exact_matches, ranked_forms
@@ -1,7 +1,8 @@
 from typing import Type, Any, Callable, cast
 
 import wordlette.core.routes as routes
-from wordlette.core.forms import Form
+import wordlette.core.routes.form_handler_indexes as form_handler_indexes
+from wordlette.core.forms import Form, FormLimits
 from wordlette.core.requests import Request
 
 
@@ -30,6 +31,8 @@ class RouteMetadata:
     error_handlers: dict[Type[Exception], Callable[[Exception], Any]]
     request_handlers: dict[Type[Request], Callable[[Request], Any]]
     form_handlers: dict[Type[Form], Callable[[Form], Any]]
+    form_handler_index: "form_handler_indexes.FormHandlerIndex"
+    form_limits: FormLimits
 
 
 class RouteMetadataSetup:
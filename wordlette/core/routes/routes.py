@@ -21,11 +21,13 @@ from wordlette.core.exceptions import (
     NoRouteHandlersFound,
     CannotHandleInconsistentTypes,
 )
-from wordlette.core.forms import Form
+from wordlette.core.forms import Form, FormLimits
+from wordlette.core.forms.parsers import parse_form
 from wordlette.core.requests import Request
 from wordlette.core.routers import Router
 from wordlette.core.routes.exception_contexts import ExceptionHandlerContext
 from wordlette.core.routes.exceptions import NoCompatibleFormError
+from wordlette.core.routes.form_handler_indexes import FormHandlerIndex
 from wordlette.core.routes.method_collections import MethodsCollection
 from wordlette.core.routes.route_events import RequestEvent, ResponseEvent
 from wordlette.core.routes.route_metadata import RouteMetadataSetup
@@ -142,10 +144,12 @@ class Route(
 
     async def process_forms(self, request: Request) -> Response:
         """Process all forms in the request body and return the response."""
-        form_data = await request.form()
+        form_data = await parse_form(request, self.__metadata__.form_limits)
         match self._find_best_form_handler(form_data, type(request)):
             case Option.Value((form_type, handler)):
-                return await handler(self, form_type.create_from_form_data(form_data))
+                return await handler(
+                    self, await form_type.create_from_form_data_async(form_data)
+                )
 
             case _:
                 raise NoCompatibleFormError(
@@ -155,22 +159,7 @@ class Route(
     def _find_best_form_handler(
         self, form_data: FormData, method_type: Type[Request]
     ) -> Option[tuple[Type[Form], Callable[[Form], Response]]]:
-        handler, highest_field_count = Option.Null(), 0
-        for form, handler in self.__metadata__.form_handlers.items():
-            if not form.can_handle_method(method_type):
-                continue
-
-            supported_fields = form.count_matching_fields(form_data)
-            if supported_fields > highest_field_count:
-                handler, highest_field_count = (
-                    Option.Value((form, handler)),
-                    supported_fields,
-                )
-
-            if supported_fields == len(form_data):
-                break
-
-        return handler
+        return self.__metadata__.form_handler_index.find(form_data.keys(), method_type)
 
     async def _handle(self, scope: Scope, receive: Receive, send: Send):
         request = Request.factory(scope, receive, send)
@@ -272,6 +261,18 @@ class Route(
             if method not in cls.__metadata__.request_handlers:
                 cls._register_handlers(cls.process_forms, method)
 
+        cls.__metadata__.form_handler_index = FormHandlerIndex(
+            cls.__metadata__.form_handlers
+        )
+        # The submission is parsed before the form that handles it is known, so it's held to the most permissive
+        # limits of the route's forms
+        match [form.__form_limits__ for form in cls.__metadata__.form_handlers]:
+            case [limits, *other_limits]:
+                cls.__metadata__.form_limits = limits.combine(*other_limits)
+
+            case []:
+                cls.__metadata__.form_limits = FormLimits()
+
     @classmethod
     @never_abstract
     def _validate_route_object(cls):
@@ -0,0 +1,87 @@
+import asyncio
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, TypeAlias
+
+
+@dataclass(frozen=True)
+class BackupProgress:
+    remaining: int
+    total: int
+
+    @property
+    def copied(self) -> int:
+        return self.total - self.remaining
+
+    @property
+    def done(self) -> bool:
+        return self.remaining == 0
+
+    @property
+    def percent(self) -> float:
+        return 100.0 if self.total == 0 else self.copied / self.total * 100
+
+
+ProgressCallback: TypeAlias = Callable[[BackupProgress], None]
+
+
+def backup_database(
+    source: str | Path | sqlite3.Connection,
+    target: str | Path,
+    *,
+    pages: int = 1024,
+    sleep: float = 0.05,
+    progress: ProgressCallback | None = None,
+) -> BackupProgress:
+    """Copies a live SQLite database to the target file using SQLite's online backup API. The source is copied in
+    steps of the given number of pages, sleeping between each step so writers are only ever stalled for one step.
+    """
+    last = BackupProgress(0, 0)
+
+    def report(_, remaining: int, total: int):
+        nonlocal last
+        last = BackupProgress(remaining, total)
+        if progress:
+            progress(last)
+
+    source_db = source if isinstance(source, sqlite3.Connection) else _connect(source)
+    target_db = sqlite3.connect(target)
+    try:
+        source_db.backup(target_db, pages=pages, progress=report, sleep=sleep)
+    finally:
+        target_db.close()
+        if source_db is not source:
+            source_db.close()
+
+    return last
+
+
+async def backup_database_async(
+    source: str | Path,
+    target: str | Path,
+    *,
+    pages: int = 1024,
+    sleep: float = 0.05,
+    progress: ProgressCallback | None = None,
+) -> BackupProgress:
+    """Runs a backup in a worker thread with its own connection to the source so the event loop keeps serving
+    requests while the copy is taken. SQLite restarts the backup every time another connection writes to the source,
+    so a large database that is written to steadily may never finish. Back up a database that a driver is writing to
+    through the driver instead, SQLiteDriver.backup copies through the driver's own connection.
+    """
+    return await asyncio.to_thread(
+        backup_database,
+        source,
+        target,
+        pages=pages,
+        sleep=sleep,
+        progress=progress,
+    )
+
+
+def _connect(path: str | Path) -> sqlite3.Connection:
+    if not Path(path).exists():
+        raise FileNotFoundError(f"There is no database at {path}")
+
+    return sqlite3.connect(path)
@@ -0,0 +1,263 @@
+import operator
+from array import array
+from itertools import compress, repeat
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Sequence,
+    Type,
+    TypeVar,
+    get_origin,
+    overload,
+)
+
+from wordlette.dbom.query_ast import (
+    ASTComparisonNode,
+    ASTLiteralNode,
+    ASTOperatorNode,
+    ASTReferenceNode,
+    ResultOrdering,
+)
+from wordlette.models import Model
+
+M = TypeVar("M", bound=Model)
+Column = Sequence[Any]
+
+_array_types = {int: "q", float: "d"}
+_operators = {
+    ASTOperatorNode.EQUALS: operator.eq,
+    ASTOperatorNode.NOT_EQUALS: operator.ne,
+    ASTOperatorNode.GREATER_THAN: operator.gt,
+    ASTOperatorNode.GREATER_THAN_OR_EQUAL: operator.ge,
+    ASTOperatorNode.LESS_THAN: operator.lt,
+    ASTOperatorNode.LESS_THAN_OR_EQUAL: operator.le,
+}
+_reflected = {
+    ASTOperatorNode.GREATER_THAN: ASTOperatorNode.LESS_THAN,
+    ASTOperatorNode.GREATER_THAN_OR_EQUAL: ASTOperatorNode.LESS_THAN_OR_EQUAL,
+    ASTOperatorNode.LESS_THAN: ASTOperatorNode.GREATER_THAN,
+    ASTOperatorNode.LESS_THAN_OR_EQUAL: ASTOperatorNode.GREATER_THAN_OR_EQUAL,
+}
+
+
+class ModelBatch(Generic[M]):
+    """Stores a result set column by column rather than as a list of models. Int and float columns are packed into
+    arrays, and models are only created when rows are accessed, so large results cost a fraction of the memory and
+    time of building every model. Filtering, sorting, and grouping work on the columns and return new batches.
+    """
+
+    __slots__ = ("_model", "_columns", "_length", "_slots")
+
+    def __init__(self, model: Type[M], columns: dict[str, Column]):
+        self._model = model
+        self._columns = {name: columns[name] for name in model.__fields__}
+        self._slots = [model.__slot_names__[name] for name in self._columns]
+        self._length = len(next(iter(self._columns.values()), ()))
+
+    @classmethod
+    def from_rows(
+        cls,
+        model: Type[M],
+        rows: Iterable[tuple[Any, ...]],
+        converters: dict[str, Callable[[Any], Any]] | None = None,
+    ) -> "ModelBatch[M]":
+        """Builds a batch from rows of values in field order. Each column is passed through its converter, the rows are
+        otherwise trusted and aren't validated."""
+        converters = converters or {}
+        columns = zip(*rows)
+        return cls(
+            model,
+            {
+                name: _pack_column(field.type, column_values, converters.get(name))
+                for (name, field), column_values in zip(
+                    model.__fields__.items(),
+                    _pad_columns(columns, len(model.__fields__)),
+                )
+            },
+        )
+
+    @classmethod
+    def from_models(cls, model: Type[M], items: Iterable[M]) -> "ModelBatch[M]":
+        return cls.from_rows(
+            model,
+            (tuple(item.get(name) for name in model.__fields__) for item in items),
+        )
+
+    @property
+    def model(self) -> Type[M]:
+        return self._model
+
+    @property
+    def columns(self) -> dict[str, Column]:
+        return dict(self._columns)
+
+    def column(self, name: str) -> Column:
+        return self._columns[name]
+
+    def filter(
+        self, *predicates: ASTComparisonNode, **columns: Any | Callable[[Any], bool]
+    ) -> "ModelBatch[M]":
+        """Keeps the rows that match every predicate. Predicates are comparisons on the model's fields, such as
+        Post.views > 10. Keyword arguments match a column against a value, or against a callable that is given each
+        value in the column."""
+        mask: Iterable[bool] | None = None
+        for name, test in self._build_tests(predicates, columns):
+            column_mask = map(test, self._columns[name])
+            mask = (
+                column_mask if mask is None else map(operator.and_, mask, column_mask)
+            )
+
+        if mask is None:
+            return self
+
+        return self._take(list(compress(range(self._length), mask)))
+
+    def sort_by(
+        self, *keys: str | ASTReferenceNode, reverse: bool = False
+    ) -> "ModelBatch[M]":
+        """Sorts the rows by one or more columns. Reference nodes, such as Post.views.desc, set their own ordering."""
+        indices = list(range(self._length))
+        # Stable sorts from the last key to the first give the rows in the order of all the keys
+        for key in reversed(keys):
+            name, descending = self._find_sort_key(key)
+            column = self._columns[name]
+            # Nullable columns can't compare None with their values, so None sorts as larger than every value
+            indices.sort(
+                key=lambda index: (column[index] is None, column[index]),
+                reverse=descending != reverse,
+            )
+
+        return self._take(indices)
+
+    def group_by(self, key: str | ASTReferenceNode) -> "dict[Any, ModelBatch[M]]":
+        name, _ = self._find_sort_key(key)
+        groups: dict[Any, list[int]] = {}
+        for index, value in enumerate(self._columns[name]):
+            groups.setdefault(value, []).append(index)
+
+        return {value: self._take(indices) for value, indices in groups.items()}
+
+    def to_models(self) -> list[M]:
+        return list(self)
+
+    def _build_tests(
+        self,
+        predicates: tuple[ASTComparisonNode, ...],
+        columns: dict[str, Any],
+    ) -> Iterator[tuple[str, Callable[[Any], bool]]]:
+        for predicate in predicates:
+            match predicate:
+                case ASTComparisonNode(
+                    ASTReferenceNode(field), ASTLiteralNode(value), operator_
+                ):
+                    yield field.name, _build_test(_operators[operator_], value)
+
+                case ASTComparisonNode(
+                    ASTLiteralNode(value), ASTReferenceNode(field), operator_
+                ):
+                    operator_ = _reflected.get(operator_, operator_)
+                    yield field.name, _build_test(_operators[operator_], value)
+
+                case _:
+                    raise TypeError(f"Cannot filter a batch with {predicate!r}")
+
+        for name, value in columns.items():
+            yield name, value if callable(value) else _build_test(operator.eq, value)
+
+    def _find_sort_key(self, key: str | ASTReferenceNode) -> tuple[str, bool]:
+        match key:
+            case ASTReferenceNode(field) as reference:
+                return field.name, reference.ordering == ResultOrdering.DESCENDING
+
+            case str() if key in self._columns:
+                return key, False
+
+            case _:
+                raise KeyError(f"{self._model.__qualname__} has no column {key!r}")
+
+    def _row(self, index: int) -> M:
+        model = self._model
+        item = model.__new__(model)
+        for slot, column in zip(self._slots, self._columns.values()):
+            setattr(item, slot, column[index])
+
+        return item
+
+    def _take(self, indices: Sequence[int]) -> "ModelBatch[M]":
+        return ModelBatch(
+            self._model,
+            {
+                name: _take_column(column, indices)
+                for name, column in self._columns.items()
+            },
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ModelBatch[M]": ...
+
+    def __getitem__(self, index: int | slice) -> "M | ModelBatch[M]":
+        if isinstance(index, slice):
+            return self._take(range(self._length)[index])
+
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("Batch index out of range")
+
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[M]:
+        return map(self._row, range(self._length))
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self._model.__qualname__} rows={self._length}>"
+
+
+def _build_test(
+    compare: Callable[[Any, Any], bool], value: Any
+) -> Callable[[Any], bool]:
+    if compare in {operator.eq, operator.ne}:
+        return lambda item: compare(item, value)
+
+    # Like SQL, nulls never match an ordering comparison
+    return lambda item: item is not None and compare(item, value)
+
+
+def _pad_columns(columns: Iterable[tuple], count: int) -> Iterator[tuple]:
+    columns = list(columns)
+    return iter(columns or repeat((), count))
+
+
+def _pack_column(
+    type_hint: Any, values: tuple, converter: Callable[[Any], Any] | None
+) -> Column:
+    if converter:
+        values = tuple(map(converter, values))
+
+    hint = get_origin(type_hint) or type_hint
+    if typecode := _array_types.get(hint):
+        try:
+            return array(typecode, values)
+        except (OverflowError, TypeError):
+            # Nulls and ints that don't fit in 64 bits stay as Python objects
+            pass
+
+    return values
+
+
+def _take_column(column: Column, indices: Sequence[int]) -> Column:
+    values = map(column.__getitem__, indices)
+    if isinstance(column, array):
+        return array(column.typecode, values)
+
+    return tuple(values)
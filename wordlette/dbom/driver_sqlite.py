@@ -1,12 +1,45 @@
+import asyncio
 import sqlite3
+from contextlib import suppress
 from dataclasses import dataclass, field
 from datetime import datetime, date, time
+from functools import wraps
 from os.path import sep
-from typing import Type, Any, TypeVar, TypeGuard, Callable, get_origin, Generator, Self
+from pathlib import Path
+from time import perf_counter
+from typing import (
+    Type,
+    Any,
+    TypeVar,
+    TypeGuard,
+    Callable,
+    get_origin,
+    Generator,
+    Iterable,
+    Self,
+    Sequence,
+)
 
 from wordlette.core.configs import ConfigModel
-from wordlette.core.forms.field_types import TextField, Link, SubmitButton
+from wordlette.core.forms.field_types import (
+    Link,
+    NumberField,
+    SelectField,
+    SubmitButton,
+    TextField,
+)
+from wordlette.dbom.backups import (
+    BackupProgress,
+    ProgressCallback,
+    backup_database,
+)
 from wordlette.dbom.drivers import DatabaseDriver
+from wordlette.dbom.batches import ModelBatch
+from wordlette.dbom.json_values import (
+    build_json_path,
+    decode_json_lazily,
+    encode_json,
+)
 from wordlette.dbom.models import DatabaseModel
 from wordlette.dbom.properties import DatabaseProperty
 from wordlette.dbom.query_ast import (
@@ -18,19 +51,25 @@ from wordlette.dbom.query_ast import (
     ASTComparisonNode,
     ASTOperatorNode,
     ASTGroupFlagNode,
+    ASTPathNode,
+    ASTPlaceholderNode,
     ResultOrdering,
 )
+from wordlette.dbom.prepared_queries import PreparedQuery
+from wordlette.dbom.query_logs import QueryLog
+from wordlette.dbom.search import SearchResult, find_searchable_fields
 from wordlette.dbom.settings_forms import DatabaseSettingsForm
 from wordlette.dbom.statuses import (
     DatabaseStatus,
     DatabaseSuccessStatus,
     DatabaseExceptionStatus,
 )
-from wordlette.models import FieldSchema, Auto
+from wordlette.models import FieldSchema, Auto, Model
 from wordlette.utils.dependency_injection import inject
 from wordlette.utils.suppress_with_capture import SuppressWithCapture
 
 T = TypeVar("T")
+F = TypeVar("F", bound=Callable)
 
 
 placeholder_example_path = (
@@ -43,6 +82,28 @@ class SQLiteSettingsForm(DatabaseSettingsForm):
         placeholder=placeholder_example_path,
         label="Where should your SQLite database be located?",
     )
+    cache_size: int | None @ NumberField(
+        label="Page cache size (pages, or KiB when negative)",
+        section="Advanced",
+    )
+    mmap_size: int | None @ NumberField(
+        min_value=0, label="Memory-mapped I/O size (bytes)", section="Advanced"
+    )
+    temp_store: str | None @ SelectField(
+        {"Default": "default", "File": "file", "Memory": "memory"},
+        value="default",
+        label="Where should temporary tables be stored?",
+        section="Advanced",
+    )
+    page_size: int | None @ NumberField(
+        min_value=512,
+        max_value=65536,
+        label="Page size (bytes), only used when the database is first created",
+        section="Advanced",
+    )
+    cached_statements: int | None @ NumberField(
+        min_value=0, label="Prepared statement cache size", section="Advanced"
+    )
 
     buttons = (
         Link("Back", href="/configure-database"),
@@ -61,6 +122,20 @@ class SelectQuery:
     where: str = ""
 
 
+@dataclass(frozen=True)
+class SQLitePreparedStatement:
+    model: Type[DatabaseModel]
+    select: str
+    count: str
+    values: tuple[Any, ...]
+
+    def bind(self, params: dict[str, Any]) -> tuple[Any, ...]:
+        return tuple(
+            params[value.name] if isinstance(value, ASTPlaceholderNode) else value
+            for value in self.values
+        )
+
+
 class SQLConstraint(Auto):
     def __init__(self, name: str, value: str):
         self.name = name
@@ -85,6 +160,31 @@ class SQLiteConfig(ConfigModel):
     __config_key__ = "database"
 
     filename: str @ FieldSchema
+    query_log_size: int @ FieldSchema = 100
+    explain_threshold: float | None @ FieldSchema
+    optimize_interval: float @ FieldSchema = 3600.0
+    analyze_interval: float @ FieldSchema = 86400.0
+    checkpoint_interval: float @ FieldSchema = 300.0
+    vacuum_interval: float @ FieldSchema = 86400.0
+    cache_size: int | None @ FieldSchema
+    mmap_size: int | None @ FieldSchema
+    temp_store: str | None @ FieldSchema
+    page_size: int | None @ FieldSchema
+    cached_statements: int | None @ FieldSchema
+    # The vacuum and checkpoint maintenance jobs only do anything with these modes
+    auto_vacuum: str | None @ FieldSchema = "incremental"
+    journal_mode: str | None @ FieldSchema = "wal"
+
+
+def _uses_connection(method: F) -> F:
+    """Waits for any work a worker thread is doing on the driver's connection before running the method."""
+
+    @wraps(method)
+    async def run(self: "SQLiteDriver", *args, **kwargs):
+        async with self._connection_lock:
+            return await method(self, *args, **kwargs)
+
+    return run
 
 
 class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
@@ -114,6 +214,19 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
     type_validators = {
         datetime: lambda value: value,  # No-op to avoid type conflict with date
         date: lambda value: value.split()[0],
+        dict: decode_json_lazily,
+        list: decode_json_lazily,
+        tuple: decode_json_lazily,
+        set: decode_json_lazily,
+        frozenset: decode_json_lazily,
+    }
+
+    value_adapters = {
+        dict: encode_json,
+        list: encode_json,
+        tuple: encode_json,
+        set: encode_json,
+        frozenset: encode_json,
     }
 
     type_mapping = {
@@ -121,11 +234,30 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
         str: "TEXT",
         float: "REAL",
         bool: "INTEGER",
+        dict: "TEXT",
+        list: "TEXT",
+        tuple: "TEXT",
+        set: "TEXT",
+        frozenset: "TEXT",
+    }
+
+    explainable_statements = ("SELECT", "UPDATE", "DELETE")
+    temp_stores = ("default", "file", "memory")
+    pragma_choices = {
+        "temp_store": temp_stores,
+        "auto_vacuum": ("none", "full", "incremental"),
+        "journal_mode": ("delete", "truncate", "persist", "memory", "wal", "off"),
     }
+    vacuum_step_pages = 256
 
     def __init__(self):
         self._connected = False
         self._db: sqlite3.Connection | None = None
+        self._filename: str | None = None
+        self._maintenance_intervals: dict[str, float] = {}
+        # Held while a worker thread uses the connection, every other use of the connection waits for it
+        self._connection_lock = asyncio.Lock()
+        self.query_log = QueryLog()
 
     @property
     def connected(self) -> bool:
@@ -133,8 +265,17 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
 
     async def connect(self, config: SQLiteConfig @ inject = None) -> DatabaseStatus:
         with SuppressWithCapture(Exception) as error:
-            self._db = sqlite3.connect(config.filename)
+            self._db = self._open_connection(config)
+            self._filename = config.filename
             self._connected = True
+            self.query_log = QueryLog(config.query_log_size, config.explain_threshold)
+            self._maintenance_intervals = {
+                "optimize": config.optimize_interval,
+                "analyze": config.analyze_interval,
+                "checkpoint": config.checkpoint_interval,
+                "vacuum": config.vacuum_interval,
+            }
+            DatabaseDriver.__connected_driver__ = self
 
         return DatabaseExceptionStatus(*error) if error else DatabaseSuccessStatus(self)
 
@@ -142,23 +283,83 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
         with SuppressWithCapture(Exception) as error:
             self._db.close()
             self._connected = False
+            if DatabaseDriver.__connected_driver__ is self:
+                DatabaseDriver.__connected_driver__ = None
 
         return DatabaseExceptionStatus(*error) if error else DatabaseSuccessStatus(self)
 
     async def add(self, *items: DatabaseModel) -> DatabaseStatus:
-        session = self._db.cursor()
-        with SuppressWithCapture(Exception) as error:
-            for item in items:
-                self._insert(item, session)
-                self._sync_with_last_inserted(item, session)
+        async with self._connection_lock:
+            session = self._db.cursor()
+            with SuppressWithCapture(Exception) as error:
+                for item in items:
+                    self._insert(item, session)
+                    self._sync_with_last_inserted(item, session)
 
-        if error:
-            self._db.rollback()
-            return DatabaseExceptionStatus(*error)
+            if error:
+                self._db.rollback()
+                return DatabaseExceptionStatus(*error)
 
-        session.close()
+            session.close()
+            self._db.commit()
+
+        await self.publish_inserted(*items)
         return DatabaseSuccessStatus(self)
 
+    async def backup(
+        self,
+        target: str | Path,
+        *,
+        pages: int = 1024,
+        sleep: float = 0.05,
+        progress: ProgressCallback | None = None,
+    ) -> DatabaseStatus[BackupProgress]:
+        """Copies the database to the target a few pages at a time through the driver's own connection. SQLite
+        restarts a backup whenever another connection writes to the database, but copies writes made through the
+        backup's own connection into the backup. So the driver's operations run between the steps, and writes don't
+        make the backup start over.
+
+        The driver commits its own writes, a transaction that was opened on the connection some other way has to be
+        committed or rolled back first. The backup fails rather than commit it, as a backup can't include changes that
+        haven't been committed.
+        """
+        loop = asyncio.get_running_loop()
+
+        def report(step: BackupProgress):
+            if progress:
+                progress(step)
+
+            asyncio.run_coroutine_threadsafe(self._pause_backup(sleep), loop).result()
+
+        with SuppressWithCapture(Exception) as error:
+            async with self._connection_lock:
+                if self._db.in_transaction:
+                    raise RuntimeError(
+                        "Cannot back up the database while a transaction is open"
+                    )
+
+                result = await asyncio.to_thread(
+                    backup_database,
+                    self._db,
+                    target,
+                    pages=pages,
+                    sleep=0,
+                    progress=report,
+                )
+
+        return (
+            DatabaseExceptionStatus(*error) if error else DatabaseSuccessStatus(result)
+        )
+
+    async def _pause_backup(self, delay: float):
+        # Runs on the event loop between backup steps, letting waiting operations use the connection
+        self._connection_lock.release()
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            await self._connection_lock.acquire()
+
+    @_uses_connection
     async def count(
         self, *predicates: ASTGroupNode | Type[DatabaseModel]
     ) -> DatabaseStatus[int]:
@@ -176,18 +377,25 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
         for item in items:
             models.setdefault(type(item), []).append(item)
 
-        session = self._db.cursor()
-        for model, items in models.items():
-            with SuppressWithCapture(Exception) as error:
-                self._delete_rows(model, items, session)
+        async with self._connection_lock:
+            session = self._db.cursor()
+            for model, items in models.items():
+                with SuppressWithCapture(Exception) as error:
+                    self._delete_rows(model, items, session)
 
-            if error:
-                self._db.rollback()
-                return DatabaseExceptionStatus(*error)
+                if error:
+                    self._db.rollback()
+                    return DatabaseExceptionStatus(*error)
 
-        session.close()
+            session.close()
+            self._db.commit()
+
+        await self.publish_deleted(
+            *(item for items in models.values() for item in items)
+        )
         return DatabaseSuccessStatus(self)
 
+    @_uses_connection
     async def fetch(
         self, *predicates: ASTGroupNode | Type[DatabaseModel]
     ) -> DatabaseStatus[list[DatabaseModel]]:
@@ -200,6 +408,141 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
             DatabaseExceptionStatus(*error) if error else DatabaseSuccessStatus(result)
         )
 
+    @_uses_connection
+    async def count_prepared(
+        self, query: PreparedQuery, params: dict[str, Any]
+    ) -> DatabaseStatus[int]:
+        with SuppressWithCapture(Exception) as error:
+            statement: SQLitePreparedStatement = query.compile(self)
+            session = self._execute(
+                self._db.cursor(), statement.count, statement.bind(params)
+            )
+            result = session.fetchone()[0]
+
+        return (
+            DatabaseExceptionStatus(*error) if error else DatabaseSuccessStatus(result)
+        )
+
+    @_uses_connection
+    async def fetch_batch(
+        self, *predicates: ASTGroupNode | Type[DatabaseModel]
+    ) -> DatabaseStatus[ModelBatch]:
+        ast = when(*predicates)
+        with SuppressWithCapture(Exception) as error:
+            query = self._process_ast(ast)
+            session = self._execute(
+                self._db.cursor(), self._build_select_query(query), query.values
+            )
+            result = ModelBatch.from_rows(
+                query.model,
+                session.fetchall(),
+                self._get_column_converters(query.model),
+            )
+
+        return (
+            DatabaseExceptionStatus(*error) if error else DatabaseSuccessStatus(result)
+        )
+
+    @_uses_connection
+    async def fetch_prepared(
+        self, query: PreparedQuery, params: dict[str, Any]
+    ) -> DatabaseStatus[list[DatabaseModel]]:
+        with SuppressWithCapture(Exception) as error:
+            statement: SQLitePreparedStatement = query.compile(self)
+            session = self._execute(
+                self._db.cursor(), statement.select, statement.bind(params)
+            )
+            result = self._build_models(statement.model, session.fetchall())
+
+        return (
+            DatabaseExceptionStatus(*error) if error else DatabaseSuccessStatus(result)
+        )
+
+    def compile_prepared(self, query: PreparedQuery) -> SQLitePreparedStatement:
+        select_query = self._process_ast(query.ast)
+        return SQLitePreparedStatement(
+            select_query.model,
+            self._build_select_query(select_query),
+            self._build_count_query(select_query),
+            tuple(select_query.values),
+        )
+
+    @_uses_connection
+    async def get_many(
+        self, model: Type[DatabaseModel], keys: Iterable[Any]
+    ) -> DatabaseStatus[dict[Any, DatabaseModel | None]]:
+        pk = self.find_primary_key(model)
+        results = dict.fromkeys(keys)
+        keys = list(results)
+        with SuppressWithCapture(Exception) as error:
+            session = self._db.cursor()
+            for start in range(0, len(keys), self.get_many_chunk_size):
+                chunk = keys[start : start + self.get_many_chunk_size]
+                qs = ", ".join(["?"] * len(chunk))
+                self._execute(
+                    session,
+                    f"SELECT * FROM {model.__model_name__} WHERE {pk} IN ({qs});",
+                    chunk,
+                )
+                results.update(
+                    (getattr(item, pk), item)
+                    for item in self._build_models(model, session.fetchall())
+                )
+
+        return (
+            DatabaseExceptionStatus(*error) if error else DatabaseSuccessStatus(results)
+        )
+
+    def maintenance_jobs(self) -> dict[str, float]:
+        return self._maintenance_intervals.copy()
+
+    async def run_maintenance(self, job: str) -> DatabaseStatus[Self]:
+        with SuppressWithCapture(Exception) as error:
+            match job:
+                case "optimize":
+                    await self._run_in_thread(self._run_statement, "PRAGMA optimize;")
+
+                case "analyze":
+                    await self._run_in_thread(self._run_statement, "ANALYZE;")
+
+                case "checkpoint":
+                    await self._run_in_thread(
+                        self._run_statement, "PRAGMA wal_checkpoint(TRUNCATE);"
+                    )
+
+                case "vacuum":
+                    await self._incremental_vacuum()
+
+                case _:
+                    raise ValueError(f"Unknown maintenance job {job!r}")
+
+        return DatabaseExceptionStatus(*error) if error else DatabaseSuccessStatus(self)
+
+    @_uses_connection
+    async def search(
+        self, model: Type[DatabaseModel], query: str, limit: int = 10
+    ) -> DatabaseStatus[list[SearchResult]]:
+        table = model.__model_name__
+        index = self._get_search_table(model)
+        rowid = self._get_rowid_column(model)
+        with SuppressWithCapture(Exception) as error:
+            session = self._execute(
+                self._db.cursor(),
+                f"SELECT {table}.*, bm25({index}) AS score FROM {index} "
+                f"JOIN {table} ON {table}.{rowid} = {index}.rowid "
+                f"WHERE {index} MATCH ? ORDER BY score LIMIT ?;",
+                (query, limit),
+            )
+            result = [
+                SearchResult(model(*self._validate_row_values(model, row)), row[-1])
+                for row in session.fetchall()
+            ]
+
+        return (
+            DatabaseExceptionStatus(*error) if error else DatabaseSuccessStatus(result)
+        )
+
+    @_uses_connection
     async def sync_schema(
         self, models: set[Type[DatabaseModel]]
     ) -> DatabaseStatus[Self]:
@@ -207,12 +550,17 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
         with SuppressWithCapture(Exception) as error:
             for model in models:
                 self._create_table(model, session)
+                self._create_json_indexes(model, session)
+                if fields := find_searchable_fields(model):
+                    self._create_search_index(model, fields, session)
 
         if error:
             self._db.rollback()
             return DatabaseExceptionStatus(*error)
 
         session.close()
+        # Rebuilding a search index opens a transaction that has to be committed like any other write
+        self._db.commit()
         return DatabaseSuccessStatus(self)
 
     async def update(self, *items: DatabaseModel) -> DatabaseStatus[Self]:
@@ -220,16 +568,22 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
         for item in items:
             models.setdefault(type(item), []).append(item)
 
-        session = self._db.cursor()
-        for model, items in models.items():
-            with SuppressWithCapture(Exception) as error:
-                self._update_rows(model, items, session)
+        async with self._connection_lock:
+            session = self._db.cursor()
+            for model, items in models.items():
+                with SuppressWithCapture(Exception) as error:
+                    self._update_rows(model, items, session)
 
-            if error:
-                self._db.rollback()
-                return DatabaseExceptionStatus(*error)
+                if error:
+                    self._db.rollback()
+                    return DatabaseExceptionStatus(*error)
 
-        session.close()
+            session.close()
+            self._db.commit()
+
+        await self.publish_updated(
+            *(item for items in models.values() for item in items)
+        )
         return DatabaseSuccessStatus(self)
 
     def _build_column(self, field: DatabaseProperty, pk: bool) -> str:
@@ -271,10 +625,19 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
                     query.tables.append(model)
                     query.model = query.model or model
 
+                case ASTPathNode(ASTReferenceNode(field, model), path):
+                    where.append(self._build_json_extract(field, path, model))
+                    query.tables.append(model)
+                    query.model = query.model or model
+
                 case ASTLiteralNode(value):
                     where.append("?")
                     query.values.append(value)
 
+                case ASTPlaceholderNode() as placeholder:
+                    where.append("?")
+                    query.values.append(placeholder)
+
                 case ASTLogicalOperatorNode() as op:
                     where.append(self.logical_operator_mapping[op])
 
@@ -310,54 +673,213 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
         }
 
     def _create_table(self, model: Type[DatabaseModel], session: sqlite3.Cursor):
-        pk = self._find_primary_key(model)
+        pk = self.find_primary_key(model)
         columns = ", ".join(
             self._build_column(field, field.name == pk)
             for field in model.__fields__.values()
         )
-        session.execute(
-            f"CREATE TABLE IF NOT EXISTS {model.__model_name__} ({columns});"
+        self._execute(
+            session, f"CREATE TABLE IF NOT EXISTS {model.__model_name__} ({columns});"
         )
 
-    def _find_primary_key(self, model: Type[DatabaseModel]) -> str:
-        fields = list(model.__fields__.values())
-        if name := next((f.name for f in fields if f.name.lower() == "id"), None):
-            return name
+    def _open_connection(self, config: SQLiteConfig) -> sqlite3.Connection:
+        options = {}
+        if config.cached_statements is not None:
+            options["cached_statements"] = config.cached_statements
+
+        # Maintenance runs on a worker thread, the connection lock keeps it from overlapping with anything else
+        db = sqlite3.connect(config.filename, check_same_thread=False, **options)
+        # SQLite only changes the page size and auto vacuum mode of a database that has no pages yet, an existing
+        # database keeps them until it's vacuumed
+        is_new = db.execute("PRAGMA page_count;").fetchone()[0] == 0
+        pragmas = {
+            "page_size": config.page_size if is_new else None,
+            "auto_vacuum": config.auto_vacuum if is_new else None,
+            "journal_mode": config.journal_mode,
+            "cache_size": config.cache_size,
+            "mmap_size": config.mmap_size,
+            "temp_store": config.temp_store,
+        }
+        for name, value in pragmas.items():
+            if value is None:
+                continue
+
+            choices = self.pragma_choices.get(name)
+            if choices and value.casefold() not in choices:
+                raise ValueError(f"Invalid {name} {value!r}")
+
+            db.execute(f"PRAGMA {name} = {self._format_pragma_value(value)};")
+
+        return db
+
+    def _format_pragma_value(self, value: int | str) -> str:
+        match value:
+            case str():
+                return value.casefold()
+
+            case _:
+                return str(int(value))
+
+    def _create_json_indexes(self, model: Type[DatabaseModel], session: sqlite3.Cursor):
+        table = model.__model_name__
+        for field in model.__fields__.values():
+            for path in getattr(field, "indexed_paths", ()):
+                name = "_".join(
+                    (
+                        "".join(c if c.isalnum() else "_" for c in str(key))
+                        for key in path
+                    )
+                )
+                self._execute(
+                    session,
+                    f"CREATE INDEX IF NOT EXISTS {table}_{field.name}_{name}_json "
+                    f"ON {table} ({self._build_json_extract(field, path)});",
+                )
+
+    def _build_json_extract(
+        self,
+        field: DatabaseProperty,
+        path: tuple[str | int, ...],
+        model: Type[DatabaseModel] | None = None,
+    ) -> str:
+        column = f"{model.__model_name__}.{field.name}" if model else field.name
+        json_path = build_json_path(path).replace("'", "''")
+        return f"json_extract({column}, '{json_path}')"
+
+    def _create_search_index(
+        self,
+        model: Type[DatabaseModel],
+        fields: list[DatabaseProperty],
+        session: sqlite3.Cursor,
+    ):
+        table = model.__model_name__
+        index = self._get_search_table(model)
+        rowid = self._get_rowid_column(model)
+        columns = ", ".join(field.name for field in fields)
+        new_values = ", ".join(f"new.{field.name}" for field in fields)
+        old_values = ", ".join(f"old.{field.name}" for field in fields)
+        exists = self._execute(
+            session,
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?;",
+            (index,),
+        ).fetchone()
+        self._execute(
+            session,
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5("
+            f"{columns}, content='{table}', content_rowid='{rowid}');",
+        )
+        # Keep the external content index in step with the content table
+        self._execute(
+            session,
+            f"CREATE TRIGGER IF NOT EXISTS {index}_insert AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {index}(rowid, {columns}) VALUES (new.{rowid}, {new_values}); "
+            "END;",
+        )
+        self._execute(
+            session,
+            f"CREATE TRIGGER IF NOT EXISTS {index}_delete AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {index}({index}, rowid, {columns}) "
+            f"VALUES ('delete', old.{rowid}, {old_values}); "
+            "END;",
+        )
+        self._execute(
+            session,
+            f"CREATE TRIGGER IF NOT EXISTS {index}_update AFTER UPDATE ON {table} BEGIN "
+            f"INSERT INTO {index}({index}, rowid, {columns}) "
+            f"VALUES ('delete', old.{rowid}, {old_values}); "
+            f"INSERT INTO {index}(rowid, {columns}) VALUES (new.{rowid}, {new_values}); "
+            "END;",
+        )
+        if not exists:
+            self._execute(session, f"INSERT INTO {index}({index}) VALUES ('rebuild');")
+
+    def _get_rowid_column(self, model: Type[DatabaseModel]) -> str:
+        pk = self.find_primary_key(model)
+        return pk if model.__fields__[pk].type is int else "rowid"
+
+    def _get_search_table(self, model: Type[DatabaseModel]) -> str:
+        return f"{model.__model_name__}_search"
+
+    async def _incremental_vacuum(self):
+        # Free pages in small steps, other operations can use the connection in between
+        while await self._run_in_thread(self._incremental_vacuum_step):
+            pass
 
-        for field in fields:
-            if field.type is int or field.name.casefold() == "id":
-                return field.name
+    def _incremental_vacuum_step(self) -> bool:
+        session = self._db.cursor()
+        # Incremental vacuum only releases pages when auto_vacuum is INCREMENTAL (2)
+        if self._get_pragma(session, "auto_vacuum") != 2:
+            return False
+
+        if not self._get_pragma(session, "freelist_count"):
+            return False
+
+        self._execute(
+            session, f"PRAGMA incremental_vacuum({self.vacuum_step_pages});"
+        ).fetchall()
+        return True
+
+    async def _run_in_thread(self, func: Callable[..., T], *args) -> T:
+        """Runs blocking work on the connection in a worker thread, so long statements don't stall the event loop."""
+        async with self._connection_lock:
+            return await asyncio.to_thread(func, *args)
+
+    def _run_statement(self, statement: str):
+        session = self._db.cursor()
+        self._execute(session, statement).fetchall()
+        session.close()
 
-        return next(iter(fields)).name
+    def _get_pragma(self, session: sqlite3.Cursor, name: str) -> Any:
+        return self._execute(session, f"PRAGMA {name};").fetchone()[0]
 
     def _insert(self, item: DatabaseModel, session: sqlite3.Cursor):
         fields = list(item.__fields__.values())
         data = {
             field.name: value
             for field in fields
-            if not is_auto(value := getattr(item, field.name))
+            if not is_auto(value := self._get_column_value(item, field))
         }
         qs = ", ".join(["?"] * len(data))
         columns = ", ".join(data.keys())
         values = tuple(data.values())
-        session.execute(
-            f"INSERT INTO {item.__model_name__} ({columns}) VALUES ({qs});", values
+        self._execute(
+            session,
+            f"INSERT INTO {item.__model_name__} ({columns}) VALUES ({qs});",
+            values,
         )
 
+    def _get_column_value(self, item: DatabaseModel, field: DatabaseProperty) -> Any:
+        # Read the stored value directly so JSON that was never accessed isn't decoded just to be encoded again
+        value = Model.get(item, field.name)
+        if is_auto(value):
+            return value
+
+        hint = get_origin(field.type) or field.type
+        for adapter_type, adapter in self.value_adapters.items():
+            if issubclass(hint, adapter_type):
+                return adapter(value)
+
+        return value
+
     def _update_rows(
         self,
         model: Type[DatabaseModel],
         items: list[DatabaseModel],
         session: sqlite3.Cursor,
     ):
-        pk = self._find_primary_key(model)
+        pk = self.find_primary_key(model)
         fields = list(model.__fields__.values())
         for item in items:
-            values = (getattr(item, field.name) for field in fields if field.name != pk)
+            values = (
+                self._get_column_value(item, field)
+                for field in fields
+                if field.name != pk
+            )
             assignments = ", ".join(
                 f"{field.name} = ?" for field in fields if field.name != pk
             )
-            session.execute(
+            self._execute(
+                session,
                 f"UPDATE {model.__model_name__} SET {assignments} WHERE {pk} = ?;",
                 (*values, getattr(item, pk)),
             )
@@ -368,26 +890,28 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
         items: list[DatabaseModel],
         session: sqlite3.Cursor,
     ):
-        pk = self._find_primary_key(model)
+        pk = self.find_primary_key(model)
         keys = [getattr(item, pk) for item in items]
         qs = ", ".join(["?"] * len(items))
-        session.execute(
-            f"DELETE FROM {model.__model_name__} WHERE {pk} IN ({qs});", keys
+        self._execute(
+            session, f"DELETE FROM {model.__model_name__} WHERE {pk} IN ({qs});", keys
         )
 
     def _select(self, predicates: ASTGroupNode, session: sqlite3.Cursor):
         query = self._process_ast(predicates)
         query_str = self._build_select_query(query)
-        session.execute(query_str, query.values)
-        result = session.fetchall()
-        return [
-            query.model(*self._validate_row_values(query.model, row)) for row in result
-        ]
+        self._execute(session, query_str, query.values)
+        return self._build_models(query.model, session.fetchall())
+
+    def _build_models(
+        self, model: Type[DatabaseModel], rows: list[tuple[Any, ...]]
+    ) -> list[DatabaseModel]:
+        return [model(*self._validate_row_values(model, row)) for row in rows]
 
     def _count(self, predicates: ASTGroupNode, session: sqlite3.Cursor):
         query = self._process_ast(predicates)
         query_str = self._build_count_query(query)
-        session.execute(query_str, query.values)
+        self._execute(session, query_str, query.values)
         result = session.fetchone()
         return result[0]
 
@@ -400,6 +924,35 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
             else:
                 yield value
 
+    def _get_column_converters(
+        self, model: Type[DatabaseModel]
+    ) -> dict[str, Callable[[Any], Any]]:
+        return {
+            name: self._build_column_converter(field)
+            for name, field in model.__fields__.items()
+        }
+
+    def _build_column_converter(self, field: DatabaseProperty) -> Callable[[Any], Any]:
+        validators = [
+            validator
+            for validator in (
+                self._find_type_validator(field.type, None),
+                *field.validators,
+            )
+            if validator
+        ]
+
+        def convert(value: Any) -> Any:
+            if value is None:
+                return None
+
+            for validator in validators:
+                value = validator(value)
+
+            return value
+
+        return convert
+
     def _find_type_validator(
         self, type_hint: Type[T], value: Any
     ) -> Callable[[Any], T] | None:
@@ -447,12 +1000,36 @@ class SQLiteDriver(DatabaseDriver, driver_name="sqlite", nice_name="SQLite"):
 
         return " ".join(query_builder) + ";"
 
+    def _execute(
+        self, session: sqlite3.Cursor, sql: str, values: Sequence[Any] = ()
+    ) -> sqlite3.Cursor:
+        start = perf_counter()
+        session.execute(sql, values)
+        duration = perf_counter() - start
+
+        plan = ()
+        if self.query_log.should_explain(duration):
+            plan = self._explain(sql, values)
+
+        self.query_log.record(sql, values, duration, plan)
+        return session
+
+    def _explain(self, sql: str, values: Sequence[Any]) -> tuple[str, ...]:
+        if not sql.lstrip().upper().startswith(self.explainable_statements):
+            return ()
+
+        with suppress(sqlite3.Error):
+            rows = self._db.execute(f"EXPLAIN QUERY PLAN {sql}", values).fetchall()
+            return tuple(detail for *_, detail in rows)
+
+        return ()
+
     def _sync_with_last_inserted(self, item: DatabaseModel, session: sqlite3.Cursor):
-        pk = self._find_primary_key(type(item))
-        result = session.execute("SELECT last_insert_rowid();").fetchone()
+        pk = self.find_primary_key(type(item))
+        result = self._execute(session, "SELECT last_insert_rowid();").fetchone()
         result = self._validate_row_values(type(item), result)
         for field, value in zip(item.__fields__.values(), result):
-            item.__field_values__[field.name] = value
+            item.__set_stored_value__(field.name, value)
 
 
 def is_auto(obj: Any) -> TypeGuard[Auto]:
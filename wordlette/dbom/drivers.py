@@ -1,12 +1,39 @@
 from abc import ABC, abstractmethod
-from typing import Type, TypeAlias, TypeVar, Callable, get_origin
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Self,
+    Type,
+    TypeAlias,
+    TypeVar,
+)
 
 from wordlette.core.configs import ConfigModel
+from wordlette.dbom.events import (
+    DatabaseEvents,
+    RowChangeEvent,
+    RowDeletedEvent,
+    RowInsertedEvent,
+    RowUpdatedEvent,
+)
+from wordlette.dbom.metrics import DatabaseMetrics, instrument
 from wordlette.dbom.models import DatabaseModel
+from wordlette.dbom.prepared_queries import PreparedQuery
 from wordlette.dbom.properties import DatabaseProperty
-from wordlette.dbom.query_ast import ASTGroupNode
+from wordlette.dbom.query_ast import ASTGroupNode, ASTLogicalOperatorNode
+from wordlette.dbom.query_logs import QueryLog
+import wordlette.dbom.batches as batches
 from wordlette.dbom.settings_forms import DatabaseSettingsForm
-from wordlette.dbom.statuses import DatabaseStatus
+from wordlette.dbom.search import SearchResult
+from wordlette.dbom.statuses import (
+    DatabaseStatus,
+    DatabaseExceptionStatus,
+    DatabaseSuccessStatus,
+)
+from wordlette.models import Auto
+from wordlette.models.auto_factories import create_constant_factory
+from wordlette.models.fields import find_for_type
 from wordlette.utils.dependency_injection import AutoInject
 
 DriverName: TypeAlias = str
@@ -73,9 +100,25 @@ class AbstractDatabaseDriver(ABC):
 
 class DatabaseDriver(AbstractDatabaseDriver, ABC, AutoInject):
     __drivers__ = {}
+    # The driver that new models get their auto values from, drivers set this when they connect
+    __connected_driver__: "DatabaseDriver | None" = None
     driver_name: DriverName
     nice_name: DriverNiceName
     auto_value_factories: dict[Type[T], Callable[[DatabaseModel], T]] = {}
+    query_log: QueryLog | None = None
+    get_many_chunk_size = 500
+    instrumented_operations = (
+        "add",
+        "count",
+        "count_prepared",
+        "delete",
+        "fetch",
+        "fetch_batch",
+        "fetch_prepared",
+        "get_many",
+        "search",
+        "update",
+    )
 
     def __init_subclass__(cls, **kwargs):
         cls.driver_name = kwargs.pop(
@@ -84,8 +127,21 @@ class DatabaseDriver(AbstractDatabaseDriver, ABC, AutoInject):
         cls.nice_name = kwargs.pop("nice_name", getattr(cls, "nice_name", cls.__name__))
 
         super().__init_subclass__(**kwargs)
+        cls._instrument_operations()
         cls.add_driver(cls)
 
+    @property
+    def metrics(self) -> DatabaseMetrics:
+        """Each driver instance records its own metrics."""
+        if (metrics := vars(self).get("_metrics")) is None:
+            metrics = self._metrics = DatabaseMetrics()
+
+        return metrics
+
+    @metrics.setter
+    def metrics(self, metrics: DatabaseMetrics):
+        self._metrics = metrics
+
     @classmethod
     def add_driver(cls, driver: "Type[AbstractDatabaseDriver]"):
         cls.__drivers__[driver.driver_name] = driver
@@ -94,12 +150,162 @@ class DatabaseDriver(AbstractDatabaseDriver, ABC, AutoInject):
     def disable_driver(cls, name: DriverName):
         cls.__drivers__.pop(name, None)
 
+    @classmethod
+    def _instrument_operations(cls):
+        for name in cls.instrumented_operations:
+            method = vars(cls).get(name)
+            if method and not getattr(method, "__instrumented__", False):
+                setattr(cls, name, instrument(name, method))
+
+    def compile_prepared(self, query: PreparedQuery) -> Any:
+        return query.ast
+
+    async def count_prepared(
+        self, query: PreparedQuery, params: dict[str, Any]
+    ) -> DatabaseStatus[int]:
+        return await self.count(query.bind(params))
+
+    async def fetch_prepared(
+        self, query: PreparedQuery, params: dict[str, Any]
+    ) -> DatabaseStatus[list[DatabaseModel]]:
+        return await self.fetch(query.bind(params))
+
+    async def fetch_batch(
+        self, *predicates: ASTGroupNode | Type[DatabaseModel]
+    ) -> "DatabaseStatus[batches.ModelBatch]":
+        """Fetches the matching rows as a columnar ModelBatch. Drivers should build the batch straight from the rows,
+        this default builds it from the fetched models."""
+        status = await self.fetch(*predicates)
+        if not status:
+            return status
+
+        models = (type(item) for item in status.value)
+        match next((p for p in predicates if isinstance(p, type)), None) or next(
+            models, None
+        ):
+            case None:
+                return DatabaseExceptionStatus(
+                    ValueError("Cannot find the model to build the batch for")
+                )
+
+            case model:
+                return DatabaseSuccessStatus(
+                    batches.ModelBatch.from_models(model, status.value)
+                )
+
+    async def get_many(
+        self, model: Type[DatabaseModel], keys: Iterable[Any]
+    ) -> DatabaseStatus[dict[Any, DatabaseModel | None]]:
+        pk = self.find_primary_key(model)
+        results = dict.fromkeys(keys)
+        keys = list(results)
+        for start in range(0, len(keys), self.get_many_chunk_size):
+            predicates = ASTGroupNode()
+            for key in keys[start : start + self.get_many_chunk_size]:
+                predicates.add(getattr(model, pk) == key, ASTLogicalOperatorNode.OR)
+
+            status = await self.fetch(model, predicates)
+            if not status:
+                return status
+
+            results.update((getattr(item, pk), item) for item in status.value)
+
+        return DatabaseSuccessStatus(results)
+
+    def maintenance_jobs(self) -> dict[str, float]:
+        """Maps the names of the maintenance jobs the driver supports to how often they should run in seconds."""
+        return {}
+
+    async def run_maintenance(self, job: str) -> DatabaseStatus[Self]:
+        return DatabaseExceptionStatus(
+            NotImplementedError(f"{self.nice_name} has no maintenance job {job!r}")
+        )
+
+    async def search(
+        self, model: Type[DatabaseModel], query: str, limit: int = 10
+    ) -> DatabaseStatus[list[SearchResult]]:
+        return DatabaseExceptionStatus(
+            NotImplementedError(f"{self.nice_name} does not support full-text search")
+        )
+
+    def find_primary_key(self, model: Type[DatabaseModel]) -> str:
+        fields = list(model.__fields__.values())
+        if name := next((f.name for f in fields if f.name.lower() == "id"), None):
+            return name
+
+        for field in fields:
+            if field.type is int or field.name.casefold() == "id":
+                return field.name
+
+        return next(iter(fields)).name
+
+    async def publish_deleted(self, *items: DatabaseModel):
+        """Drivers call the publish methods once the change has been committed."""
+        await self._publish_changes(RowDeletedEvent, [(item, ()) for item in items])
+
+    async def publish_inserted(self, *items: DatabaseModel):
+        for item in items:
+            item.__take_changes__()
+
+        await self._publish_changes(
+            RowInsertedEvent, [(item, item.__fields__) for item in items]
+        )
+
+    async def publish_updated(self, *items: DatabaseModel):
+        # Changes are taken even when nothing is listening so the next update only sees what changed after this one
+        await self._publish_changes(
+            RowUpdatedEvent, [(item, item.__take_changes__()) for item in items]
+        )
+
+    async def _publish_changes(
+        self,
+        event_type: Type[RowChangeEvent],
+        changes: list[tuple[DatabaseModel, Iterable[str]]],
+    ):
+        # Skip building events when nothing is listening, which is the common case
+        if not DatabaseEvents.has_listeners():
+            return
+
+        for item, names in changes:
+            model = type(item)
+            await DatabaseEvents.emit(
+                event_type(
+                    model,
+                    getattr(item, self.find_primary_key(model)),
+                    {
+                        name: model.__fields__[name].serialize(item.get(name))
+                        for name in names
+                    },
+                )
+            )
+
+    def get_auto_value_factories(
+        self, model: Type[DatabaseModel]
+    ) -> dict[str, Callable[[DatabaseModel], Any]]:
+        """Maps the auto fields of a model to the factories that create their values, preferring the factories the
+        driver provides over the model's own."""
+        factories = dict(model.__field_auto_factories__)
+        for name, field in model.__fields__.items():
+            if not isinstance(field.default, Auto):
+                continue
+
+            match self.get_value_factory(field):
+                case None:
+                    continue
+
+                case Auto() as value:
+                    # The database fills in the value when the row is inserted
+                    factories[name] = create_constant_factory(value)
+
+                case factory:
+                    factories[name] = factory
+
+        return factories
+
     def get_value_factory(
         self, field: DatabaseProperty
     ) -> Callable[[DatabaseModel], T] | None:
-        field_type = get_origin(field.type) or field.type
-        for factory_type, factory in self.auto_value_factories.items():
-            if issubclass(field_type, factory_type):
-                return factory
+        return find_for_type(self.auto_value_factories, field.type)
+
 
-        return None
+DatabaseDriver._instrument_operations()
@@ -0,0 +1,114 @@
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any, Type, TYPE_CHECKING
+
+from wordlette.events import Event, Observable
+
+if TYPE_CHECKING:
+    from wordlette.dbom.models import DatabaseModel
+
+
+@dataclass
+class RowChangeEvent(Event):
+    __event_name__ = "Database.RowChange"
+
+    model: "Type[DatabaseModel]"
+    key: Any
+    fields: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class RowInsertedEvent(RowChangeEvent):
+    __event_name__ = "Database.RowInserted"
+
+
+@dataclass
+class RowUpdatedEvent(RowChangeEvent):
+    __event_name__ = "Database.RowUpdated"
+
+
+@dataclass
+class RowDeletedEvent(RowChangeEvent):
+    __event_name__ = "Database.RowDeleted"
+
+
+class DatabaseEvents(Observable):
+    """Emits the row change events that database drivers publish after each successful add, update, or delete."""
+
+    @classmethod
+    def has_listeners(cls) -> bool:
+        if cls.__instances__ or cls.__children__:
+            return True
+
+        dispatch = cls.__event_dispatch__
+        registries = (
+            dispatch.before_listeners,
+            dispatch.listeners,
+            dispatch.after_listeners,
+        )
+        return bool(dispatch.observers) or any(
+            any(registry.values()) for registry in registries
+        )
+
+    @classmethod
+    def stream(
+        cls, event_type: "Type[RowChangeEvent]" = RowChangeEvent, max_size: int = 0
+    ) -> "ChangeStream":
+        return ChangeStream(cls, event_type, max_size)
+
+
+class ChangeStream:
+    """Async iterator over the row change events an observable emits. Events are queued from the moment the stream is
+    created until it is closed. Queuing never waits, so a slow consumer can't hold up the driver's writes. When a
+    stream with a max_size is full the oldest event is dropped and counted in dropped."""
+
+    def __init__(
+        self,
+        observable: Observable | Type[Observable],
+        event_type: Type[RowChangeEvent] = RowChangeEvent,
+        max_size: int = 0,
+    ):
+        self._queue: asyncio.Queue[RowChangeEvent | None] = asyncio.Queue(max_size)
+        self._listener = observable.listen(event_type, self._on_change)
+        self._closed = False
+        self.dropped = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._listener.stop()
+            with suppress(asyncio.QueueFull):
+                self._queue.put_nowait(None)
+
+    async def _on_change(self, event: RowChangeEvent):
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._queue.get_nowait()
+            self._queue.put_nowait(event)
+            self.dropped += 1
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> RowChangeEvent:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+
+        match await self._queue.get():
+            case None:
+                raise StopAsyncIteration
+
+            case event:
+                return event
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        self.close()
@@ -0,0 +1,67 @@
+import json
+from typing import Any
+
+json_types = (dict, list, tuple, set, frozenset)
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+
+    raise TypeError(f"Cannot encode {type(value).__qualname__} as JSON")
+
+
+_encoder = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), default=_encode_default
+)
+
+
+class LazyJSON:
+    """Holds a JSON document loaded from the database until the field is first accessed."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def decode(self) -> Any:
+        return json.loads(self.text)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.text!r})"
+
+
+def decode_json_lazily(value: str | None) -> LazyJSON | None:
+    return None if value is None else LazyJSON(value)
+
+
+def encode_json(value: Any) -> str | None:
+    match value:
+        case None:
+            return None
+
+        case LazyJSON(text=text):
+            return text
+
+        case _:
+            return _encoder.encode(value)
+
+
+def is_json_type(type_hint: Any) -> bool:
+    return isinstance(type_hint, type) and issubclass(type_hint, json_types)
+
+
+def build_json_path(path: tuple[str | int, ...]) -> str:
+    parts = ["$"]
+    for key in path:
+        match key:
+            case int():
+                parts.append(f"[{key}]")
+
+            case str() if '"' not in key:
+                parts.append(f'."{key}"')
+
+            case _:
+                raise ValueError(f"Unsupported JSON path key {key!r}")
+
+    return "".join(parts)
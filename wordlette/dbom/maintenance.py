@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from time import monotonic
+from typing import Callable
+
+import wordlette.dbom.drivers as drivers
+from wordlette.dbom.statuses import DatabaseStatus
+
+logger = logging.getLogger("DatabaseMaintenance")
+
+
+@dataclass(frozen=True)
+class MaintenanceReport:
+    job: str
+    duration: float
+    status: DatabaseStatus
+
+    @property
+    def succeeded(self) -> bool:
+        return bool(self.status)
+
+
+class MaintenanceScheduler:
+    """Periodically runs the maintenance jobs a database driver offers. Due jobs are held back while requests are
+    being served, up to max_defer seconds, and jobs run one at a time so the event loop is never blocked for long.
+    """
+
+    def __init__(
+        self,
+        get_driver: "Callable[[], drivers.DatabaseDriver | None]",
+        *,
+        tick: float = 1.0,
+        idle_delay: float = 0.5,
+        max_defer: float = 60.0,
+        history_size: int = 50,
+    ):
+        self.get_driver = get_driver
+        self.tick = tick
+        self.idle_delay = idle_delay
+        self.max_defer = max_defer
+        self.reports: deque[MaintenanceReport] = deque(maxlen=history_size)
+        self._last_activity = float("-inf")
+        self._last_runs: dict[str, float] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def notify_activity(self):
+        self._last_activity = monotonic()
+
+    def due_jobs(
+        self, driver: "drivers.DatabaseDriver", now: float
+    ) -> list[tuple[str, float]]:
+        """Finds the jobs that are due along with how many seconds overdue each is."""
+        jobs = []
+        for job, interval in driver.maintenance_jobs().items():
+            if not interval or interval <= 0:
+                continue
+
+            overdue = now - self._last_runs.setdefault(job, now) - interval
+            if overdue >= 0:
+                jobs.append((job, overdue))
+
+        return jobs
+
+    async def run_due(self, now: float | None = None) -> list[MaintenanceReport]:
+        driver = self.get_driver()
+        if driver is None or not driver.connected:
+            return []
+
+        now = monotonic() if now is None else now
+        reports = []
+        for job, overdue in self.due_jobs(driver, now):
+            if self._should_wait(now, overdue):
+                continue
+
+            reports.append(await self.run_job(driver, job))
+            self._last_runs[job] = now
+            await asyncio.sleep(0)
+
+        return reports
+
+    async def run_job(
+        self, driver: "drivers.DatabaseDriver", job: str
+    ) -> MaintenanceReport:
+        start = monotonic()
+        status = await driver.run_maintenance(job)
+        report = MaintenanceReport(job, monotonic() - start, status)
+        self.reports.append(report)
+        if report.succeeded:
+            logger.debug(f"Database maintenance {job!r} took {report.duration:.4f}s")
+        else:
+            logger.warning(f"Database maintenance {job!r} failed: {status.exception}")
+
+        return report
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+
+    def _should_wait(self, now: float, overdue: float) -> bool:
+        # Never hold a job back for longer than max_defer, even under constant traffic
+        return now - self._last_activity < self.idle_delay and overdue < self.max_defer
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.tick)
+            try:
+                await self.run_due()
+            except Exception:
+                logger.exception("Error while running database maintenance")
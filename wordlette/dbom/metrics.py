@@ -0,0 +1,189 @@
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Iterable, TypeAlias, TypeVar
+
+import wordlette.dbom.models as models
+import wordlette.dbom.prepared_queries as prepared_queries
+from wordlette.dbom.query_ast import ASTComparisonNode, ASTGroupNode
+from wordlette.dbom.statuses import DatabaseExceptionStatus, DatabaseSuccessStatus
+
+Operation: TypeAlias = str
+ModelName: TypeAlias = str
+Outcome: TypeAlias = str
+MetricKey: TypeAlias = tuple[Operation, ModelName, Outcome]
+T = TypeVar("T")
+
+# The driver whose operation is being recorded in the current context, operations that it calls are part of that
+# operation so they aren't recorded again
+_recording_driver: ContextVar[Any] = ContextVar("recording_driver", default=None)
+
+default_buckets = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass
+class LatencyHistogram:
+    buckets: tuple[float, ...] = default_buckets
+    counts: list[int] = field(init=False)
+    count: int = field(default=0, init=False)
+    total: float = field(default=0.0, init=False)
+
+    def __post_init__(self):
+        # The last slot counts everything over the largest bucket (+Inf)
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, duration: float):
+        self.counts[bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.total += duration
+
+    def cumulative(self) -> Iterable[tuple[float, int]]:
+        running = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            running += count
+            yield bound, running
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "buckets": {
+                "+Inf" if bound == float("inf") else bound: count
+                for bound, count in self.cumulative()
+            },
+        }
+
+
+class DatabaseMetrics:
+    """Latency histograms for database driver operations keyed by operation, model name, and outcome."""
+
+    def __init__(self, buckets: tuple[float, ...] = default_buckets):
+        self.buckets = buckets
+        self.enabled = True
+        self.histograms: dict[MetricKey, LatencyHistogram] = {}
+
+    def clear(self):
+        self.histograms.clear()
+
+    def get(
+        self, operation: Operation, model: ModelName, outcome: Outcome = "success"
+    ) -> LatencyHistogram | None:
+        return self.histograms.get((operation, model, outcome))
+
+    def observe(
+        self, operation: Operation, model: ModelName, outcome: Outcome, duration: float
+    ):
+        key = operation, model, outcome
+        if (histogram := self.histograms.get(key)) is None:
+            histogram = self.histograms[key] = LatencyHistogram(self.buckets)
+
+        histogram.observe(duration)
+
+    def to_dict(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "operation": operation,
+                "model": model,
+                "outcome": outcome,
+                **histogram.to_dict(),
+            }
+            for (operation, model, outcome), histogram in self.histograms.items()
+        ]
+
+    def to_prometheus(self, name: str = "wordlette_database_operation_seconds") -> str:
+        lines = [f"# TYPE {name} histogram"]
+        for (operation, model, outcome), histogram in self.histograms.items():
+            labels = f'operation="{operation}",model="{model}",outcome="{outcome}"'
+            for bound, count in histogram.cumulative():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+
+            lines.append(f"{name}_sum{{{labels}}} {histogram.total}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def instrument(
+    operation: Operation, method: Callable[..., Awaitable[T]]
+) -> Callable[..., Awaitable[T]]:
+    @wraps(method)
+    async def instrumented(driver, *args, **kwargs) -> T:
+        metrics: DatabaseMetrics = driver.metrics
+        if not metrics.enabled or _recording_driver.get() is driver:
+            return await method(driver, *args, **kwargs)
+
+        token = _recording_driver.set(driver)
+        start = perf_counter()
+        try:
+            status = await method(driver, *args, **kwargs)
+        except Exception:
+            metrics.observe(
+                operation, find_model_name(args), "exception", perf_counter() - start
+            )
+            raise
+
+        finally:
+            _recording_driver.reset(token)
+
+        metrics.observe(
+            operation,
+            find_model_name(args),
+            get_outcome(status),
+            perf_counter() - start,
+        )
+        return status
+
+    instrumented.__instrumented__ = True
+    return instrumented
+
+
+def find_model_name(args: tuple[Any, ...]) -> ModelName:
+    for arg in args:
+        match arg:
+            case type() if issubclass(arg, models.DatabaseModel):
+                return arg.__model_name__
+
+            case models.DatabaseModel():
+                return arg.__model_name__
+
+            case prepared_queries.PreparedQuery():
+                return arg.model.__model_name__
+
+            case ASTGroupNode() if arg.model is not None:
+                return arg.model.__model_name__
+
+            case ASTComparisonNode() if arg.group.model is not None:
+                return arg.group.model.__model_name__
+
+    return "unknown"
+
+
+def get_outcome(status: Any) -> Outcome:
+    match status:
+        case DatabaseSuccessStatus():
+            return "success"
+
+        case DatabaseExceptionStatus():
+            return "exception"
+
+        case _:
+            return "unknown"
@@ -1,35 +1,92 @@
-from typing import Callable, TypeVar, Any, Generator
+from typing import (
+    Callable,
+    TypeVar,
+    Any,
+    Generator,
+    Iterable,
+    Self,
+    get_origin,
+    TYPE_CHECKING,
+)
 
 from bevy import get_repository
 
 import wordlette.dbom.drivers as drivers
+from wordlette.dbom.json_values import LazyJSON, is_json_type
+from wordlette.dbom.prepared_queries import Placeholders, PreparedQuery
 from wordlette.dbom.properties import DatabaseProperty
-from wordlette.dbom.query_ast import ASTComparisonNode
-from wordlette.dbom.statuses import DatabaseStatus
+from wordlette.dbom.query_ast import ASTComparisonNode, when
+from wordlette.dbom.search import SearchResult
+from wordlette.dbom.statuses import DatabaseStatus, DatabaseSuccessStatus
 from wordlette.models import Model
 from wordlette.utils.contextual_methods import contextual_method
+from wordlette.utils.sentinel import sentinel
+
+if TYPE_CHECKING:
+    from wordlette.dbom.batches import ModelBatch
 
 T = TypeVar("T")
+_no_changes: set[str] = set()
+_Unbound, _unbound_driver = sentinel("_Unbound")
+_unbound = (_unbound_driver, None)
 
 
 class DatabaseModel(Model):
+    __slots__ = ("__changed_fields__",)
     __fields__: dict[str, DatabaseProperty]
     __models__ = set()
     __model_name__: str
+    __get_query__: PreparedQuery | None
 
     def __init_subclass__(cls, **kwargs):
         cls.__model_name__ = kwargs.pop(
             "name", getattr(cls, "__model_name__", cls.__name__)
         )
+        cls.__get_query__ = None
         super().__init_subclass__(**kwargs)
         DatabaseModel.__models__.add(cls)
 
-    def __get_auto_value__(self, field: DatabaseProperty) -> Callable[[], T]:
-        driver = get_repository().get(drivers.DatabaseDriver)
-        if factory := driver.get_value_factory(field):
-            return factory
+    def __mark_changed__(self, name: str):
+        try:
+            self.__changed_fields__.add(name)
+        except AttributeError:
+            self.__changed_fields__ = {name}
+
+    def __take_changes__(self) -> set[str]:
+        """Gets the names of the fields that have been assigned since the model was created, loaded, or last saved,
+        and starts tracking changes again from nothing."""
+        changes = getattr(self, "__changed_fields__", _no_changes)
+        self.__changed_fields__ = set()
+        return changes
+
+    def evolve(self, **changes: Any) -> Self:
+        clone = super().evolve(**changes)
+        clone.__changed_fields__ = getattr(self, "__changed_fields__", set()) | set(
+            changes
+        )
+        return clone
+
+    def __get_auto_value__(self, field: DatabaseProperty) -> Any:
+        driver, factories = vars(type(self)).get("__driver_auto_factories__", _unbound)
+        if driver is not drivers.DatabaseDriver.__connected_driver__:
+            factories = type(self).__bind_auto_value_factories__()
 
-        return super().__get_auto_value__(field)
+        return factories[field.name](self)
+
+    @classmethod
+    def __bind_auto_value_factories__(
+        cls,
+    ) -> dict[str, Callable[["DatabaseModel"], Any]]:
+        """Resolves the auto value factories of the connected driver. They're kept until another driver connects, so
+        creating models doesn't have to look up the driver in the repository."""
+        driver = drivers.DatabaseDriver.__connected_driver__
+        if driver is None:
+            factories = cls.__field_auto_factories__
+        else:
+            factories = driver.get_auto_value_factories(cls)
+
+        cls.__driver_auto_factories__ = (driver, factories)
+        return factories
 
     async def sync(self) -> "DatabaseStatus[drivers.DatabaseDriver]":
         return await type(self).update(self)
@@ -63,12 +120,78 @@ class DatabaseModel(Model):
             cls, *predicates, *cls._build_colum_predicates(columns)
         )
 
+    @classmethod
+    async def fetch_batch(
+        cls, *predicates: "ASTGroupNode | DatabaseModel | bool", **columns: Any
+    ) -> "DatabaseStatus[ModelBatch]":
+        driver = get_repository().get(drivers.DatabaseDriver)
+        return await driver.fetch_batch(
+            cls, *predicates, *cls._build_colum_predicates(columns)
+        )
+
+    @classmethod
+    def __field_needs_get__(cls, field: DatabaseProperty) -> bool:
+        # Only JSON fields can hold a LazyJSON value that has to be decoded by get
+        return is_json_type(get_origin(field.type) or field.type)
+
+    def get(self, name: str) -> Any:
+        value = super().get(name)
+        if isinstance(value, LazyJSON):
+            value = self.__fields__[name].validate(value.decode())
+            self.__set_stored_value__(name, value)
+
+        return value
+
+    @classmethod
+    async def get_by_key(cls, key: Any) -> "DatabaseStatus[DatabaseModel | None]":
+        driver = get_repository().get(drivers.DatabaseDriver)
+        if cls.__get_query__ is None:
+            pk = driver.find_primary_key(cls)
+            cls.__get_query__ = cls.prepare(
+                lambda p: getattr(cls, pk) == p.key, limit=1
+            )
+
+        status = await cls.__get_query__.fetch(key=key)
+        return (
+            DatabaseSuccessStatus(next(iter(status.value), None)) if status else status
+        )
+
+    @classmethod
+    async def get_many(
+        cls, keys: Iterable[Any]
+    ) -> "DatabaseStatus[dict[Any, DatabaseModel | None]]":
+        driver = get_repository().get(drivers.DatabaseDriver)
+        return await driver.get_many(cls, keys)
+
+    @classmethod
+    async def search(
+        cls, query: str, limit: int = 10
+    ) -> "DatabaseStatus[list[SearchResult]]":
+        driver = get_repository().get(drivers.DatabaseDriver)
+        return await driver.search(cls, query, limit)
+
     @delete.classmethod
     async def delete(
         cls, *items: "DatabaseModel"
     ) -> "DatabaseStatus[drivers.DatabaseDriver]":
         driver = get_repository().get(drivers.DatabaseDriver)
-        return await driver.delete(cls, *items)
+        return await driver.delete(*items)
+
+    @classmethod
+    def prepare(
+        cls,
+        builder: "Callable[[Placeholders], ASTGroupNode | ASTComparisonNode | tuple]",
+        limit: int | None = None,
+    ) -> PreparedQuery:
+        predicates = builder(Placeholders())
+        if not isinstance(predicates, tuple):
+            predicates = (predicates,)
+
+        ast = when(cls).And(*predicates)
+        if limit is not None:
+            ast.limit(limit)
+
+        return PreparedQuery(cls, ast)
 
     @classmethod
     async def update(
@@ -0,0 +1,66 @@
+from typing import Any, Type, TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from bevy import get_repository
+
+import wordlette.dbom.drivers as drivers
+from wordlette.dbom.query_ast import ASTGroupNode, ASTPlaceholderNode, find_placeholders
+from wordlette.dbom.statuses import DatabaseStatus
+
+if TYPE_CHECKING:
+    from wordlette.dbom.models import DatabaseModel
+
+
+class Placeholders:
+    """Creates placeholder nodes by attribute name, so p.name stands in for the name parameter."""
+
+    def __getattr__(self, name: str) -> ASTPlaceholderNode:
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return ASTPlaceholderNode(name)
+
+
+class PreparedQuery:
+    """A query AST that is compiled once per driver and then run with different parameter values."""
+
+    def __init__(self, model: "Type[DatabaseModel]", ast: ASTGroupNode):
+        self.model = model
+        self.ast = ast
+        self.placeholders = frozenset(node.name for node in find_placeholders(ast))
+        self._compiled: WeakKeyDictionary["drivers.DatabaseDriver", Any] = (
+            WeakKeyDictionary()
+        )
+
+    def bind(self, params: dict[str, Any]) -> ASTGroupNode:
+        return self.ast.bind(self.check_params(params))
+
+    def check_params(self, params: dict[str, Any]) -> dict[str, Any]:
+        if missing := self.placeholders - params.keys():
+            raise TypeError(
+                f"Missing parameters for prepared query: {', '.join(sorted(missing))}"
+            )
+
+        if unexpected := params.keys() - self.placeholders:
+            raise TypeError(
+                f"Unexpected parameters for prepared query: {', '.join(sorted(unexpected))}"
+            )
+
+        return params
+
+    def compile(self, driver: "drivers.DatabaseDriver") -> Any:
+        if driver not in self._compiled:
+            self._compiled[driver] = driver.compile_prepared(self)
+
+        return self._compiled[driver]
+
+    async def count(self, **params: Any) -> DatabaseStatus[int]:
+        driver = get_repository().get(drivers.DatabaseDriver)
+        return await driver.count_prepared(self, self.check_params(params))
+
+    async def fetch(self, **params: Any) -> "DatabaseStatus[list[DatabaseModel]]":
+        driver = get_repository().get(drivers.DatabaseDriver)
+        return await driver.fetch_prepared(self, self.check_params(params))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.model.__name__}, {self.ast!r})"
@@ -1,14 +1,50 @@
+from typing import Any, get_origin
+
+from wordlette.dbom.json_values import LazyJSON, is_json_type
 from wordlette.dbom.query_ast import ASTReferenceNode
 from wordlette.models import FieldSchema, Field
 
+JSONPath = tuple[str | int, ...]
+
 
 class DatabaseProperty(Field):
+    @property
+    def indexed_paths(self) -> tuple[JSONPath, ...]:
+        return getattr(self._schema, "indexed_paths", ())
+
+    @property
+    def searchable(self) -> bool:
+        return getattr(self._schema, "searchable", False)
+
+    @property
+    def validators(self):
+        # Only JSON fields can be given a LazyJSON value, so they're the only fields that need the extra check
+        if is_json_type(get_origin(self.type) or self.type):
+            return (self.validate,)
+
+        return super().validators
+
+    def validate(self, value: Any) -> Any:
+        # JSON loaded from the database is validated when it is decoded on first access
+        if isinstance(value, LazyJSON):
+            return value
+
+        return super().validate(value)
+
     def __get__(self, instance, owner):
         if instance is None:
             return ASTReferenceNode(self, owner)
 
         return super().__get__(instance, owner)
 
+    def __set__(self, instance, value: Any):
+        super().__set__(instance, value)
+        instance.__mark_changed__(self.name)
+
 
 class Property(FieldSchema, field_type=DatabaseProperty):
-    pass
+    def __init__(
+        self, *, searchable: bool = False, indexed_paths: tuple[JSONPath, ...] = ()
+    ):
+        self.indexed_paths = tuple(tuple(path) for path in indexed_paths)
+        self.searchable = searchable
@@ -1,6 +1,6 @@
 from enum import auto, Enum
 from itertools import zip_longest
-from typing import Any, Self
+from typing import Any, Generator, Self, Type
 
 import wordlette.dbom.models as models
 from wordlette.utils.apply import apply
@@ -12,7 +12,7 @@ class ResultOrdering(Enum):
 
 
 class ASTNode:
-    pass
+    __slots__ = ()
 
 
 class ASTLogicalOperatorNode(ASTNode, Enum):
@@ -35,6 +35,8 @@ class ASTGroupFlagNode(ASTNode, Enum):
 
 
 class ASTGroupNode(ASTNode):
+    __slots__ = ("items", "frozen", "max_results", "results_page", "sorting", "_model")
+
     def __init__(
         self, items: "list[ASTComparableNode | ASTLogicalOperatorNode] | None" = None
     ):
@@ -44,7 +46,8 @@ class ASTGroupNode(ASTNode):
         self.frozen = False
         self.max_results = -1
         self.results_page = 0
-        self.sorting: list[ASTReferenceNode] = []
+        self.sorting: tuple[ASTReferenceNode, ...] = ()
+        self._model = _unresolved
 
     def __iter__(self):
         self.frozen = True
@@ -70,6 +73,15 @@ class ASTGroupNode(ASTNode):
             self.items.append(logical_type)
 
         self.items.append(item)
+        self._model = _unresolved
+
+    @property
+    def model(self) -> "Type[models.DatabaseModel] | None":
+        """The first model the group references, found once and cached until an item is added."""
+        if self._model is _unresolved:
+            self._model = _find_model(self)
+
+        return self._model
 
     def limit(self, limit: int, page: int = 0) -> Self:
         self.max_results = limit
@@ -77,9 +89,23 @@ class ASTGroupNode(ASTNode):
         return self
 
     def sort(self, *on_fields: "ASTReferenceNode") -> Self:
-        self.sorting.extend(field for field in on_fields if field not in self.sorting)
+        # Reference nodes overload ==, so "in" would build comparison nodes instead of checking membership
+        sorting = {(ref.field, ref.model): ref for ref in self.sorting}
+        for ref in on_fields:
+            sorting.setdefault((ref.field, ref.model), ref)
+
+        self.sorting = tuple(sorting.values())
         return self
 
+    def bind(self, values: dict[str, Any]) -> "ASTGroupNode":
+        """Creates a copy of the group that has every placeholder replaced with the matching value."""
+        group = ASTGroupNode([_bind(item, values) for item in self.items])
+        group.max_results = self.max_results
+        group.results_page = self.results_page
+        group.sorting = self.sorting
+        group._model = self._model
+        return group
+
     def __eq__(self, other):
         if not isinstance(other, ASTGroupNode):
             return NotImplemented
@@ -93,6 +119,12 @@ class ASTGroupNode(ASTNode):
                 case (ASTLiteralNode(a), ASTLiteralNode(b)) if a == b:
                     continue
 
+                case (ASTPlaceholderNode(a), ASTPlaceholderNode(b)) if a == b:
+                    continue
+
+                case (ASTPathNode() as a, ASTPathNode() as b) if a._eq(b):
+                    continue
+
                 case (
                     ASTReferenceNode(af, am),
                     ASTReferenceNode(bf, bm),
@@ -131,13 +163,19 @@ class ASTGroupNode(ASTNode):
     def Or(self, *comparisons: "SearchGroup | ASTComparisonNode | bool"):
         return self._add_node_or_group(when(*comparisons), ASTLogicalOperatorNode.OR)
 
+    def __and__(self, other: "SearchGroup | ASTComparisonNode") -> "ASTGroupNode":
+        return self.And(other)
+
+    def __or__(self, other: "SearchGroup | ASTComparisonNode") -> "ASTGroupNode":
+        return self.Or(other)
+
     def _add_node_or_group(
         self,
         comparison: "SearchGroup | ASTComparisonNode",
         logical_type: ASTLogicalOperatorNode,
     ):
         match comparison:
-            case ASTComparisonNode() if len(comparison.group.items) > 1:
+            case ASTComparisonNode() if comparison.chained:
                 self.add(comparison.group, logical_type)
 
             case ASTGroupNode() if len(comparison.items) == 1:
@@ -150,73 +188,46 @@ class ASTGroupNode(ASTNode):
 
 
 class ASTComparableNode(ASTNode):
-    def __init__(self, group):
-        self.group = group
-
-    @staticmethod
-    def _safe_compare(func):
-        def wrapper(self, *args):
-            if self.group.frozen:
-                return False
-
-            return func(self, *args)
+    """Comparison operators build comparison nodes. A comparison that has been truth-tested is remembered on its
+    operands, so the next comparison made on one of those operands joins its group. This is how chained comparisons
+    (5 < Model.x < 10) keep both halves, model fields return a new reference node each time they're accessed so the
+    chain only lives as long as the expression."""
 
-        return wrapper
+    __slots__ = ("_chain",)
 
-    @_safe_compare
     def __eq__(self, other) -> "ASTComparisonNode":
-        self.group.add(
-            node := ASTComparisonNode(self, other, ASTOperatorNode.EQUALS, self.group)
-        )
-        return node
+        return self._compare(other, ASTOperatorNode.EQUALS)
 
-    @_safe_compare
     def __ne__(self, other) -> "ASTComparisonNode":
-        self.group.add(
-            node := ASTComparisonNode(
-                self, other, ASTOperatorNode.NOT_EQUALS, self.group
-            )
-        )
-        return node
+        return self._compare(other, ASTOperatorNode.NOT_EQUALS)
 
     def __gt__(self, other) -> "ASTComparisonNode":
-        self.group.add(
-            node := ASTComparisonNode(
-                self, other, ASTOperatorNode.GREATER_THAN, self.group
-            )
-        )
-        return node
+        return self._compare(other, ASTOperatorNode.GREATER_THAN)
 
     def __ge__(self, other) -> "ASTComparisonNode":
-        self.group.add(
-            node := ASTComparisonNode(
-                self, other, ASTOperatorNode.GREATER_THAN_OR_EQUAL, self.group
-            )
-        )
-        return node
+        return self._compare(other, ASTOperatorNode.GREATER_THAN_OR_EQUAL)
 
     def __lt__(self, other) -> "ASTComparisonNode":
-        self.group.add(
-            node := ASTComparisonNode(
-                self, other, ASTOperatorNode.LESS_THAN, self.group
-            )
-        )
-        return node
+        return self._compare(other, ASTOperatorNode.LESS_THAN)
 
     def __le__(self, other) -> "ASTComparisonNode":
-        self.group.add(
-            node := ASTComparisonNode(
-                self, other, ASTOperatorNode.LESS_THAN_OR_EQUAL, self.group
-            )
-        )
+        return self._compare(other, ASTOperatorNode.LESS_THAN_OR_EQUAL)
+
+    def _compare(self, other, operator: ASTOperatorNode) -> "ASTComparisonNode":
+        node = ASTComparisonNode(self, other, operator)
+        if (chained := getattr(self, "_chain", None)) is not None:
+            self._chain = None
+            node._group = chained.group
+            node._group.add(node)
+
         return node
 
 
 class ASTReferenceNode(ASTComparableNode):
     __match_args__ = ("field", "model")
+    __slots__ = ("_field", "_model", "_ordering")
 
     def __init__(self, field, model, ordering=ResultOrdering.ASCENDING):
-        super().__init__(ASTGroupNode())
         self._field = field
         self._model = model
         self._ordering = ordering
@@ -247,6 +258,9 @@ class ASTReferenceNode(ASTComparableNode):
     def desc(self) -> "ASTReferenceNode":
         return ASTReferenceNode(self._field, self._model, ResultOrdering.DESCENDING)
 
+    def __getitem__(self, key: str | int) -> "ASTPathNode":
+        return ASTPathNode(self, (key,))
+
     def __hash__(self):
         return hash((self._field, self._model, self._ordering))
 
@@ -257,11 +271,45 @@ class ASTReferenceNode(ASTComparableNode):
         )
 
 
+class ASTPathNode(ASTComparableNode):
+    """References a value nested inside a structured (JSON) field."""
+
+    __match_args__ = ("reference", "path")
+    __slots__ = ("_reference", "_path")
+
+    def __init__(self, reference: ASTReferenceNode, path: tuple[str | int, ...]):
+        self._reference = reference
+        self._path = path
+
+    def _eq(self, other):
+        if not isinstance(other, ASTPathNode):
+            return NotImplemented
+
+        return self.reference._eq(other.reference) and self.path == other.path
+
+    def __getitem__(self, key: str | int) -> "ASTPathNode":
+        return ASTPathNode(self._reference, (*self._path, key))
+
+    def __iter__(self):
+        yield from (self._reference, self._path)
+
+    @property
+    def path(self) -> tuple[str | int, ...]:
+        return self._path
+
+    @property
+    def reference(self) -> ASTReferenceNode:
+        return self._reference
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._reference!r}, {self._path!r})"
+
+
 class ASTLiteralNode(ASTComparableNode):
     __match_args__ = ("value",)
+    __slots__ = ("_value",)
 
     def __init__(self, value):
-        super().__init__(ASTGroupNode())
         self._value = value
 
     def _eq(self, other):
@@ -281,8 +329,35 @@ class ASTLiteralNode(ASTComparableNode):
         return f"{type(self).__name__}({self._value!r})"
 
 
+class ASTPlaceholderNode(ASTComparableNode):
+    """Stands in for a value that is only known when a prepared query is run."""
+
+    __match_args__ = ("name",)
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def _eq(self, other):
+        if not isinstance(other, ASTPlaceholderNode):
+            return NotImplemented
+
+        return self.name == other.name
+
+    def __iter__(self):
+        yield self._name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._name!r})"
+
+
 class ASTComparisonNode(ASTComparableNode):
     __match_args__ = ("left", "right", "operator")
+    __slots__ = ("_left", "_right", "_operator", "_group")
 
     def __init__(
         self,
@@ -291,14 +366,31 @@ class ASTComparisonNode(ASTComparableNode):
         operator: ASTOperatorNode,
         group=None,
     ):
-        super().__init__(group or ASTGroupNode())
         self._left = self._make_node(left)
         self._right = self._make_node(right)
         self._operator = operator
+        self._group = group
+
+    def __bool__(self):
+        # Python truth-tests the first half of a chained comparison (a < b < c) before it compares the middle operand
+        # again, so the operands remember this comparison for the second half to join
+        self._left._chain = self._right._chain = self
+        return True
 
     def __iter__(self):
         yield from (self._left, self._right, self._operator)
 
+    @property
+    def chained(self) -> bool:
+        return self._group is not None and len(self._group.items) > 1
+
+    @property
+    def group(self) -> ASTGroupNode:
+        if self._group is None:
+            self._group = ASTGroupNode([self])
+
+        return self._group
+
     @property
     def left(self):
         return self._left
@@ -325,6 +417,12 @@ class ASTComparisonNode(ASTComparableNode):
     def Or(self, *comparisons: "ASTComparisonNode | SearchGroup | bool"):
         return self.group.Or(*comparisons)
 
+    def __and__(self, other: "ASTComparisonNode | SearchGroup") -> ASTGroupNode:
+        return self.And(other)
+
+    def __or__(self, other: "ASTComparisonNode | SearchGroup") -> ASTGroupNode:
+        return self.Or(other)
+
     def _make_node(self, value):
         match value:
             case ASTComparableNode():
@@ -334,6 +432,59 @@ class ASTComparisonNode(ASTComparableNode):
                 return ASTLiteralNode(value)
 
 
+_unresolved = object()
+
+
+def _find_model(node) -> "Type[models.DatabaseModel] | None":
+    match node:
+        case ASTReferenceNode(_, model) if model is not None:
+            return model
+
+        case ASTComparisonNode(left, right, _):
+            return _find_model(left) or _find_model(right)
+
+        case ASTPathNode(reference, _):
+            return _find_model(reference)
+
+        case ASTGroupNode():
+            for item in node.items:
+                if model := _find_model(item):
+                    return model
+
+    return None
+
+
+def _bind(node, values: dict[str, Any]):
+    match node:
+        case ASTGroupNode():
+            return node.bind(values)
+
+        case ASTComparisonNode(left, right, operator):
+            return ASTComparisonNode(
+                _bind(left, values), _bind(right, values), operator
+            )
+
+        case ASTPlaceholderNode(name):
+            return ASTLiteralNode(values[name])
+
+        case _:
+            return node
+
+
+def find_placeholders(node) -> Generator[ASTPlaceholderNode, None, None]:
+    match node:
+        case ASTGroupNode():
+            for item in node.items:
+                yield from find_placeholders(item)
+
+        case ASTComparisonNode(left, right, _):
+            yield from find_placeholders(left)
+            yield from find_placeholders(right)
+
+        case ASTPlaceholderNode():
+            yield node
+
+
 def when(
     *comparisons: "ASTComparisonNode | Type[models.DatabaseModel] | bool",
 ) -> ASTGroupNode:
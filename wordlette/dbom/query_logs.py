@@ -0,0 +1,92 @@
+from dataclasses import dataclass, field
+from heapq import heappush, heappushpop
+from itertools import count
+from typing import Any, Iterable, Sequence
+
+
+@dataclass(frozen=True)
+class QueryLogEntry:
+    sql: str
+    parameter_types: tuple[str, ...]
+    duration: float
+    plan: tuple[str, ...] = ()
+
+    @property
+    def full_scan(self) -> bool:
+        return any(detail.startswith("SCAN") for detail in self.plan)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sql": self.sql,
+            "parameter_types": list(self.parameter_types),
+            "duration": self.duration,
+            "plan": list(self.plan),
+            "full_scan": self.full_scan,
+        }
+
+
+@dataclass
+class QueryLog:
+    """Keeps the slowest statements a driver has run. Parameter values are never stored, only their types, so the log
+    is safe to expose on a debug page."""
+
+    max_entries: int = 100
+    explain_threshold: float | None = None
+    statements: int = 0
+    total_duration: float = 0.0
+    _entries: list[tuple[float, int, QueryLogEntry]] = field(
+        default_factory=list, repr=False
+    )
+    _counter: count = field(default_factory=count, repr=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.statements = 0
+        self.total_duration = 0.0
+
+    def full_scans(self) -> list[QueryLogEntry]:
+        return [entry for entry in self.slowest() if entry.full_scan]
+
+    def record(
+        self,
+        sql: str,
+        parameters: Sequence[Any],
+        duration: float,
+        plan: Iterable[str] = (),
+    ) -> QueryLogEntry | None:
+        self.statements += 1
+        self.total_duration += duration
+        if self.max_entries <= 0:
+            return None
+
+        if len(self._entries) >= self.max_entries and duration <= self._entries[0][0]:
+            return None
+
+        entry = QueryLogEntry(
+            sql,
+            tuple(type(value).__name__ for value in parameters),
+            duration,
+            tuple(plan),
+        )
+        item = (duration, next(self._counter), entry)
+        if len(self._entries) < self.max_entries:
+            heappush(self._entries, item)
+
+        else:
+            heappushpop(self._entries, item)
+
+        return entry
+
+    def should_explain(self, duration: float) -> bool:
+        return self.explain_threshold is not None and duration >= self.explain_threshold
+
+    def slowest(self, limit: int | None = None) -> list[QueryLogEntry]:
+        entries = [entry for *_, entry in sorted(self._entries, reverse=True)]
+        return entries if limit is None else entries[:limit]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "statements": self.statements,
+            "total_duration": self.total_duration,
+            "slowest": [entry.to_dict() for entry in self.slowest()],
+        }
@@ -0,0 +1,22 @@
+from typing import NamedTuple, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wordlette.dbom.models import DatabaseModel
+    from wordlette.dbom.properties import DatabaseProperty
+
+
+class SearchResult(NamedTuple):
+    """A full-text search match. The score is the bm25 rank where lower values are better matches."""
+
+    item: "DatabaseModel"
+    score: float
+
+
+def find_searchable_fields(
+    model: "Type[DatabaseModel]",
+) -> "list[DatabaseProperty]":
+    return [
+        field
+        for field in model.__fields__.values()
+        if getattr(field, "searchable", False)
+    ]
@@ -6,7 +6,9 @@ from wordlette.cms.forms import Form
 class DatabaseSettingsForm(Form):
     def convert_to_dict(self) -> dict[str, Any]:
         data = {}
-        for name in self.__form_field_names__:
-            data[name] = self.get_field_value(name)
+        for html_name, name in self.__form_field_names__.items():
+            value = self.get_field_value(html_name)
+            if value is not None or self.__form_fields__[name].required:
+                data[name] = value
 
         return data
@@ -15,6 +15,13 @@ def create_factory(func_or_class: Callable[[], T]) -> Callable[[Any], T]:
     return create
 
 
+def create_constant_factory(value: T) -> Callable[[Any], T]:
+    def create(*_):
+        return value
+
+    return create
+
+
 @create_factory
 def get_unique_int():
     return uuid4().int
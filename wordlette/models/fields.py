@@ -90,6 +90,15 @@ class Field(Generic[T]):
     def name(self):
         return self._name
 
+    @property
+    def serializer(self) -> Serializer | None:
+        return self._serializer
+
+    @property
+    def validators(self) -> tuple[Validator, ...]:
+        """The validators that are applied, in order, when a value is set on the field."""
+        return tuple(self._validators)
+
     @property
     def required(self):
         return self._default is _not_set_
@@ -116,11 +125,7 @@ class Field(Generic[T]):
         instance.set(self.name, value)
 
     def __set_name__(self, owner: Type[ModelType], name: str):
-        type_hint = get_origin(self.type) or self.type
-        matching_validators = (
-            v for t, v in owner.__type_validators__.items() if issubclass(type_hint, t)
-        )
-        if validator := next(matching_validators, False):
+        if validator := find_for_type(owner.__type_validators__, self.type):
             self.add_validator(validator)
 
     def __repr__(self):
@@ -132,6 +137,22 @@ class Field(Generic[T]):
         )
 
 
+def find_for_type(registry: dict[Type, T], type_hint: Any) -> T | None:
+    """Finds the registry entry for the most specific class in the type hint's MRO, falling back to the first entry
+    that the type is a subclass of, so abstract base classes can still be registered."""
+    type_hint = get_origin(type_hint) or type_hint
+    if not isinstance(type_hint, type):
+        return None
+
+    for base in type_hint.__mro__:
+        if base in registry:
+            return registry[base]
+
+    return next(
+        (value for key, value in registry.items() if issubclass(type_hint, key)), None
+    )
+
+
 class FieldSchema(AbstractFieldSchema, field_type=Field):
     def create_field(
         self, name: str, type_: Type[T], default: T | _NotSet_ = _not_set_
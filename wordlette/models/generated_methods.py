@@ -0,0 +1,404 @@
+from typing import Any, Callable, Type, TypeVar, get_origin, TYPE_CHECKING
+
+from wordlette.models import serializers
+from wordlette.models.auto import Auto
+from wordlette.models.fields import Field, _not_set_
+from wordlette.utils.sentinel import sentinel
+
+if TYPE_CHECKING:
+    from wordlette.models.models import Model
+
+F = TypeVar("F", bound=Callable)
+
+generated_methods = (
+    "__init__",
+    "to_dict",
+    "__eq__",
+    "to_json",
+    "__pack__",
+    "__restore__",
+    "__restore_values__",
+    "__clone__",
+)
+generated_classmethods = {"__restore__", "__restore_values__"}
+
+
+_Missing_, _missing_ = sentinel("_Missing_")
+
+# Encoders that are simple enough to be written directly into the generated to_json
+_inline_json_encoders = {
+    serializers.encode_int: "('null' if {value} is None else _int_repr({value}))",
+    serializers.encode_str: "('null' if {value} is None else _encode_basestring({value}))",
+    serializers.encode_iso_format: (
+        "('null' if {value} is None else '\"' + {value}.isoformat() + '\"')"
+    ),
+}
+
+
+def generated_per_class(func: F) -> F:
+    """Marks a generic model method that ModelMCS replaces with a method generated for each model class."""
+    func.__model_generated__ = True
+    return func
+
+
+def generate_methods(cls: "Type[Model]"):
+    """Generates specialized methods for a model class, in the style of dataclasses. Methods that a class, or one of
+    its bases, defines itself are left alone."""
+    builders = {
+        "__init__": _build_init,
+        "to_dict": _build_to_dict,
+        "__eq__": _build_eq,
+        "to_json": _build_to_json,
+        "__pack__": _build_pack,
+        "__restore__": _build_restore,
+        "__restore_values__": _build_restore_values,
+        "__clone__": _build_clone,
+    }
+    for name in generated_methods:
+        if not _should_generate(cls, name):
+            continue
+
+        match builders[name](cls):
+            case None:
+                # Fall back to the generic implementation
+                method = _find_generic(cls, name)
+
+            case method:
+                method.__qualname__ = f"{cls.__qualname__}.{name}"
+                method.__model_generated__ = True
+                if name in generated_classmethods:
+                    method = classmethod(method)
+
+        setattr(cls, name, method)
+
+
+def _should_generate(cls: Type, name: str) -> bool:
+    if name in vars(cls):
+        return False
+
+    owner = next((base for base in cls.__mro__ if name in vars(base)), None)
+    return owner is not None and _is_generated(vars(owner)[name])
+
+
+def _is_generated(method: Any) -> bool:
+    return getattr(getattr(method, "__func__", method), "__model_generated__", False)
+
+
+def _find_generic(cls: Type, name: str) -> Any:
+    from wordlette.models.models import Model
+
+    return vars(Model)[name]
+
+
+def _build_init(cls: "Type[Model]") -> Callable:
+    self_name = _self_name(cls)
+    namespace = {"__missing__": _missing_, "__auto__": Auto}
+    params = [self_name]
+    lines = []
+    uses_set = _overrides_set(cls)
+    for index, (name, field) in enumerate(cls.__fields__.items()):
+        field_ref = f"_field_{index}"
+        namespace[field_ref] = field
+        params.append(f"{name}=__missing__")
+        if field.required:
+            lines += [
+                f"if {name} is __missing__:",
+                f"    raise TypeError({_missing_message(cls, name)!r})",
+            ]
+        elif isinstance(field.default, Auto):
+            # Auto values are placeholders the database fills in, so they're stored without being validated
+            lines += [
+                f"if {name} is __missing__:",
+                f"    {name} = {_auto_value(cls, self_name, name, field_ref, namespace)}",
+                f"if isinstance({name}, __auto__):",
+                f"    {self_name}.{cls.__slot_names__[name]} = {name}",
+                "else:",
+            ]
+        else:
+            lines.append(f"if {name} is not __missing__:")
+
+        if uses_set:
+            store = [f"{self_name}.set({name!r}, {name})"]
+        else:
+            # Validators are looked up through the field so ones added after the class is created still run
+            store = [
+                f"{name} = {field_ref}.validate({name})",
+                f"{self_name}.{cls.__slot_names__[name]} = {name}",
+            ]
+
+        indent = "" if field.required else "    "
+        lines += [
+            f"{indent}try:",
+            *(f"{indent}    {line}" for line in store),
+            f"{indent}except Exception as __error__:",
+            f"{indent}    {self_name}._add_validation_error({name!r}, __error__)",
+        ]
+
+    # Extra positional and keyword arguments are ignored, like the generic __init__
+    params += ["*__args__", "**__kwargs__"]
+    return _create_function("__init__", params, lines or ["pass"], namespace)
+
+
+def _build_to_dict(cls: "Type[Model]") -> Callable:
+    namespace = {}
+    lines = []
+    items = []
+    for index, (name, field) in enumerate(cls.__fields__.items()):
+        lines += _read_lines(cls, f"value_{index}", "self", name, index, namespace)
+        items.append(
+            f"{name!r}: {_serialize(f'value_{index}', field, index, namespace)}"
+        )
+
+    lines.append(f"return {{{', '.join(items)}}}")
+    return _create_function("to_dict", ["self"], lines, namespace)
+
+
+def _build_eq(cls: "Type[Model]") -> Callable:
+    from wordlette.models.models import Model
+
+    namespace = {"Model": Model}
+    lines = [
+        "if not isinstance(other, Model):",
+        "    raise NotImplementedError()",
+        "if type(other) is not type(self):",
+        "    if not isinstance(self, type(other)) and not isinstance(other, type(self)):",
+        "        return False",
+        "    return self.__serialize__() == other.__serialize__()",
+    ]
+    for index, (name, field) in enumerate(cls.__fields__.items()):
+        lines += _read_lines(cls, "left", "self", name, index, namespace)
+        lines += _read_lines(cls, "right", "other", name, index, namespace)
+        left = _serialize("left", field, index, namespace)
+        right = _serialize("right", field, index, namespace)
+        lines += [f"if {left} != {right}:", "    return False"]
+
+    lines.append("return True")
+    return _create_function("__eq__", ["self", "other"], lines, namespace)
+
+
+def _build_to_json(cls: "Type[Model]") -> Callable | None:
+    if not _is_generated(cls.to_dict):
+        # JSON has to match a to_dict that the class customized
+        return None
+
+    from wordlette.models.models import ValidationError
+
+    namespace = {
+        "__auto__": Auto,
+        "__not_set__": _not_set_,
+        "__validation_error__": ValidationError,
+        "_int_repr": int.__repr__,
+        "_encode_basestring": serializers.encode_basestring_ascii,
+    }
+    lines = []
+    parts = []
+    for index, (name, field) in enumerate(cls.__fields__.items()):
+        value = f"value_{index}"
+        lines += _read_lines(cls, value, "self", name, index, namespace)
+        if field.required:
+            # A required field is only unset when it failed validation, it has no value that can be encoded
+            lines += [
+                f"if {value} is __not_set__:",
+                "    raise __validation_error__(self)",
+            ]
+
+        if isinstance(field.default, Auto):
+            lines += [f"if isinstance({value}, __auto__):", f"    {value} = None"]
+
+        encoder_ref = f"_encode_{index}"
+        encoder = serializers.find_json_encoder(field)
+        if template := _inline_json_encoders.get(encoder):
+            parts.append(template.format(value=value))
+
+        elif encoder:
+            namespace[encoder_ref] = encoder
+            parts.append(f"{encoder_ref}({value})")
+        else:
+            namespace[encoder_ref] = serializers.encode_any
+            parts.append(f"{encoder_ref}({_serialize(value, field, index, namespace)})")
+
+    keys = [
+        f"{',' if index else ''}{serializers.encode_str(name)}:"
+        for index, name in enumerate(cls.__fields__)
+    ]
+    pieces = ["'{'"]
+    for key, part in zip(keys, parts):
+        pieces += [repr(key), part]
+
+    pieces.append("'}'")
+    lines.append(f"return {' + '.join(pieces)}")
+    return _create_function("to_json", ["self"], lines, namespace)
+
+
+def _build_pack(cls: "Type[Model]") -> Callable:
+    namespace = {"__auto__": Auto}
+    lines = []
+    values = []
+    for index, (name, field) in enumerate(cls.__fields__.items()):
+        value = f"value_{index}"
+        lines += _read_lines(cls, value, "self", name, index, namespace, "...")
+        # Ellipsis marks fields that aren't set, they go back to their defaults when the model is restored
+        lines += [
+            f"if isinstance({value}, __auto__):",
+            f"    {value} = ...",
+        ]
+        if encoder := serializers.find_binary_encoder(field):
+            namespace[f"_encode_{index}"] = encoder
+            lines += [
+                f"elif {value} is not ...:",
+                f"    {value} = _encode_{index}({value})",
+            ]
+
+        values.append(value)
+
+    lines.append(f"return ({''.join(f'{value}, ' for value in values)})")
+    return _create_function("__pack__", ["self"], lines, namespace)
+
+
+def _build_restore(cls: "Type[Model]") -> Callable:
+    namespace = {}
+    lines = ["self = cls.__new__(cls)"]
+    for index, (name, field) in enumerate(cls.__fields__.items()):
+        value = f"value_{index}"
+        lines.append(f"{value} = data.get({name!r}, ...)")
+        unset = f"{value} is not ..."
+        if isinstance(field.default, Auto):
+            unset += f" and {value} is not None"
+
+        lines += [
+            f"if {unset}:",
+            f"    self.{cls.__slot_names__[name]} = "
+            f"{_decode(value, serializers.find_json_decoder(field), index, namespace)}",
+        ]
+
+    lines.append("return self")
+    return _create_function("__restore__", ["cls", "data"], lines, namespace)
+
+
+def _build_restore_values(cls: "Type[Model]") -> Callable:
+    namespace = {}
+    values = [f"value_{index}" for index in range(len(cls.__fields__))]
+    lines = ["self = cls.__new__(cls)"]
+    if values:
+        lines.append(f"{''.join(f'{value}, ' for value in values)}= values")
+
+    for index, (name, field) in enumerate(cls.__fields__.items()):
+        value = values[index]
+        lines += [
+            f"if {value} is not ...:",
+            f"    self.{cls.__slot_names__[name]} = "
+            f"{_decode(value, serializers.find_binary_decoder(field), index, namespace)}",
+        ]
+
+    lines.append("return self")
+    return _create_function("__restore_values__", ["cls", "values"], lines, namespace)
+
+
+def _build_clone(cls: "Type[Model]") -> Callable:
+    lines = ["clone = type(self).__new__(type(self))"]
+    for slot in cls.__slot_names__.values():
+        lines += [
+            "try:",
+            f"    clone.{slot} = self.{slot}",
+            "except AttributeError:",
+            "    pass",
+        ]
+
+    lines.append("return clone")
+    return _create_function("__clone__", ["self"], lines, {})
+
+
+def _decode(
+    value: str,
+    decoder: Callable[[Any], Any] | None,
+    index: int,
+    namespace: dict[str, Any],
+) -> str:
+    if decoder is None:
+        return value
+
+    namespace[f"_decode_{index}"] = decoder
+    return f"_decode_{index}({value})"
+
+
+def _auto_value(
+    cls: "Type[Model]",
+    self_name: str,
+    name: str,
+    field_ref: str,
+    namespace: dict[str, Any],
+) -> str:
+    from wordlette.models.models import Model
+
+    # Models that customize __get_auto_value__, such as database models, pick their factories when a value is needed
+    if cls.__get_auto_value__ is not Model.__get_auto_value__:
+        return f"{self_name}.__get_auto_value__({field_ref})"
+
+    namespace["_auto_factories"] = cls.__field_auto_factories__
+    return f"_auto_factories[{name!r}]({self_name})"
+
+
+def _overrides_set(cls: "Type[Model]") -> bool:
+    from wordlette.models.models import Model
+
+    return cls.set is not Model.set
+
+
+def _read_lines(
+    cls: "Type[Model]",
+    target: str,
+    instance: str,
+    name: str,
+    index: int,
+    namespace: dict[str, Any],
+    unset: str | None = None,
+) -> list[str]:
+    field = cls.__fields__[name]
+    if cls.__field_needs_get__(field) and unset is None:
+        return [f"{target} = {instance}.get({name!r})"]
+
+    if unset is None:
+        unset = f"_default_{index}"
+        namespace[unset] = field.default
+
+    lines = [
+        "try:",
+        f"    {target} = {instance}.{cls.__slot_names__[name]}",
+        "except AttributeError:",
+        f"    {target} = {unset}",
+    ]
+    if cls.__field_needs_get__(field):
+        lines += [
+            f"if {target} is not {unset}:",
+            f"    {target} = {instance}.get({name!r})",
+        ]
+
+    return lines
+
+
+def _serialize(value: str, field: Field, index: int, namespace: dict[str, Any]) -> str:
+    hint = get_origin(field.type) or field.type
+    if isinstance(hint, type) and not hasattr(hint, "__serialize__"):
+        if field.serializer is None:
+            return value
+
+    field_ref = f"_field_{index}"
+    namespace[field_ref] = field
+    return f"{field_ref}.serialize({value})"
+
+
+def _self_name(cls: "Type[Model]") -> str:
+    return "__model_self__" if "self" in cls.__fields__ else "self"
+
+
+def _missing_message(cls: "Type[Model]", name: str) -> str:
+    return f"Missing required argument {name!r} for {cls.__qualname__}"
+
+
+def _create_function(
+    name: str, params: list[str], lines: list[str], namespace: dict[str, Any]
+) -> Callable:
+    body = "\n".join(f"    {line}" for line in lines)
+    source = f"def {name}({', '.join(params)}):\n{body}"
+    exec(source, namespace)
+    return namespace[name]
@@ -1,5 +1,8 @@
+import json
+import marshal
 from datetime import datetime, date, time
-from types import UnionType
+from collections.abc import MutableMapping
+from types import MappingProxyType, UnionType
 from typing import (
     Annotated,
     Any,
@@ -8,6 +11,9 @@ from typing import (
     get_origin,
     get_args,
     Generator,
+    Iterable,
+    Iterator,
+    Self,
     Union,
     Callable,
     ParamSpec,
@@ -26,7 +32,9 @@ from wordlette.models.auto_factories import (
     get_unique_string,
     create_factory,
 )
-from wordlette.models.fields import Field, FieldSchema, _not_set_
+from wordlette.models.fields import Field, FieldSchema, _not_set_, find_for_type
+from wordlette.models.generated_methods import generate_methods, generated_per_class
+from wordlette.models.serializers import encode_any
 from wordlette.models.validators import (
     datetime_validator,
     date_validator,
@@ -45,7 +53,7 @@ class ValidationError(BaseWordletteException):
     def __init__(self, model: "Model"):
         super().__init__(f"Validation errors on {type(model).__qualname__}")
         self.model = model
-        for name, error in model.__validation_errors__:
+        for name, error in model.__validation_errors__.items():
             self.add_note(f"- {name}: {error}")
 
 
@@ -59,7 +67,26 @@ class ModelMCS(type):
         fields = dict(mcs.build_fields(annotations, namespace))
         namespace["__fields__"] = dict(mcs.inherit_fields(bases)) | fields
         namespace |= fields
-        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+        slot_names = dict(mcs.inherit_slot_names(bases))
+        new_slots = {
+            name: f"__{name}_value__" for name in fields if name not in slot_names
+        }
+        namespace["__slot_names__"] = slot_names | new_slots
+        namespace["__slots__"] = (*namespace.get("__slots__", ()), *new_slots.values())
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        cls.__field_auto_factories__ = dict(mcs.build_auto_factories(cls))
+        generate_methods(cls)
+        return cls
+
+    @staticmethod
+    def build_auto_factories(
+        cls: "Type[Model]",
+    ) -> Generator[tuple[str, Callable[["Model"], Any]], None, None]:
+        for name, field in cls.__fields__.items():
+            if isinstance(field.default, Auto):
+                factory = find_for_type(cls.__auto_field_factories__, field.type)
+                yield name, factory or _missing_auto_factory(field)
 
     @staticmethod
     def build_fields(
@@ -104,12 +131,56 @@ class ModelMCS(type):
             if hasattr(base, "__fields__"):
                 yield from base.__fields__.items()
 
+    @staticmethod
+    def inherit_slot_names(
+        bases: tuple[Type, ...]
+    ) -> Generator[tuple[str, str], None, None]:
+        for base in bases:
+            if hasattr(base, "__slot_names__"):
+                yield from base.__slot_names__.items()
+
     def __and__(cls, other: "Type[Model]") -> "ModelMCS":
-        return ModelMCS(f"Joined_{cls.__name__}_{other.__name__}", (cls, other), {})
+        # Two models that both store fields in slots can't share an instance layout, so the joined model extends the
+        # first model and redeclares the fields of the second. The second model is recorded as a joined model so that
+        # subclass and instance checks against it still pass, its methods are not inherited.
+        fields = {
+            name: field
+            for name, field in other.__fields__.items()
+            if name not in cls.__fields__
+        }
+        namespace = {
+            "__annotations__": {
+                name: Annotated[field.type, field._schema]
+                for name, field in fields.items()
+            },
+            "__joined_models__": (*cls.__joined_models__, other),
+        }
+        namespace |= {
+            name: field.default
+            for name, field in fields.items()
+            if field.default is not _not_set_
+        }
+        return ModelMCS(f"Joined_{cls.__name__}_{other.__name__}", (cls,), namespace)
+
+    def __subclasscheck__(cls, subclass: Type) -> bool:
+        if super().__subclasscheck__(subclass):
+            return True
+
+        joined_models = getattr(subclass, "__joined_models__", ())
+        return any(issubclass(joined, cls) for joined in joined_models)
+
+    def __instancecheck__(cls, instance: Any) -> bool:
+        return super().__instancecheck__(instance) or cls.__subclasscheck__(
+            type(instance)
+        )
 
 
 class Model(metaclass=ModelMCS):
+    __slots__ = ("__model_errors__",)
     __fields__: dict[FieldName, Field]
+    __joined_models__: "tuple[Type[Model], ...]" = ()
+    __slot_names__: dict[FieldName, str]
+    __field_auto_factories__: "dict[FieldName, Callable[[Model], Any]]"
     __auto_field_factories__: dict[Type, Callable[P, R]] = {
         datetime: get_current_datetime,
         date: get_current_date,
@@ -142,19 +213,31 @@ class Model(metaclass=ModelMCS):
         memoryview: builtin_type_validator(memoryview),
     }
 
+    @generated_per_class
     def __init__(self, *args, **kwargs):
-        self.__field_values__: dict[FieldName, Any] = {}
-        self.__validation_errors__: dict[FieldName, Exception] = {}
-
         self._build_values(*args, **kwargs)
 
-    def __get_auto_value__(self, field: Field) -> Any:
-        type_hint = get_origin(field.type) or field.type
-        for auto_type, func in self.__auto_field_factories__.items():
-            if issubclass(type_hint, auto_type):
-                return func(self)
+    @property
+    def __field_values__(self) -> "MutableMapping[FieldName, Any]":
+        """The values that have been set on the model, keyed by field name. Writes go straight to the field slots
+        without validation."""
+        return _FieldValues(self)
 
-        raise TypeError(f"Cannot create auto value for {field.type!r}")
+    @property
+    def __validation_errors__(self) -> MappingProxyType[FieldName, Exception]:
+        return MappingProxyType(getattr(self, "__model_errors__", _no_errors))
+
+    @classmethod
+    def __field_needs_get__(cls, field: Field) -> bool:
+        """Whether generated methods have to read the field through get rather than directly from its slot."""
+        return next(base for base in cls.__mro__ if "get" in vars(base)) is not Model
+
+    def __set_stored_value__(self, name: FieldName, value: Any):
+        """Stores a value for a field without validating it."""
+        setattr(self, self.__slot_names__[name], value)
+
+    def __get_auto_value__(self, field: Field) -> Any:
+        return self.__field_auto_factories__[field.name](self)
 
     @classmethod
     def __validate__(cls, value: Any):
@@ -168,6 +251,7 @@ class Model(metaclass=ModelMCS):
     def __serialize__(self) -> dict[FieldName, Any]:
         return self.to_dict()
 
+    @generated_per_class
     def __eq__(self, other):
         if not isinstance(other, Model):
             raise NotImplementedError()
@@ -181,15 +265,15 @@ class Model(metaclass=ModelMCS):
         return f"<{type(self).__qualname__} {self.__serialize__()}>"
 
     def get(self, name: str) -> Any:
-        if name in self.__field_values__:
-            return self.__field_values__[name]
-
-        return self.__fields__[name].default
+        try:
+            return getattr(self, self.__slot_names__[name])
+        except AttributeError:
+            return self.__fields__[name].default
 
     def set(self, name: str, value: Any):
         field = self.__fields__[name]
         value = field.validate(value)
-        self.__field_values__[name] = value
+        setattr(self, self.__slot_names__[name], value)
 
     def set_quiet(self, name: str, value: Any) -> Exception | None:
         with SuppressWithCapture(Exception) as errors:
@@ -197,12 +281,123 @@ class Model(metaclass=ModelMCS):
 
         return errors.captured
 
+    def evolve(self, **changes: Any) -> Self:
+        """Creates a copy of the model with some of its fields changed. The copy shares the values of the unchanged
+        fields with this model, so only the changed fields are validated. Shared values are not copied, so mutable
+        values should be replaced through set or evolve rather than changed in place."""
+        clone = self.__clone__()
+        if errors := getattr(self, "__model_errors__", None):
+            clone.__model_errors__ = {
+                name: error for name, error in errors.items() if name not in changes
+            }
+
+        for name, value in changes.items():
+            try:
+                field = self.__fields__[name]
+            except KeyError:
+                raise TypeError(
+                    f"{type(self).__qualname__} has no field {name!r}"
+                ) from None
+
+            if not isinstance(value, Auto):
+                try:
+                    value = field.validate(value)
+                except Exception as error:
+                    clone._add_validation_error(name, error)
+                    continue
+
+            clone.__set_stored_value__(name, value)
+
+        return clone
+
+    def snapshot(self) -> Self:
+        """Creates a copy of the model that isn't changed when fields are later set on this model. Values are shared
+        with this model rather than copied or revalidated."""
+        clone = self.__clone__()
+        if errors := getattr(self, "__model_errors__", None):
+            clone.__model_errors__ = errors.copy()
+
+        return clone
+
+    @generated_per_class
+    def __clone__(self) -> Self:
+        """Creates a copy of the model that shares its field values, validation errors aren't copied."""
+        clone = type(self).__new__(type(self))
+        for name, value in self.__field_values__.items():
+            clone.__set_stored_value__(name, value)
+
+        return clone
+
+    @generated_per_class
     def to_dict(self) -> dict[FieldName, Any]:
         return {
             name: field.serialize(self.get(name))
             for name, field in self.__fields__.items()
         }
 
+    @generated_per_class
+    def to_json(self) -> str:
+        return encode_any(self.to_dict())
+
+    def dumps_json(self) -> bytes:
+        return self.to_json().encode()
+
+    @classmethod
+    def dumps_many_json(cls, models: "Iterable[Model]") -> bytes:
+        return f"[{','.join(model.to_json() for model in models)}]".encode()
+
+    @classmethod
+    def stream_json(cls, models: "Iterable[Model]") -> Iterator[bytes]:
+        """Encodes models as a JSON array one model at a time, so large results can be streamed in a response."""
+        separator = b"["
+        for model in models:
+            yield separator + model.to_json().encode()
+            separator = b","
+
+        yield b"]" if separator == b"," else b"[]"
+
+    @classmethod
+    def loads_json(cls, data: bytes | str) -> Self:
+        """Rebuilds a model from JSON that was created by dumps_json. The values are trusted and aren't validated."""
+        return cls.__restore__(json.loads(data))
+
+    @classmethod
+    def loads_many_json(cls, data: bytes | str) -> list[Self]:
+        restore = cls.__restore__
+        return [restore(values) for values in json.loads(data)]
+
+    def dumps_binary(self) -> bytes:
+        """Encodes the model in a compact binary format for caches and session storage. The format is tied to the
+        Python version and the model's fields, it isn't meant for long term storage or for data that isn't trusted."""
+        return marshal.dumps((tuple(self.__fields__), self.__pack__()))
+
+    @classmethod
+    def dumps_many_binary(cls, models: "Iterable[Model]") -> bytes:
+        return marshal.dumps((tuple(cls.__fields__), [m.__pack__() for m in models]))
+
+    @classmethod
+    def loads_binary(cls, data: bytes) -> Self:
+        return cls.__restore_values__(cls._unpack_binary(data))
+
+    @classmethod
+    def loads_many_binary(cls, data: bytes) -> list[Self]:
+        restore = cls.__restore_values__
+        return [restore(values) for values in cls._unpack_binary(data)]
+
+    @generated_per_class
+    def __pack__(self) -> tuple:
+        return ()
+
+    @classmethod
+    @generated_per_class
+    def __restore__(cls, data: dict[FieldName, Any]) -> Self:
+        return cls.__new__(cls)
+
+    @classmethod
+    @generated_per_class
+    def __restore_values__(cls, values: tuple) -> Self:
+        return cls.__new__(cls)
+
     @classmethod
     def raise_on_error(cls, *args, **kwargs):
         model = cls(*args, **kwargs)
@@ -211,6 +406,17 @@ class Model(metaclass=ModelMCS):
 
         return model
 
+    @classmethod
+    def _unpack_binary(cls, data: bytes) -> Any:
+        match marshal.loads(data):
+            case (tuple() as names, values) if names == tuple(cls.__fields__):
+                return values
+
+            case _:
+                raise ValueError(
+                    f"The binary data wasn't created for the fields of {cls.__qualname__}"
+                )
+
     def _build_values(self, *args, **kwargs):
         args_stack = list(reversed(args))
         for name, field in self.__fields__.items():
@@ -231,8 +437,66 @@ class Model(metaclass=ModelMCS):
             else:
                 continue
 
+            if isinstance(value, Auto):
+                self.__set_stored_value__(name, value)
+                continue
+
             if error := self.set_quiet(name, value):
-                self.__validation_errors__[name] = error
+                self._add_validation_error(name, error)
+
+    def _add_validation_error(self, name: FieldName, error: Exception):
+        # Most models never fail validation, so the errors dict is only allocated once there is an error to store
+        try:
+            self.__model_errors__[name] = error
+        except AttributeError:
+            self.__model_errors__ = {name: error}
+
+
+_no_errors: dict[FieldName, Exception] = {}
+
+
+class _FieldValues(MutableMapping):
+    __slots__ = ("_model",)
+
+    def __init__(self, model: Model):
+        self._model = model
+
+    def __getitem__(self, name: FieldName) -> Any:
+        try:
+            return getattr(self._model, self._model.__slot_names__[name])
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __setitem__(self, name: FieldName, value: Any):
+        self._model.__set_stored_value__(name, value)
+
+    def __delitem__(self, name: FieldName):
+        try:
+            delattr(self._model, self._model.__slot_names__[name])
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __iter__(self) -> Iterator[FieldName]:
+        model = self._model
+        return (
+            name
+            for name, slot in model.__slot_names__.items()
+            if hasattr(model, slot)
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def _missing_auto_factory(field: Field) -> Callable[[Model], Any]:
+    # Fields without a factory only fail when a value is actually needed, not when the model class is created
+    def create(*_):
+        raise TypeError(f"Cannot create auto value for {field.type!r}")
+
+    return create
 
 
 def is_none(value: Any) -> TypeGuard[None]:
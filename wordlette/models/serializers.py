@@ -0,0 +1,170 @@
+import json
+from datetime import date, datetime, time
+from json.encoder import encode_basestring_ascii
+from math import isfinite
+from typing import Any, Callable, Type, TypeAlias, get_origin
+
+from wordlette.models.auto import Auto
+from wordlette.models.fields import Field
+
+Encoder: TypeAlias = Callable[[Any], str]
+Decoder: TypeAlias = Callable[[Any], Any]
+
+
+def _encode_default(value: Any) -> Any:
+    match value:
+        case datetime() | date() | time():
+            return value.isoformat()
+
+        case set() | frozenset():
+            return list(value)
+
+        case Auto():
+            return None
+
+        case _ if hasattr(value, "__serialize__"):
+            return value.__serialize__()
+
+    raise TypeError(f"Cannot encode {type(value).__qualname__} as JSON")
+
+
+_encoder = json.JSONEncoder(separators=(",", ":"), default=_encode_default)
+
+
+def encode_any(value: Any) -> str:
+    return _encoder.encode(value)
+
+
+def encode_bool(value: bool | None) -> str:
+    if value is None:
+        return "null"
+
+    return "true" if value else "false"
+
+
+def encode_int(value: int | None) -> str:
+    return "null" if value is None else int.__repr__(value)
+
+
+def encode_float(value: float | None) -> str:
+    if value is None:
+        return "null"
+
+    return float.__repr__(value) if isfinite(value) else _encoder.encode(value)
+
+
+def encode_str(value: str | None) -> str:
+    return "null" if value is None else encode_basestring_ascii(value)
+
+
+def encode_iso_format(value: datetime | date | time | None) -> str:
+    return "null" if value is None else f'"{value.isoformat()}"'
+
+
+def encode_model(value: Any) -> str:
+    return "null" if value is None else value.to_json()
+
+
+def pack_iso_format(value: datetime | date | time | None) -> str | None:
+    return None if value is None else value.isoformat()
+
+
+def pack_model(value: Any) -> tuple | None:
+    return None if value is None else value.__pack__()
+
+
+def decode_iso_format(type_: Type[datetime | date | time]) -> Decoder:
+    def decode(value: str | None) -> Any:
+        return None if value is None else type_.fromisoformat(value)
+
+    return decode
+
+
+def decode_collection(type_: Type) -> Decoder:
+    def decode(value: list | None) -> Any:
+        return None if value is None else type_(value)
+
+    return decode
+
+
+def decode_model(model: Type, restore: str) -> Decoder:
+    def decode(value: Any) -> Any:
+        return None if value is None else getattr(model, restore)(value)
+
+    return decode
+
+
+def find_json_encoder(field: Field) -> Encoder | None:
+    """Finds a specialized encoder for a field, None means the serialized value is encoded by the generic encoder."""
+    from wordlette.models.models import Model
+
+    hint = get_origin(field.type) or field.type
+    if field.serializer or not isinstance(hint, type):
+        return None
+
+    if issubclass(hint, bool):
+        return encode_bool
+
+    if issubclass(hint, int):
+        return encode_int
+
+    if issubclass(hint, float):
+        return encode_float
+
+    if issubclass(hint, str):
+        return encode_str
+
+    if issubclass(hint, (datetime, date, time)):
+        return encode_iso_format
+
+    if issubclass(hint, Model):
+        return encode_model
+
+    return None
+
+
+def find_json_decoder(field: Field) -> Decoder | None:
+    return _find_decoder(field, "__restore__", (tuple, set, frozenset))
+
+
+def find_binary_encoder(field: Field) -> Callable[[Any], Any] | None:
+    """Finds the function that converts a field's value into something marshal can store, None means the value is
+    stored as it is."""
+    from wordlette.models.models import Model
+
+    hint = get_origin(field.type) or field.type
+    if not isinstance(hint, type):
+        return None
+
+    if issubclass(hint, (datetime, date, time)):
+        return pack_iso_format
+
+    if issubclass(hint, Model):
+        return pack_model
+
+    return None
+
+
+def find_binary_decoder(field: Field) -> Decoder | None:
+    return _find_decoder(field, "__restore_values__", ())
+
+
+def _find_decoder(
+    field: Field, restore: str, collections: tuple[Type, ...]
+) -> Decoder | None:
+    from wordlette.models.models import Model
+
+    hint = get_origin(field.type) or field.type
+    if not isinstance(hint, type):
+        return None
+
+    if issubclass(hint, (datetime, date, time)):
+        return decode_iso_format(hint)
+
+    if issubclass(hint, Model):
+        return decode_model(hint, restore)
+
+    if collections and issubclass(hint, collections):
+        return decode_collection(hint)
+
+    return None